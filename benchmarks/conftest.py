@@ -0,0 +1,92 @@
+"""
+Benchmarks of the result reader, run with `pytest-benchmark` (they are not collected by a
+plain `pytest` run, use `tox -e benchmarks` or pass the folder explicitly):
+
+    $ pytest benchmarks --benchmark-autosave
+    $ pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+
+The results read are synthetic results (see `alfasim_sdk.testing.synthetic_results`), written
+once per session. Their size is selected by the `ALFASIM_SDK_BENCHMARK_SIZE` environment
+variable (`small`, the default, `medium` or `large`).
+"""
+
+import dataclasses
+import os
+from pathlib import Path
+
+import pytest
+
+from alfasim_sdk.testing.synthetic_results import (
+    SyntheticResultsSpec,
+    write_synthetic_results,
+)
+
+BENCHMARK_SIZE_VARIABLE = "ALFASIM_SDK_BENCHMARK_SIZE"
+
+BENCHMARK_SPECS = {
+    "small": SyntheticResultsSpec(
+        trends=200,
+        profiles=40,
+        time_steps=2000,
+        profile_time_steps=20,
+        cells=200,
+        restarts=2,
+        restart_overlap=100,
+    ),
+    "medium": SyntheticResultsSpec(
+        trends=2000,
+        profiles=400,
+        time_steps=20000,
+        profile_time_steps=50,
+        cells=1000,
+        restarts=4,
+        restart_overlap=500,
+    ),
+    "large": SyntheticResultsSpec(
+        trends=5000,
+        profiles=2000,
+        time_steps=20000,
+        profile_time_steps=100,
+        cells=5000,
+        restarts=9,
+        restart_overlap=1000,
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def benchmark_spec() -> SyntheticResultsSpec:
+    size = os.environ.get(BENCHMARK_SIZE_VARIABLE, "small")
+    if size not in BENCHMARK_SPECS:
+        raise pytest.UsageError(
+            f"Invalid {BENCHMARK_SIZE_VARIABLE} ({size!r}),"
+            f" must be one of {', '.join(BENCHMARK_SPECS)}"
+        )
+    return BENCHMARK_SPECS[size]
+
+
+@pytest.fixture(scope="session")
+def synthetic_data_folder(
+    tmp_path_factory: pytest.TempPathFactory, benchmark_spec: SyntheticResultsSpec
+) -> Path:
+    """
+    The data folder of synthetic results, stored in resizable chunked data sets (like the
+    results of a running simulation).
+    """
+    data_folder = tmp_path_factory.mktemp("synthetic") / "case.data"
+    write_synthetic_results(data_folder / "results", benchmark_spec)
+    return data_folder
+
+
+@pytest.fixture(scope="session")
+def contiguous_synthetic_data_folder(
+    tmp_path_factory: pytest.TempPathFactory, benchmark_spec: SyntheticResultsSpec
+) -> Path:
+    """
+    The data folder of synthetic results stored in contiguous data sets (like repacked
+    results, which can be memory mapped).
+    """
+    data_folder = tmp_path_factory.mktemp("contiguous_synthetic") / "case.data"
+    spec = dataclasses.replace(benchmark_spec, contiguous=True, restarts=0)
+    write_synthetic_results(data_folder / "results", spec)
+    return data_folder
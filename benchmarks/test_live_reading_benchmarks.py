@@ -0,0 +1,46 @@
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from alfasim_sdk.testing.live_results import (
+    LiveReadingReport,
+    SWMRResultsWriter,
+    measure_live_reading,
+)
+from alfasim_sdk.testing.synthetic_results import SyntheticResultsSpec
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("poll_interval", [0.0, 0.05])
+def test_live_reading(
+    benchmark,
+    tmp_path: Path,
+    benchmark_spec: SyntheticResultsSpec,
+    poll_interval: float,
+) -> None:
+    """
+    Measure how quickly the metadata of the results being written is picked up (the
+    latencies and poll durations are in the benchmark `extra_info`).
+    """
+    spec = dataclasses.replace(
+        benchmark_spec,
+        time_steps=500,
+        profile_time_steps=10,
+        restarts=1,
+        restart_overlap=50,
+    )
+
+    def measure() -> LiveReadingReport:
+        writer = SWMRResultsWriter(
+            tmp_path / "results",
+            spec,
+            time_steps_per_write=20,
+            write_interval=0.05,
+        )
+        return measure_live_reading(writer, poll_interval=poll_interval, timeout=600)
+
+    report = benchmark.pedantic(measure, rounds=1, iterations=1)
+    benchmark.extra_info.update(report.summary())
+    assert report.metadata.trends_time_steps_boundaries == (0, 450 + 500)
@@ -0,0 +1,143 @@
+from pathlib import Path
+
+import pytest
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    concatenate_metadata,
+    read_metadata,
+    read_profiles_data,
+    read_profiles_range,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.aggregator_constants import RESULTS_FOLDER_NAME
+from alfasim_sdk.result_reader.reader import Results
+from alfasim_sdk.testing.synthetic_results import (
+    SYNTHETIC_PROPERTIES,
+    SyntheticResultsSpec,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def metadata(synthetic_data_folder: Path) -> ALFASimResultMetadata:
+    return read_metadata(synthetic_data_folder / RESULTS_FOLDER_NAME)
+
+
+def test_read_metadata(benchmark, synthetic_data_folder: Path) -> None:
+    metadata = benchmark(read_metadata, synthetic_data_folder / RESULTS_FOLDER_NAME)
+    assert len(metadata.trends) > 0
+
+
+def test_read_metadata_with_cache(benchmark, synthetic_data_folder: Path) -> None:
+    results_folder = synthetic_data_folder / RESULTS_FOLDER_NAME
+    read_metadata(results_folder, use_metadata_cache=True)
+    benchmark(read_metadata, results_folder, use_metadata_cache=True)
+
+
+def test_concatenate_metadata(benchmark, synthetic_data_folder: Path) -> None:
+    results_folder = synthetic_data_folder / RESULTS_FOLDER_NAME
+    metadata = read_metadata(results_folder)
+    profiles_middle = metadata.profile_time_steps_boundaries[1] // 2
+    trends_middle = metadata.trends_time_steps_boundaries[1] // 2
+    metadata_a = read_metadata(
+        results_folder,
+        final_profiles_time_step_index=profiles_middle,
+        final_trends_time_step_index=trends_middle,
+    )
+    metadata_b = read_metadata(
+        results_folder,
+        initial_profiles_time_step_index=profiles_middle,
+        initial_trends_time_step_index=trends_middle,
+    )
+    concatenated = benchmark(concatenate_metadata, metadata_a, metadata_b)
+    assert concatenated.time_steps_boundaries == metadata.time_steps_boundaries
+
+
+@pytest.mark.parametrize("trends_fraction", [0.01, 1.0])
+def test_read_trends_data(
+    benchmark,
+    synthetic_data_folder: Path,
+    metadata: ALFASimResultMetadata,
+    trends_fraction: float,
+) -> None:
+    trend_keys = list(metadata.trends)
+    trend_keys = trend_keys[:: max(1, round(1 / trends_fraction))]
+    trends = benchmark(
+        read_trends_data,
+        synthetic_data_folder / RESULTS_FOLDER_NAME,
+        metadata,
+        trend_keys,
+    )
+    assert len(trends) == len(trend_keys)
+
+
+def test_read_trends_data_last_time_steps(
+    benchmark, synthetic_data_folder: Path, metadata: ALFASimResultMetadata
+) -> None:
+    final = metadata.trends_time_steps_boundaries[1]
+    benchmark(
+        read_trends_data,
+        synthetic_data_folder / RESULTS_FOLDER_NAME,
+        metadata,
+        None,
+        max(0, final - 100),
+        final,
+    )
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_read_trends_data_contiguous(
+    benchmark, contiguous_synthetic_data_folder: Path, mmap: bool
+) -> None:
+    results_folder = contiguous_synthetic_data_folder / RESULTS_FOLDER_NAME
+    metadata = read_metadata(results_folder)
+    benchmark(read_trends_data, results_folder, metadata, mmap=mmap)
+
+
+def test_read_profiles_data(
+    benchmark, synthetic_data_folder: Path, metadata: ALFASimResultMetadata
+) -> None:
+    profiles = benchmark(
+        read_profiles_data,
+        synthetic_data_folder / RESULTS_FOLDER_NAME,
+        metadata,
+        list(metadata.profiles),
+        -1,
+    )
+    assert all(profile is not None for profile in profiles.values())
+
+
+def test_read_profiles_range(
+    benchmark, synthetic_data_folder: Path, metadata: ALFASimResultMetadata
+) -> None:
+    profile_keys = list(metadata.profiles)[:10]
+    benchmark(
+        read_profiles_range,
+        synthetic_data_folder / RESULTS_FOLDER_NAME,
+        metadata,
+        profile_keys,
+        None,
+        None,
+    )
+
+
+def test_results_lookups(
+    benchmark, synthetic_data_folder: Path, benchmark_spec: SyntheticResultsSpec
+) -> None:
+    results = Results(synthetic_data_folder)
+    results.metadata
+    property_names = [property_id for property_id, _, _ in SYNTHETIC_PROPERTIES]
+    names = [
+        (property_name, f"Pipe {pipe}")
+        for pipe in range(benchmark_spec.pipes)
+        for property_name in property_names
+    ]
+
+    def lookups() -> None:
+        for property_name, element_name in names:
+            results.get_positional_trend_array(property_name, element_name, (0, "m"))
+            results.get_profile_array(property_name, element_name)
+
+    benchmark(lookups)
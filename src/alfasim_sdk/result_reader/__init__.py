@@ -1,4 +1,20 @@
 from .aggregator import ALFASimResultMetadata
+from .arrays import ProfileArray, TrendArray
+from .catalog import ResultsCatalog
+from .compare import compare_results
+from .export import export_trends
+from .follower import ResultsFollower
+from .multiple_runs import MultipleRunsResults
 from .reader import Results
 
-__all__ = ["ALFASimResultMetadata", "Results"]
+__all__ = [
+    "ALFASimResultMetadata",
+    "MultipleRunsResults",
+    "ProfileArray",
+    "Results",
+    "ResultsCatalog",
+    "ResultsFollower",
+    "TrendArray",
+    "compare_results",
+    "export_trends",
+]
@@ -3,17 +3,21 @@ from __future__ import annotations
 import dataclasses
 import functools
 import json
+import operator
 import os
 import re
+import threading
+from abc import ABC, abstractmethod
 from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
-from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import (
     Any,
-    DefaultDict,
     Literal,
     NamedTuple,
+    SupportsIndex,
     TypeVar,
     Union,
 )
@@ -24,12 +28,14 @@ import numpy as np
 from typing_extensions import Self, TypedDict
 
 from alfasim_sdk.result_reader.aggregator_constants import (
+    GLOBAL_SENSITIVITY_ANALYSIS_DSET_COEFFICIENTS,
     GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME,
     HISTORY_MATCHING_DETERMINISTIC_DSET_NAME,
     HISTORY_MATCHING_GROUP_NAME,
     HISTORY_MATCHING_HISTORIC_DATA_GROUP_NAME,
     HISTORY_MATCHING_PROBABILISTIC_DSET_NAME,
     META_GROUP_NAME,
+    METADATA_CACHE_FILE_NAME,
     PROFILES_GROUP_NAME,
     PROFILES_STATISTICS_DSET_NAME_SUFFIX,
     RESULT_FILE_LOCKING_MODE,
@@ -42,6 +48,14 @@ from alfasim_sdk.result_reader.aggregator_constants import (
     UNCERTAINTY_PROPAGATION_GROUP_META_ATTR_NAME,
     UNCERTAINTY_PROPAGATION_GROUP_NAME,
 )
+from alfasim_sdk.result_reader.instrumentation import (
+    FILES_OPENED,
+    _count,
+    _instrumented,
+    _parse_json,
+    _read_dataset,
+    _timed,
+)
 
 OutputKeyType = str
 """\
@@ -337,7 +351,7 @@ def read_results_file(
         if not result_file:
             return None
 
-        loaded_metadata = json.loads(
+        loaded_metadata = _parse_json(
             result_file[META_GROUP_NAME].attrs[meta_data_attrs]
         )
         return metadata_class(items=map_data(loaded_metadata))
@@ -455,7 +469,7 @@ class HistoryMatchingMetadata:
             if not result_file:
                 return None
 
-            loaded_metadata = json.loads(
+            loaded_metadata = _parse_json(
                 result_file[META_GROUP_NAME].attrs[HISTORY_MATCHING_GROUP_NAME]
             )
             assert len(loaded_metadata) > 0
@@ -687,6 +701,32 @@ def open_result_files(result_directory: Path) -> Iterator[dict[int, h5py.File]]:
     Return a dict with the result files.
 
     Note that once the container dict is collected the files originally returned are closed.
+    When a pool is active for `result_directory` (see `keep_result_files_open`) the pooled
+    files are returned instead and they are kept open.
+    """
+    pool = _get_active_result_files_pool(result_directory)
+    if pool is not None:
+        with pool.get_result_files() as pooled_result_files:
+            yield pooled_result_files
+        return
+
+    result_files_sorted_dict = {
+        base_ts: _open_result_file(filename)
+        for base_ts, filename in _list_result_files(result_directory).items()
+    }
+
+    try:
+        yield result_files_sorted_dict
+    finally:
+        for f in result_files_sorted_dict.values():
+            f.close()
+
+
+def _list_result_files(result_directory: Path) -> dict[int, Path]:
+    """
+    :return:
+        A dict mapping the base time step to the path of the result files
+        that are ready to be read (sorted by the base time step).
     """
     # When a new result file is created its metadata contents are not complete, and the file
     # has not been put into SWMR mode yet (SWMR mode does not allow new groups, attributes,
@@ -715,17 +755,240 @@ def open_result_files(result_directory: Path) -> Iterator[dict[int, h5py.File]]:
 
     prefix_len = len(RESULT_FILE_PREFIX)
     result_files.difference_update(files_under_creation)  # Ignore incomplete files.
-    result_files_sorted = (
-        (int(filename.name[prefix_len:]), _open_result_file(filename))
-        for filename in result_files
+    return dict(
+        sorted(
+            ((int(filename.name[prefix_len:]), filename) for filename in result_files),
+            key=lambda x: x[0],
+        )
     )
-    result_files_sorted_dict = dict(sorted(result_files_sorted, key=lambda x: x[0]))
+
+
+@dataclasses.dataclass
+class _PooledResultFile:
+    """
+    :ivar file:
+        The open result file.
+
+    :ivar stat_identity:
+        The `(st_dev, st_ino)` of the file when it was opened, used to detect the file
+        was replaced (a new simulation run, with a new `time_set_uuid`).
+
+    :ivar stat_contents:
+        The `(st_size, st_mtime_ns)` of the file when it was opened, used to detect
+        a finished (not SWMR) file was rewritten.
+
+    :ivar time_set_uuid:
+        The `time_set_uuid` of the file when it was opened.
+
+    :ivar being_written:
+        If the writer is still appending data to the file.
+
+    :ivar growing_datasets:
+        The data sets that can be extended (refreshed while the file is being written).
+
+    :ivar users:
+        The number of `open_result_files` contexts (from any thread) using the file.
+
+    :ivar released:
+        If the file was removed from the pool while in use, it is closed once the last
+        user is done with it.
+    """
+
+    file: h5py.File
+    stat_identity: tuple[int, int]
+    stat_contents: tuple[int, int]
+    time_set_uuid: str
+    being_written: bool
+    growing_datasets: list[h5py.Dataset] = dataclasses.field(default_factory=list)
+    users: int = 0
+    released: bool = False
+
+
+class ResultFilesPool:
+    """
+    Keeps the result files from a result directory open across reads.
+
+    Do not create this directly, use `keep_result_files_open` to activate a pool for
+    a directory: while active every reader in this module reuses the pooled handles
+    instead of opening (and closing) all the result files on every call.
+
+    Every time the files are requested the directory is checked (without opening any
+    file already in the pool):
+
+    - files that finished being created (the `.creating` marker is gone) are opened;
+    - files being (re)created (the `.creating` marker is present) or removed are closed;
+    - files replaced on disk, and so with a different `time_set_uuid`, are reopened.
+
+    Files still being written (opened in SWMR mode) are not reopened, their extendable data
+    sets are refreshed on every request so the data appended since is visible.
+
+    The files are reference counted: a file closed or replaced while other threads are
+    reading it (through `get_result_files`) is only closed once they are done with it.
+    """
+
+    def __init__(self, result_directory: Path) -> None:
+        self._result_directory = result_directory
+        self._pooled_files: dict[int, _PooledResultFile] = {}
+        self._lock = threading.Lock()
+        self._references = 0
+
+    @property
+    def result_directory(self) -> Path:
+        return self._result_directory
+
+    @contextmanager
+    def get_result_files(self) -> Iterator[dict[int, h5py.File]]:
+        """
+        Return a dict with the (updated) result files, kept open while in this context (even
+        if removed or replaced on disk meanwhile). The files must not be closed by the caller.
+        """
+        with self._lock:
+            self._update()
+            in_use = dict(self._pooled_files)
+            for pooled in in_use.values():
+                pooled.users += 1
+
+        try:
+            yield {base_ts: pooled.file for base_ts, pooled in in_use.items()}
+        finally:
+            with self._lock:
+                for pooled in in_use.values():
+                    pooled.users -= 1
+                    if pooled.released and pooled.users == 0:
+                        pooled.file.close()
+
+    def get_time_set_uuids(self) -> dict[int, str]:
+        """
+        Return the `time_set_uuid` of the pooled result files (as of the last request).
+        """
+        with self._lock:
+            return {
+                base_ts: pooled.time_set_uuid
+                for base_ts, pooled in self._pooled_files.items()
+            }
+
+    def close(self) -> None:
+        """
+        Close all the pooled files.
+        """
+        with self._lock:
+            for pooled in self._pooled_files.values():
+                self._release(pooled)
+            self._pooled_files.clear()
+
+    def _release(self, pooled: _PooledResultFile) -> None:
+        """
+        Close a file removed from the pool, or defer it until it is no longer in use.
+        """
+        if pooled.users > 0:
+            pooled.released = True
+        else:
+            pooled.file.close()
+
+    def _update(self) -> None:
+        ready_files = _list_result_files(self._result_directory)
+
+        for base_ts in set(self._pooled_files) - set(ready_files):
+            self._release(self._pooled_files.pop(base_ts))
+
+        for base_ts, filename in ready_files.items():
+            stat = filename.stat()
+            stat_identity = (stat.st_dev, stat.st_ino)
+            stat_contents = (stat.st_size, stat.st_mtime_ns)
+            pooled = self._pooled_files.get(base_ts)
+            if pooled is not None and pooled.stat_identity == stat_identity:
+                if pooled.being_written:
+                    # Kept open, only the data sets being extended need a refresh (the
+                    # file stat is too coarse to tell if a flush happened). Check the
+                    # writer before refreshing so the last data written is not missed.
+                    pooled.being_written = _is_result_file_being_written(filename)
+                    pooled.stat_contents = stat_contents
+                    for dataset in pooled.growing_datasets:
+                        dataset.refresh()
+                    continue
+                if pooled.stat_contents == stat_contents:
+                    continue
+
+            if pooled is not None:
+                # Replaced (or rewritten) since it was opened.
+                self._release(pooled)
+
+            being_written = _is_result_file_being_written(filename)
+            result_file = _open_result_file(filename)
+            self._pooled_files[base_ts] = _PooledResultFile(
+                file=result_file,
+                stat_identity=stat_identity,
+                stat_contents=stat_contents,
+                time_set_uuid=result_file[META_GROUP_NAME].attrs.get(
+                    "time_set_uuid", default="<NO UUID>"
+                ),
+                being_written=being_written,
+                growing_datasets=(
+                    _list_growing_datasets(result_file)
+                    if being_written and result_file.swmr_mode
+                    else []
+                ),
+            )
+
+
+def _list_growing_datasets(result_file: h5py.File) -> list[h5py.Dataset]:
+    """
+    Return the data sets of `result_file` that can be extended (by a SWMR writer).
+    """
+    growing_datasets = []
+
+    def visit(name: str, item: object) -> None:
+        if isinstance(item, h5py.Dataset) and None in (item.maxshape or ()):
+            growing_datasets.append(item)
+
+    result_file.visititems(visit)
+    return growing_datasets
+
+
+_RESULT_FILES_POOLS: dict[str, ResultFilesPool] = {}
+_RESULT_FILES_POOLS_LOCK = threading.Lock()
+
+
+def _get_result_files_pool_key(result_directory: Path) -> str:
+    return os.path.normcase(os.path.abspath(result_directory))
+
+
+def _get_active_result_files_pool(result_directory: Path) -> ResultFilesPool | None:
+    if not _RESULT_FILES_POOLS:
+        return None
+    with _RESULT_FILES_POOLS_LOCK:
+        return _RESULT_FILES_POOLS.get(_get_result_files_pool_key(result_directory))
+
+
+@contextmanager
+def keep_result_files_open(result_directory: Path) -> Iterator[ResultFilesPool]:
+    """
+    Keep the result files from `result_directory` open while in this context, so the
+    readers in this module (`read_metadata`, `read_trends_data`, `read_profiles_data`, ...)
+    do not open and close every result file on each call.
+
+    The pool is shared and reference counted: nested contexts (or contexts from different
+    threads) for the same directory reuse the same pool, and the files are closed when the
+    last context exits.
+
+    Note that the result files are kept open, which may prevent them from being removed
+    (on Windows) while in this context.
+    """
+    key = _get_result_files_pool_key(result_directory)
+    with _RESULT_FILES_POOLS_LOCK:
+        pool = _RESULT_FILES_POOLS.get(key)
+        if pool is None:
+            pool = _RESULT_FILES_POOLS[key] = ResultFilesPool(result_directory)
+        pool._references += 1
 
     try:
-        yield result_files_sorted_dict
+        yield pool
     finally:
-        for f in result_files_sorted_dict.values():
-            f.close()
+        with _RESULT_FILES_POOLS_LOCK:
+            pool._references -= 1
+            if pool._references == 0:
+                del _RESULT_FILES_POOLS[key]
+                pool.close()
 
 
 def _open_result_file(filename: Path) -> h5py.File:
@@ -735,7 +998,7 @@ def _open_result_file(filename: Path) -> h5py.File:
 
     abs_path = str(filename.absolute())
     try:
-        return h5py_file(abs_path, "r", libver="latest", swmr=True)
+        result_file = h5py_file(abs_path, "r", libver="latest", swmr=True)
 
     except PermissionError:
         raise PermissionError(
@@ -751,9 +1014,42 @@ def _open_result_file(filename: Path) -> h5py.File:
 
     except OSError as os_error:
         swmr_message = "Unable to open file (file is not already open for SWMR writing)"
-        if str(os_error) == swmr_message:
-            return h5py_file(abs_path, "r", libver="latest", swmr=False)
-        raise
+        if str(os_error) != swmr_message:
+            raise
+        result_file = h5py_file(abs_path, "r", libver="latest", swmr=False)
+
+    _count(FILES_OPENED)
+    return result_file
+
+
+_HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+_HDF5_WRITE_ACCESS_FLAGS = 0b101  # "write access" and "SWMR write access".
+
+
+def _is_result_file_being_written(filename: Path) -> bool:
+    """
+    Check if a writer (a running simulation) has the given result file open.
+
+    Note that readers can open a finished file in SWMR mode too, so the file is checked
+    directly: the HDF5 superblock (version 2 or later) has file consistency flags, that
+    are set while a writer has the file open.
+    """
+    with open(filename, "rb") as f:
+        # The superblock is at the start of the file or after a user block
+        # (which sizes are 512 times powers of 2).
+        offset = 0
+        while True:
+            f.seek(offset)
+            header = f.read(12)
+            if len(header) < 12:
+                return False
+            if header[:8] == _HDF5_SIGNATURE:
+                superblock_version = header[8]
+                consistency_flags = header[11]
+                return superblock_version >= 2 and bool(
+                    consistency_flags & _HDF5_WRITE_ACCESS_FLAGS
+                )
+            offset = max(512, offset * 2)
 
 
 def _get_number_of_base_time_steps_from_time_set_info(
@@ -767,6 +1063,364 @@ def _get_number_of_base_time_steps_from_time_set_info(
     return len(set(expected_number_of_base_ts))
 
 
+class _ResultFilesMetadataReader:
+    """
+    Reads the metadata stored in each result file (used by `read_metadata`).
+    """
+
+    def __init__(self, result_files: dict[int, h5py.File]) -> None:
+        self._result_files = result_files
+
+    def prefetch(self, base_ts_list: Sequence[int]) -> None:
+        """
+        Called before the metadata of the given files is read.
+        """
+
+    def read_outputs_metadata(
+        self, base_ts: int, output_type: Literal["profiles", "trends"]
+    ) -> dict:
+        """
+        Read the metadata of all the outputs (of the given type) stored in the file.
+        """
+        return _parse_json(
+            self._result_files[base_ts][META_GROUP_NAME].attrs[output_type]
+        )
+
+    def read_application_version(self, base_ts: int) -> str | None:
+        return self._result_files[base_ts][META_GROUP_NAME].attrs.get(
+            "application_version"
+        )
+
+    def read_trends_statistic(self, base_ts: int) -> np.ndarray | None:
+        """
+        :return:
+            An array with shape `(2, number of trends)` with the minimum and maximum
+            of each trend stored in the file, `None` if there are no trend statistics.
+        """
+        trends_group = self._result_files[base_ts][TRENDS_GROUP_NAME]
+        if "trends_statistic" not in trends_group:
+            return None  # pragma: no cover
+        return _read_dataset(trends_group["trends_statistic"], np.s_[:, :])
+
+    def read_profiles_statistics(
+        self, base_ts: int, statistics_ids: Sequence[str]
+    ) -> np.ndarray:
+        """
+        :return:
+            An array with shape `(len(statistics_ids), 2)` with the global minimum and
+            maximum of each profile statistics data set (`NaN` when not available).
+        """
+        profiles_group = self._result_files[base_ts][PROFILES_GROUP_NAME]
+        result = np.full((len(statistics_ids), 2), np.nan)
+        for i, statistics_id in enumerate(statistics_ids):
+            attrs = profiles_group[statistics_id].attrs
+            if "global_min" in attrs:
+                result[i] = attrs["global_min"], attrs["global_max"]
+        return result
+
+    def save(self) -> None:
+        """
+        Called once the metadata has been read.
+        """
+
+
+class _CachedResultFilesMetadataReader(_ResultFilesMetadataReader):
+    """
+    A `_ResultFilesMetadataReader` backed by a cache file (see `METADATA_CACHE_FILE_NAME`),
+    the metadata not found in the cache is read by `reader`.
+
+    The cache entry of each result file is keyed by the file `time_set_uuid`, size and
+    modification time. Files still being written are never cached.
+    """
+
+    _ENTRY_NAMES = ("profiles", "trends", "application_version", "trends_statistic")
+
+    def __init__(
+        self,
+        result_directory: Path,
+        result_files: dict[int, h5py.File],
+        reader: _ResultFilesMetadataReader,
+    ) -> None:
+        super().__init__(result_files)
+        self._reader = reader
+        self._cache_file = result_directory / METADATA_CACHE_FILE_NAME
+        cached_entries = _load_metadata_cache(self._cache_file)
+        self._entries: dict[int, dict[str, Any]] = {}
+        self._changed = False
+        for base_ts, result_file in result_files.items():
+            filename = Path(result_file.filename)
+            if _is_result_file_being_written(filename):
+                continue
+            stat = filename.stat()
+            cache_key = [
+                result_file[META_GROUP_NAME].attrs.get(
+                    "time_set_uuid", default="<NO UUID>"
+                ),
+                stat.st_size,
+                stat.st_mtime_ns,
+            ]
+            entry = cached_entries.get(str(base_ts))
+            if entry is not None and entry["cache_key"] == cache_key:
+                # Copy as the entries are shared with other readers (but the contents are
+                # never changed, only added).
+                entry = dict(entry)
+                entry["profiles_statistics"] = dict(entry["profiles_statistics"])
+            else:
+                entry = {"cache_key": cache_key, "profiles_statistics": {}}
+                self._changed = True
+            self._entries[base_ts] = entry
+        if cached_entries.keys() != {str(base_ts) for base_ts in self._entries}:
+            self._changed = True
+
+    def prefetch(self, base_ts_list: Sequence[int]) -> None:
+        self._reader.prefetch(
+            [
+                base_ts
+                for base_ts in base_ts_list
+                if base_ts not in self._entries
+                or any(name not in self._entries[base_ts] for name in self._ENTRY_NAMES)
+            ]
+        )
+
+    def read_outputs_metadata(
+        self, base_ts: int, output_type: Literal["profiles", "trends"]
+    ) -> dict:
+        return self._get_or_read(
+            base_ts,
+            output_type,
+            lambda: self._reader.read_outputs_metadata(base_ts, output_type),
+        )
+
+    def read_application_version(self, base_ts: int) -> str | None:
+        return self._get_or_read(
+            base_ts,
+            "application_version",
+            lambda: self._reader.read_application_version(base_ts),
+        )
+
+    def read_trends_statistic(self, base_ts: int) -> np.ndarray | None:
+        trends_statistic = self._get_or_read(
+            base_ts,
+            "trends_statistic",
+            lambda: _optional_array_to_list(
+                self._reader.read_trends_statistic(base_ts)
+            ),
+        )
+        if trends_statistic is None:
+            return None  # pragma: no cover
+        return np.array(trends_statistic, dtype=np.float64).reshape(2, -1)
+
+    def read_profiles_statistics(
+        self, base_ts: int, statistics_ids: Sequence[str]
+    ) -> np.ndarray:
+        entry = self._entries.get(base_ts)
+        if entry is None:
+            return self._reader.read_profiles_statistics(base_ts, statistics_ids)
+
+        cached_statistics = entry["profiles_statistics"]
+        missing_ids = [i for i in statistics_ids if i not in cached_statistics]
+        if missing_ids:
+            missing_statistics = self._reader.read_profiles_statistics(
+                base_ts, missing_ids
+            )
+            cached_statistics.update(zip(missing_ids, missing_statistics.tolist()))
+            self._changed = True
+        return np.array(
+            [cached_statistics[i] for i in statistics_ids], dtype=np.float64
+        ).reshape(-1, 2)
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        _save_metadata_cache(
+            self._cache_file,
+            {str(base_ts): entry for base_ts, entry in self._entries.items()},
+        )
+        self._changed = False
+
+    def _get_or_read(self, base_ts: int, name: str, read: Callable[[], Any]) -> Any:
+        entry = self._entries.get(base_ts)
+        if entry is None:
+            return read()
+        if name not in entry:
+            entry[name] = read()
+            self._changed = True
+        return entry[name]
+
+
+class _ParallelResultFilesMetadataReader(_ResultFilesMetadataReader):
+    """
+    A `_ResultFilesMetadataReader` which reads the metadata of the prefetched files in
+    parallel, in a pool of processes (each process opens the file it reads).
+    """
+
+    def __init__(self, result_files: dict[int, h5py.File], workers: int) -> None:
+        super().__init__(result_files)
+        self._workers = workers
+        self._prefetched: dict[int, dict[str, Any]] = {}
+
+    def prefetch(self, base_ts_list: Sequence[int]) -> None:
+        filenames = [
+            Path(self._result_files[base_ts].filename) for base_ts in base_ts_list
+        ]
+        self._prefetched.update(
+            zip(
+                base_ts_list,
+                _map_in_processes(
+                    _read_result_file_metadata,
+                    [(filename,) for filename in filenames],
+                    self._workers,
+                ),
+            )
+        )
+
+    def read_outputs_metadata(
+        self, base_ts: int, output_type: Literal["profiles", "trends"]
+    ) -> dict:
+        if base_ts in self._prefetched:
+            return self._prefetched[base_ts][output_type]
+        return super().read_outputs_metadata(base_ts, output_type)
+
+    def read_application_version(self, base_ts: int) -> str | None:
+        if base_ts in self._prefetched:
+            return self._prefetched[base_ts]["application_version"]
+        return super().read_application_version(base_ts)
+
+    def read_trends_statistic(self, base_ts: int) -> np.ndarray | None:
+        if base_ts in self._prefetched:
+            return self._prefetched[base_ts]["trends_statistic"]
+        return super().read_trends_statistic(base_ts)
+
+    def read_profiles_statistics(
+        self, base_ts: int, statistics_ids: Sequence[str]
+    ) -> np.ndarray:
+        prefetched = self._prefetched.get(base_ts)
+        if prefetched is None or any(
+            i not in prefetched["profiles_statistics"] for i in statistics_ids
+        ):
+            return super().read_profiles_statistics(base_ts, statistics_ids)
+        profiles_statistics = prefetched["profiles_statistics"]
+        return np.array(
+            [profiles_statistics[i] for i in statistics_ids], dtype=np.float64
+        ).reshape(-1, 2)
+
+
+def _read_result_file_metadata(filename: Path) -> dict[str, Any]:
+    """
+    Read all the metadata used by `read_metadata` from a result file (this runs in worker
+    processes, see `_ParallelResultFilesMetadataReader`).
+    """
+    with _open_result_file(filename) as result_file:
+        reader = _ResultFilesMetadataReader({0: result_file})
+        statistics_ids = [
+            name
+            for name in result_file[PROFILES_GROUP_NAME]
+            if name.endswith(PROFILES_STATISTICS_DSET_NAME_SUFFIX)
+        ]
+        profiles_statistics = reader.read_profiles_statistics(0, statistics_ids)
+        return {
+            "profiles": reader.read_outputs_metadata(0, "profiles"),
+            "trends": reader.read_outputs_metadata(0, "trends"),
+            "application_version": reader.read_application_version(0),
+            "trends_statistic": reader.read_trends_statistic(0),
+            "profiles_statistics": dict(zip(statistics_ids, profiles_statistics)),
+        }
+
+
+def _map_in_processes(
+    function: Callable[..., Any], args_list: Sequence[tuple], workers: int
+) -> list[Any]:
+    """
+    Call `function` for each of the arguments in `args_list` using a pool of `workers`
+    processes (the calls are done in this process when there is a single worker or call).
+
+    :return:
+        The results of the calls, in the same order of `args_list`.
+    """
+    if workers <= 1 or len(args_list) <= 1:
+        return [function(*args) for args in args_list]
+    with ProcessPoolExecutor(max_workers=min(workers, len(args_list))) as executor:
+        return list(executor.map(function, *zip(*args_list)))
+
+
+def _check_workers(workers: int | None) -> int:
+    if workers is None:
+        return 1
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers ({workers}), must be positive")
+    return workers
+
+
+def _optional_array_to_list(array: np.ndarray | None) -> list | None:
+    return None if array is None else array.tolist()
+
+
+_METADATA_CACHE_VERSION = 1
+_METADATA_CACHE_MEMO_SIZE = 8
+_METADATA_CACHE_MEMO: dict[str, tuple[tuple[int, int], dict[str, dict]]] = {}
+_METADATA_CACHE_MEMO_LOCK = threading.Lock()
+
+
+def _load_metadata_cache(cache_file: Path) -> dict[str, dict]:
+    """
+    Load the entries of a metadata cache file (an empty dict if the file does not exist
+    or is not valid).
+
+    The loaded contents are kept in memory, and reused while the file is not changed.
+    """
+    try:
+        stat = cache_file.stat()
+    except OSError:
+        return {}
+
+    memo_key = str(cache_file)
+    file_key = (stat.st_size, stat.st_mtime_ns)
+    with _METADATA_CACHE_MEMO_LOCK:
+        memo = _METADATA_CACHE_MEMO.get(memo_key)
+        if memo is not None and memo[0] == file_key:
+            return memo[1]
+
+    try:
+        contents = json.loads(cache_file.read_text(encoding="utf-8"))
+        if contents["version"] != _METADATA_CACHE_VERSION:
+            return {}
+        entries = contents["entries"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+    _memoize_metadata_cache(memo_key, file_key, entries)
+    return entries
+
+
+def _save_metadata_cache(cache_file: Path, entries: dict[str, dict]) -> None:
+    """
+    Write the metadata cache file, errors are ignored as the cache is optional
+    (the result directory may not be writable for instance).
+    """
+    contents = {"version": _METADATA_CACHE_VERSION, "entries": entries}
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        temp_file.write_text(json.dumps(contents), encoding="utf-8")
+        os.replace(temp_file, cache_file)
+        stat = cache_file.stat()
+    except (OSError, TypeError, ValueError):
+        temp_file.unlink(missing_ok=True)
+        return
+
+    _memoize_metadata_cache(str(cache_file), (stat.st_size, stat.st_mtime_ns), entries)
+
+
+def _memoize_metadata_cache(
+    memo_key: str, file_key: tuple[int, int], entries: dict[str, dict]
+) -> None:
+    with _METADATA_CACHE_MEMO_LOCK:
+        _METADATA_CACHE_MEMO.pop(memo_key, None)
+        _METADATA_CACHE_MEMO[memo_key] = (file_key, entries)
+        while len(_METADATA_CACHE_MEMO) > _METADATA_CACHE_MEMO_SIZE:
+            del _METADATA_CACHE_MEMO[next(iter(_METADATA_CACHE_MEMO))]
+
+
+@_instrumented
 def read_metadata(
     result_directory: Path,
     *,
@@ -775,6 +1429,8 @@ def read_metadata(
     initial_trends_time_step_index: int | None = None,
     final_trends_time_step_index: int | None = None,
     previous_time_set_info: dict | None = None,
+    use_metadata_cache: bool = False,
+    workers: int | None = None,
 ) -> ALFASimResultMetadata:
     """
     Read all meta data for the given range.
@@ -802,7 +1458,17 @@ def read_metadata(
         The `time_set_info` from the previous metadata (when progressively reading).
         If omitted a time set truncation is not detected. This is only relevant
         when progressive reading is used (..see: `ConcatenateMetadata`).
+
+    :param use_metadata_cache:
+        If `True` the metadata read from result files which are not being written anymore
+        is kept in a cache file in the result directory (see `METADATA_CACHE_FILE_NAME`),
+        so those files are not parsed again on the next reads.
+
+    :param workers:
+        If greater than 1, the metadata of the result files is read in parallel by a pool
+        of processes with this size (the result is the same as the one read sequentially).
     """
+    workers = _check_workers(workers)
     if not result_directory.is_dir():
         return ALFASimResultMetadata.empty(
             previous_time_set_info=previous_time_set_info
@@ -813,16 +1479,28 @@ def read_metadata(
             return ALFASimResultMetadata.empty(
                 previous_time_set_info=previous_time_set_info
             )
-        else:
-            return _read_metadata(
-                result_directory,
-                initial_profiles_time_step_index=initial_profiles_time_step_index,
-                final_profiles_time_step_index=final_profiles_time_step_index,
-                initial_trends_time_step_index=initial_trends_time_step_index,
-                final_trends_time_step_index=final_trends_time_step_index,
-                previous_time_set_info=previous_time_set_info or {},
-                result_files=result_files,
+
+        metadata_reader = (
+            _ResultFilesMetadataReader(result_files)
+            if workers == 1
+            else _ParallelResultFilesMetadataReader(result_files, workers)
+        )
+        if use_metadata_cache:
+            metadata_reader = _CachedResultFilesMetadataReader(
+                result_directory, result_files, metadata_reader
             )
+        result_metadata = _read_metadata(
+            result_directory,
+            initial_profiles_time_step_index=initial_profiles_time_step_index,
+            final_profiles_time_step_index=final_profiles_time_step_index,
+            initial_trends_time_step_index=initial_trends_time_step_index,
+            final_trends_time_step_index=final_trends_time_step_index,
+            previous_time_set_info=previous_time_set_info or {},
+            result_files=result_files,
+            metadata_reader=metadata_reader,
+        )
+        metadata_reader.save()
+        return result_metadata
 
 
 def _read_metadata(
@@ -834,6 +1512,7 @@ def _read_metadata(
     final_trends_time_step_index: int | None = None,
     previous_time_set_info: dict,
     result_files: dict[int, h5py.File],
+    metadata_reader: _ResultFilesMetadataReader,
 ) -> ALFASimResultMetadata:
     """
     See `read_metadata`.
@@ -848,8 +1527,9 @@ def _read_metadata(
             f"Different number of result files: {len(result_files)} but expecting {expected_number_of_base_ts}"
         )
 
+    metadata_reader.prefetch(list(result_files))
     global_profiles_metadata, global_trends_metadata = _read_global_metadata(
-        result_files
+        result_files, metadata_reader
     )
 
     def normalize_time_step_index(
@@ -939,6 +1619,7 @@ def _read_metadata(
 
     merged_metadata = _merge_metadata_and_read_global_statistics(
         result_files,
+        metadata_reader,
         global_profiles_metadata,
         profiles_time_set_info,
         global_trends_metadata,
@@ -967,6 +1648,7 @@ def _read_metadata(
     return result_metadata
 
 
+@_timed
 def read_time_set_info(
     result_files: dict[int, h5py.File], container_group_name: str
 ) -> TimeSetInfo:
@@ -991,7 +1673,9 @@ def read_time_set_info(
         )
         size = dataset.size
         if size > 0:
-            limits[key] = TimeSetLimits(dataset[0], dataset[-1], dataset)
+            limits[key] = TimeSetLimits(
+                _read_dataset(dataset, 0), _read_dataset(dataset, -1), dataset
+            )
         time_set_info[key] = TimeSetInfoItem(
             global_start=int(start), size=int(size), uuid=time_set_uuid
         )
@@ -1050,8 +1734,10 @@ def _global_index_to_file_based_index(
         return index - time_set_start
 
 
+@_timed
 def _merge_metadata_and_read_global_statistics(
     result_files: dict[int, h5py.File],
+    metadata_reader: _ResultFilesMetadataReader,
     global_profiles_metadata: dict[int, dict],
     profiles_time_set_info: dict[int, TimeSetInfoItem],
     global_trends_metadata: dict[int, dict],
@@ -1101,60 +1787,60 @@ def _merge_metadata_and_read_global_statistics(
     }
 
     time_set_ranges: dict[SourceTimeSetKeyType, list[tuple[int, int]]] = {}
-    global_profiles_statistics: DefaultDict[int, dict[str, float]] = defaultdict(
-        lambda: {"global_max": np.nan, "global_min": np.nan}
-    )
-    trends_statistics: DefaultDict[int, dict[str, float]] = defaultdict(
-        lambda: {"max": np.nan, "min": np.nan}
-    )
 
-    def read_profiles_statistics(ts_index: int) -> None:
-        f = result_files[ts_index]
-        profile_group = f[PROFILES_GROUP_NAME]
+    # The statistics are kept in dense arrays indexed by the output ordinal (the position of
+    # the output key in the `*_ordinals` dicts) and each file is merged with a single
+    # `fmin`/`fmax` (`NaN` is ignored unless both values are `NaN`).
+    profiles_ordinals = _map_output_keys_to_ordinals(global_profiles_metadata)
+    profiles_min = np.full(len(profiles_ordinals), np.nan)
+    profiles_max = np.full(len(profiles_ordinals), np.nan)
+    trends_ordinals = _map_output_keys_to_ordinals(global_trends_metadata)
+    trends_min = np.full(len(trends_ordinals), np.nan)
+    trends_max = np.full(len(trends_ordinals), np.nan)
+
+    def has_time_steps_to_read(source_time_set_key: SourceTimeSetKeyType) -> bool:
+        start_index, stop_index = time_set_ranges[source_time_set_key][
+            -1
+        ]  # The most recent.
+        return start_index < stop_index
 
+    def read_profiles_statistics(ts_index: int) -> None:
+        ordinals = []
+        statistics_ids = []
         for output_id, meta in global_profiles_metadata[ts_index].items():
             source_time_set_key = "profile_id", profiles_to_time_set_key[output_id]
-            partial_indices = time_set_ranges[source_time_set_key]
-            start_index, stop_index = partial_indices[-1]  # The most recent.
-
-            if start_index == stop_index:
+            if not has_time_steps_to_read(source_time_set_key):
                 continue  # pragma: no cover
 
-            statistics_id = meta["data_id"] + PROFILES_STATISTICS_DSET_NAME_SUFFIX
-            statistics = global_profiles_statistics[output_id]
-            profile_statistics_dset = profile_group[statistics_id]
-            if "global_min" in profile_statistics_dset.attrs:
-                statistics["global_min"] = np.nanmin(  # type:ignore[call-overload]
-                    (
-                        statistics["global_min"],
-                        profile_statistics_dset.attrs["global_min"],
-                    )
-                )
-                statistics["global_max"] = np.nanmax(  # type:ignore[call-overload]
-                    (
-                        statistics["global_max"],
-                        profile_statistics_dset.attrs["global_max"],
-                    )
-                )
+            ordinals.append(profiles_ordinals[output_id])
+            statistics_ids.append(
+                meta["data_id"] + PROFILES_STATISTICS_DSET_NAME_SUFFIX
+            )
+
+        profiles_statistics = metadata_reader.read_profiles_statistics(
+            ts_index, statistics_ids
+        )
+        index = np.array(ordinals, dtype=np.intp)
+        profiles_min[index] = np.fmin(profiles_min[index], profiles_statistics[:, 0])
+        profiles_max[index] = np.fmax(profiles_max[index], profiles_statistics[:, 1])
 
     def read_trends_statistics(ts_index: int) -> None:
-        f = result_files[ts_index]
-        trends_group = f[TRENDS_GROUP_NAME]
-        if "trends_statistic" not in trends_group:
+        trends_statistic = metadata_reader.read_trends_statistic(ts_index)
+        if trends_statistic is None:
             return  # pragma: no cover
 
-        trends_statistic = trends_group["trends_statistic"][:, :]
+        ordinals = []
+        data_indexes = []
         for output_id, meta in global_trends_metadata[ts_index].items():
             source_time_set_key = "trend_id", trends_to_time_set_key[output_id]
-            partial_indices = time_set_ranges[source_time_set_key]
-            start_index, stop_index = partial_indices[-1]  # The most recent.
+            if has_time_steps_to_read(source_time_set_key):
+                ordinals.append(trends_ordinals[output_id])
+                data_indexes.append(meta["index"])
 
-            if start_index < stop_index:
-                statistics: dict[str, float] = trends_statistics[output_id]
-                data_index = meta["index"]
-                min_value, max_value = trends_statistic[:, data_index]
-                statistics["min"] = np.nanmin((min_value, statistics["min"]))
-                statistics["max"] = np.nanmax((max_value, statistics["max"]))
+        index = np.array(ordinals, dtype=np.intp)
+        data_index = np.array(data_indexes, dtype=np.intp)
+        trends_min[index] = np.fmin(trends_min[index], trends_statistic[0, data_index])
+        trends_max[index] = np.fmax(trends_max[index], trends_statistic[1, data_index])
 
     def update_helper(
         helper: Helper,
@@ -1235,10 +1921,8 @@ def _merge_metadata_and_read_global_statistics(
         return None
 
     app_version_info = {}
-    for index, raw_result_file in result_files.items():
-        app_version_info[index] = raw_result_file[META_GROUP_NAME].attrs.get(
-            "application_version"
-        )
+    for index in result_files:
+        app_version_info[index] = metadata_reader.read_application_version(index)
 
         skip = update_helper(
             profiles_helper,
@@ -1259,17 +1943,21 @@ def _merge_metadata_and_read_global_statistics(
             read_trends_statistics(index)
 
     # Put collected statistics into metadata.
+    profiles_min_list = profiles_min.tolist()
+    profiles_max_list = profiles_max.tolist()
     for output_key, metadata_item in profiles_helper.meta.items():
-        profile_statistics = global_profiles_statistics[output_key]
+        ordinal = profiles_ordinals[output_key]
         metadata_item["time_set_key"] = profiles_to_time_set_key[output_key]
-        metadata_item["global_max"] = profile_statistics["global_max"]
-        metadata_item["global_min"] = profile_statistics["global_min"]
+        metadata_item["global_max"] = profiles_max_list[ordinal]
+        metadata_item["global_min"] = profiles_min_list[ordinal]
 
+    trends_min_list = trends_min.tolist()
+    trends_max_list = trends_max.tolist()
     for output_key, metadata_item in trends_helper.meta.items():
-        trend_statistics = trends_statistics[output_key]
+        ordinal = trends_ordinals[output_key]
         metadata_item["time_set_key"] = trends_to_time_set_key[output_key]
-        metadata_item["max"] = float(trend_statistics["max"])
-        metadata_item["min"] = float(trend_statistics["min"])
+        metadata_item["max"] = trends_max_list[ordinal]
+        metadata_item["min"] = trends_min_list[ordinal]
 
     return _MergedMetadataWithStatistics(
         app_version_info=app_version_info,
@@ -1279,38 +1967,40 @@ def _merge_metadata_and_read_global_statistics(
     )
 
 
+def _map_output_keys_to_ordinals(
+    global_metadata: Mapping[int, Mapping[OutputKeyType, Any]],
+) -> dict[OutputKeyType, int]:
+    """
+    :return:
+        The position of each output key found in the metadata of the result files (in the
+        order they are found).
+    """
+    ordinals: dict[OutputKeyType, int] = {}
+    for output_metadata in global_metadata.values():
+        for output_key in output_metadata:
+            ordinals.setdefault(output_key, len(ordinals))
+    return ordinals
+
+
+@_timed
 def _read_global_metadata(
     result_files: dict[int, h5py.File],
+    metadata_reader: _ResultFilesMetadataReader,
 ) -> tuple[BaseTimeStepIndexToMetaList, BaseTimeStepIndexToMetaList]:
     """
     :return:
         - a dict mapping base time steps to a list of profile metadata items;
         - a dict mapping base time steps to a list of trend metadata items;
     """
-    import json
-
-    def update_global_metadata(
-        result_file: h5py.File,
-        metadata_collection: BaseTimeStepIndexToMetaList,
-        base_ts: int,
-        output_type: str,
-    ) -> None:
-        """
-        Read a metadata file and add it to a metadata collection.
-
-        :param metadata_collection:
-            This collection is changed. The keys are the "base time step index"
-            and the values are the metadata from the file (the duplicates have
-            been removed and the original index recorded).
-        """
-        meta = json.loads(result_file[META_GROUP_NAME].attrs[output_type])
-        metadata_collection[base_ts] = meta
-
     all_profiles_meta: BaseTimeStepIndexToMetaList = {}
     all_trends_meta: BaseTimeStepIndexToMetaList = {}
-    for base_ts, result_file in result_files.items():
-        update_global_metadata(result_file, all_profiles_meta, base_ts, "profiles")
-        update_global_metadata(result_file, all_trends_meta, base_ts, "trends")
+    for base_ts in result_files:
+        all_profiles_meta[base_ts] = metadata_reader.read_outputs_metadata(
+            base_ts, "profiles"
+        )
+        all_trends_meta[base_ts] = metadata_reader.read_outputs_metadata(
+            base_ts, "trends"
+        )
     return all_profiles_meta, all_trends_meta
 
 
@@ -1356,6 +2046,7 @@ def _remap_profile_time_step_index(
     )
 
 
+@_timed
 def _read_profile_arrays(
     result_directory: Path,
     result_metadata: ALFASimResultMetadata,
@@ -1394,11 +2085,12 @@ def _read_profile_arrays(
 
             data_id += data_id_suffix
             index = slicer(mapped_time_step_index)
-            profiles[profile_key] = profiles_group[data_id].__getitem__(index)
+            profiles[profile_key] = _read_dataset(profiles_group[data_id], index)
 
         return profiles
 
 
+@_instrumented
 def read_profiles_data(
     result_directory: Path,
     result_metadata: ALFASimResultMetadata,
@@ -1422,6 +2114,7 @@ def read_profiles_data(
     )
 
 
+@_instrumented
 def read_profiles_domain_data(
     result_directory: Path,
     result_metadata: ALFASimResultMetadata,
@@ -1445,6 +2138,7 @@ def read_profiles_domain_data(
     )
 
 
+@_instrumented
 def read_profiles_local_statistics(
     result_directory: Path,
     result_metadata: ALFASimResultMetadata,
@@ -1469,63 +2163,546 @@ def read_profiles_local_statistics(
     )
 
 
-def read_trends_data(
-    result_directory: Path,
-    result_metadata: ALFASimResultMetadata,
-    output_keys: list[OutputKeyType] | None = None,
-    initial_trends_time_step_index: int | None = None,
-    final_trends_time_step_index: int | None = None,
-) -> dict[OutputKeyType, np.ndarray]:
+def _map_profile_time_step_range(
+    profile_time_set_info: dict[int, TimeSetInfoItem],
+    time_set_key: tuple[int, ...],
+    start: int | None,
+    stop: int | None,
+    step: int = 1,
+) -> list[tuple[int, slice]]:
     """
-    :param result_directory:
-        The directory the provided metadata was read.
+    Maps a range of time step indexes (in the same form accepted by `_remap_profile_time_step_index`,
+    negative values count from the end) to the result files.
 
-    :param result_metadata:
-        The metadata for the results.
+    :return:
+        A list with (in time order):
+        - the result file key;
+        - the slice to apply to the data in the file (time steps stored in the file that were
+          dropped due to a restart truncation are never included);
+    """
+    if step < 1:
+        raise ValueError(f"Invalid step ({step}), must be positive")
+
+    sizes = [profile_time_set_info[base_ts].size for base_ts in time_set_key]
+    start, stop, step = slice(start, stop, step).indices(sum(sizes))
+    return [
+        (time_set_key[i], local_slice)
+        for i, local_slice in _split_range(sizes, start, stop, step)
+    ]
 
-    :param output_keys:
-        Must be trends output ids. Default to ALL trends found in `result_metadata`.
 
-    :param initial_trends_time_step_index:
-        If `None` the initial boundary of the result metadata is used.
+def _split_range(
+    sizes: Sequence[int], start: int, stop: int, step: int
+) -> list[tuple[int, slice]]:
+    """
+    Split a range over consecutive parts with the given sizes.
 
-    :param final_trends_time_step_index:
-        If `None` the final boundary of the result metadata is used.
+    :param start, stop, step:
+        The range, already normalized (non-negative start and stop, positive step).
 
     :return:
-        The data for the trends listed in `output_keys`.
+        A list with the index of each part touched by the range and the slice to apply
+        to that part.
     """
-    with open_result_files(result_directory) as result_files:
-        return _read_trends_data(
-            result_metadata,
-            output_keys,
-            initial_trends_time_step_index,
-            final_trends_time_step_index,
-            result_files=result_files,
-        )
+    part_slices = []
+    part_stop = 0
+    for i, size in enumerate(sizes):
+        part_start = part_stop
+        part_stop = part_start + size
 
+        first = start
+        if first < part_start:
+            first += -((start - part_start) // step) * step
+        last = min(stop, part_stop)
+        if first < last:
+            part_slices.append((i, slice(first - part_start, last - part_start, step)))
 
-def _read_trends_data(
+    return part_slices
+
+
+@_instrumented
+def read_profiles_range(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType],
+    start: int | None,
+    stop: int | None,
+    step: int = 1,
+    *,
+    mmap: bool = False,
+    workers: int | None = None,
+) -> dict[OutputKeyType, np.ndarray | None]:
+    """
+    Read the profiles for a range of time steps, a single read (slab) is done
+    for each result file in the range.
+
+    :param start:
+        The first time step index to read, negative values count from the end.
+        If `None` read from the first time step.
+
+    :param stop:
+        The time step index after the last to read, negative values count from the end.
+        If `None` read up to the last time step.
+
+    :param step:
+        The (positive) step between the time steps read.
+
+    :param mmap:
+        If `True` the data of result files which can be memory mapped (see `_memmap_dataset`)
+        is read through a read-only `numpy.memmap`. A range in a single file is then returned
+        as a view of the mapped file (no copy is made).
+
+    :param workers:
+        If greater than 1, the result files are read in parallel by a pool of processes
+        with this size (each process reads all the profiles in a file).
+
+    :return:
+        The data for the profiles listed in `output_keys` as an array of shape
+        `(number of time steps, number of points)`, if a profile is not found
+        `None` instead a `np.array` is mapped.
+    """
+    profiles_metadata = result_metadata.profiles
+    # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+    profiles_time_set_info = result_metadata.time_set_info[PROFILES_GROUP_NAME]  # type:ignore[index]
+
+    workers = _check_workers(workers)
+    with open_result_files(result_directory) as result_files:
+        profiles_data: dict[OutputKeyType, list[np.ndarray]] = {}
+        file_reads: dict[int, list[tuple[str, slice]]] = defaultdict(list)
+        file_reads_targets: dict[int, list[tuple[OutputKeyType, int]]] = defaultdict(
+            list
+        )
+        for profile_key in output_keys:
+            meta = profiles_metadata[profile_key]
+            file_slices = _map_profile_time_step_range(
+                profiles_time_set_info, meta["time_set_key"], start, stop, step
+            )
+
+            data_ids = [
+                meta["data_id"].get(result_key) for result_key, _ in file_slices
+            ]
+            if None in data_ids:  # pragma: no cover
+                # No data for this property in some file,
+                # restart/continue with different output options.
+                continue
+
+            data_list = profiles_data[profile_key] = []
+            for (result_key, file_slice), data_id in zip(file_slices, data_ids):
+                assert data_id is not None
+                dset = result_files[result_key][PROFILES_GROUP_NAME][data_id]
+                mapped_dset = _memmap_dataset(dset) if mmap else None
+                if mapped_dset is not None:
+                    data_list.append(mapped_dset[file_slice])
+                elif workers == 1:
+                    data_list.append(_read_dataset(dset, file_slice))
+                else:
+                    # Read later, in worker processes.
+                    file_reads[result_key].append((data_id, file_slice))
+                    file_reads_targets[result_key].append((profile_key, len(data_list)))
+                    data_list.append(np.empty((0,)))
+
+        # Each worker process reads all the data sets (not mapped) of a file.
+        files_data = _map_in_processes(
+            _read_result_file_profiles,
+            [
+                (Path(result_files[result_key].filename), reads)
+                for result_key, reads in file_reads.items()
+            ],
+            workers,
+        )
+        for result_key, file_data in zip(file_reads, files_data):
+            for (profile_key, index), data in zip(
+                file_reads_targets[result_key], file_data
+            ):
+                profiles_data[profile_key][index] = data
+
+        profiles: dict[OutputKeyType, np.ndarray | None] = {}
+        for profile_key in output_keys:
+            meta = profiles_metadata[profile_key]
+            if profile_key not in profiles_data:  # pragma: no cover
+                profiles[profile_key] = None
+                continue
+
+            data_list = profiles_data[profile_key]
+            if len(data_list) == 0:
+                profiles[profile_key] = np.empty((0, meta["size"]), dtype=np.float64)
+            elif len({data.shape[1:] for data in data_list}) != 1:
+                raise ValueError(
+                    f"The profile {profile_key} changes its size in the given range"
+                )
+            elif len(data_list) == 1:
+                profiles[profile_key] = data_list[0]
+            else:
+                profiles[profile_key] = np.concatenate(data_list)
+
+        return profiles
+
+
+def _read_result_file_profiles(
+    filename: Path, reads: list[tuple[str, slice]]
+) -> list[np.ndarray]:
+    """
+    Read the given slices of the profile data sets of a result file (this runs in
+    worker processes).
+    """
+    with _open_result_file(filename) as result_file:
+        profiles_group = result_file[PROFILES_GROUP_NAME]
+        return [
+            _read_dataset(profiles_group[data_id], file_slice)
+            for data_id, file_slice in reads
+        ]
+
+
+class ProfileTimeStep(NamedTuple):
+    """
+    A time step of a profile, yielded by `iter_profiles_range`.
+    """
+
+    time: float
+    domain: np.ndarray
+    values: np.ndarray
+
+
+_PROFILES_CHUNK_SIZE = 64
+"""\
+The default number of time steps read at once by `iter_profiles_range`.
+"""
+
+
+def iter_profiles_range(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    profile_key: OutputKeyType,
+    start: int | None = None,
+    stop: int | None = None,
+    *,
+    chunk_size: int = _PROFILES_CHUNK_SIZE,
+    prefetch: bool = False,
+) -> Iterator[ProfileTimeStep]:
+    """
+    Iterate over a range of time steps of a profile, reading `chunk_size` time steps (and their
+    time) at once. The domain is read once for each result file, the same array is yielded for
+    all time steps in the file.
+
+    Note that the `values` yielded are views of the chunk read, copy them to keep them after
+    the chunk is discarded (when the iteration moves to the next chunk).
+
+    :param start:
+        The first time step index to read, negative values count from the end.
+        If `None` read from the first time step.
+
+    :param stop:
+        The time step index after the last to read, negative values count from the end.
+        If `None` read up to the last time step.
+
+    :param chunk_size:
+        The number of time steps read at once.
+
+    :param prefetch:
+        If `True` the next chunk is read in a background thread while the current chunk
+        is consumed.
+    """
+    with open_result_files(result_directory) as result_files:
+        domain_key: tuple[int, str] | None = None
+        domain = np.empty((0,))
+        for base_ts, domain_id, time, values in _iter_profile_chunks(
+            result_files,
+            result_metadata,
+            profile_key,
+            start,
+            stop,
+            chunk_size=chunk_size,
+            prefetch=prefetch,
+        ):
+            if domain_key != (base_ts, domain_id):
+                domain_key = (base_ts, domain_id)
+                domain = _read_dataset(
+                    result_files[base_ts][META_GROUP_NAME][domain_id], ()
+                )
+            for time_step_time, time_step_values in zip(time, values):
+                yield ProfileTimeStep(float(time_step_time), domain, time_step_values)
+
+
+def _iter_profile_chunks(
+    result_files: dict[int, h5py.File],
+    result_metadata: ALFASimResultMetadata,
+    profile_key: OutputKeyType,
+    start: int | None,
+    stop: int | None,
+    *,
+    chunk_size: int,
+    prefetch: bool = False,
+) -> Iterator[tuple[int, str, np.ndarray, np.ndarray]]:
+    """
+    Read a range of time steps of a profile in chunks of (at most) `chunk_size` time steps,
+    which never span result files (the data set of the profile may change between result
+    files, see `ProfileMetaItem.data_id`).
+
+    :param prefetch:
+        If `True` the next chunk is read in a background thread while the current chunk
+        is consumed.
+
+    :return:
+        Yields for each chunk:
+        - the result file key;
+        - the domain id of the profile in the result file;
+        - the time of the time steps;
+        - the profile values, an array of shape `(number of time steps, number of points)`;
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk_size ({chunk_size})")
+
+    profile_metadata = result_metadata.profiles[profile_key]
+    # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+    profiles_time_set_info = result_metadata.time_set_info[PROFILES_GROUP_NAME]  # type:ignore[index]
+    chunks = []
+    for base_ts, file_slice in _map_profile_time_step_range(
+        profiles_time_set_info, profile_metadata["time_set_key"], start, stop
+    ):
+        data_id = profile_metadata["data_id"].get(base_ts)
+        domain_id = profile_metadata["domain_id"].get(base_ts)
+        if data_id is None or domain_id is None:  # pragma: no cover
+            raise RuntimeError(
+                f"profile_key {profile_key} has no data in result file {base_ts}"
+            )
+        for chunk_start in range(file_slice.start, file_slice.stop, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, file_slice.stop)
+            chunks.append((base_ts, data_id, domain_id, chunk_start, chunk_stop))
+
+    def read_chunk(
+        base_ts: int, data_id: str, chunk_start: int, chunk_stop: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        profiles_group = result_files[base_ts][PROFILES_GROUP_NAME]
+        return (
+            _read_dataset(
+                profiles_group[TIME_SET_DSET_NAME], slice(chunk_start, chunk_stop)
+            ),
+            _read_dataset(profiles_group[data_id], slice(chunk_start, chunk_stop)),
+        )
+
+    with ThreadPoolExecutor(max_workers=1) if prefetch else nullcontext() as executor:
+        next_read: Future | None = None
+        for i, (base_ts, data_id, domain_id, chunk_start, chunk_stop) in enumerate(
+            chunks
+        ):
+            if next_read is None:
+                time, values = read_chunk(base_ts, data_id, chunk_start, chunk_stop)
+            else:
+                time, values = next_read.result()
+            if executor is not None and i + 1 < len(chunks):
+                next_base_ts, next_data_id, _, next_start, next_stop = chunks[i + 1]
+                next_read = executor.submit(
+                    read_chunk, next_base_ts, next_data_id, next_start, next_stop
+                )
+            yield base_ts, domain_id, time, values
+
+
+@_instrumented
+def read_trends_data(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None = None,
+    initial_trends_time_step_index: int | None = None,
+    final_trends_time_step_index: int | None = None,
+    *,
+    mmap: bool = False,
+    workers: int | None = None,
+) -> dict[OutputKeyType, np.ndarray]:
+    """
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param result_metadata:
+        The metadata for the results.
+
+    :param output_keys:
+        Must be trends output ids. Default to ALL trends found in `result_metadata`.
+
+    :param initial_trends_time_step_index:
+        If `None` the initial boundary of the result metadata is used.
+
+    :param final_trends_time_step_index:
+        If `None` the final boundary of the result metadata is used.
+
+    :param mmap:
+        If `True` the data of result files which can be memory mapped (see `_memmap_dataset`)
+        is read through a read-only `numpy.memmap`. A trend read from a single file is then
+        returned as a view of the mapped file (no copy is made).
+
+    :param workers:
+        If greater than 1, the result files are read in parallel by a pool of processes
+        with this size.
+
+    :return:
+        The data for the trends listed in `output_keys`.
+    """
+    workers = _check_workers(workers)
+    with open_result_files(result_directory) as result_files:
+        return _read_trends_data(
+            result_metadata,
+            output_keys,
+            initial_trends_time_step_index,
+            final_trends_time_step_index,
+            result_files=result_files,
+            mmap=mmap,
+            workers=workers,
+        )
+
+
+def _read_trends_data(
     result_metadata: ALFASimResultMetadata,
     output_keys: list[OutputKeyType] | None = None,
     initial_trends_time_step_index: int | None = None,
     final_trends_time_step_index: int | None = None,
     *,
     result_files: dict[int, h5py.File],
+    mmap: bool = False,
+    workers: int = 1,
 ) -> dict[OutputKeyType, np.ndarray]:
     """
     See `read_trends_data`.
     """
-    trends_metadata = result_metadata.trends
-    trends_dsets = {
-        base_ts: f[TRENDS_GROUP_NAME]["trends"] for base_ts, f in result_files.items()
+    output_keys_to_read, selections = _select_trends_in_files(
+        result_metadata,
+        output_keys,
+        initial_trends_time_step_index,
+        final_trends_time_step_index,
+        result_files=result_files,
+    )
+
+    trends_sizes = dict.fromkeys(output_keys_to_read, 0)
+    file_selections: list[
+        tuple[h5py.Dataset | np.ndarray, int, int, list[OutputKeyType], list[int]]
+    ] = []
+    for base_ts, start_index, stop_index, keys_in_file, columns in selections:
+        for trend_key in keys_in_file:
+            trends_sizes[trend_key] += stop_index - start_index
+        dset = result_files[base_ts][TRENDS_GROUP_NAME]["trends"]
+        mapped_dset = _memmap_dataset(dset) if mmap else None
+        file_selections.append(
+            (
+                dset if mapped_dset is None else mapped_dset,
+                start_index,
+                stop_index,
+                keys_in_file,
+                columns,
+            )
+        )
+
+    dtype = (
+        np.result_type(*(dset.dtype for dset, *_ in file_selections))
+        if file_selections
+        else np.float64
+    )
+    result: dict[OutputKeyType, np.ndarray] = {}
+
+    # Read the data sets (not mapped) in worker processes.
+    data_read_by_workers: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    if workers > 1:
+        selections_to_read = [
+            i
+            for i, (dset, start_index, stop_index, *_) in enumerate(file_selections)
+            if start_index < stop_index and isinstance(dset, h5py.Dataset)
+        ]
+        data_read_by_workers = dict(
+            zip(
+                selections_to_read,
+                _map_in_processes(
+                    _read_result_file_trends_columns,
+                    [
+                        (
+                            Path(dset.file.filename),  # type:ignore[union-attr]
+                            start_index,
+                            stop_index,
+                            columns,
+                        )
+                        for dset, start_index, stop_index, _, columns in (
+                            file_selections[i] for i in selections_to_read
+                        )
+                    ],
+                    workers,
+                ),
+            )
+        )
+
+    # Read data from files.
+    offsets = dict.fromkeys(output_keys_to_read, 0)
+    for i, (dset, start_index, stop_index, keys_in_file, columns) in enumerate(
+        file_selections
+    ):
+        if start_index == stop_index:
+            continue
+        if isinstance(dset, np.memmap):
+            keys_to_copy = []
+            columns_to_copy = []
+            for trend_key, column in zip(keys_in_file, columns):
+                if trends_sizes[trend_key] == stop_index - start_index:
+                    # Stored only in this file, use a view of the mapped data.
+                    result[trend_key] = dset[start_index:stop_index, column]
+                else:
+                    keys_to_copy.append(trend_key)
+                    columns_to_copy.append(column)
+            if len(keys_to_copy) == 0:
+                continue
+            keys_in_file = keys_to_copy
+            columns = columns_to_copy
+
+        if i in data_read_by_workers:
+            data, data_columns = data_read_by_workers[i]
+        else:
+            data, data_columns = _read_trends_columns(
+                dset, start_index, stop_index, columns
+            )
+        for trend_key, data_column in zip(keys_in_file, data_columns):
+            if trend_key not in result:
+                result[trend_key] = np.empty((trends_sizes[trend_key],), dtype=dtype)
+            offset = offsets[trend_key]
+            offsets[trend_key] = offset + len(data)
+            result[trend_key][offset : offsets[trend_key]] = data[:, data_column]
+
+    return {
+        trend_key: result.get(trend_key, np.empty((0,), dtype=dtype))
+        for trend_key in output_keys_to_read
     }
 
+
+class _TrendsFileSelection(NamedTuple):
+    base_ts: int
+    start_index: int
+    stop_index: int
+    keys: list[OutputKeyType]
+    columns: list[int]
+
+
+def _select_trends_in_files(
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None,
+    initial_trends_time_step_index: int | None,
+    final_trends_time_step_index: int | None,
+    *,
+    result_files: Mapping[int, h5py.File] | None = None,
+) -> tuple[list[OutputKeyType], list[_TrendsFileSelection]]:
+    """
+    Check the time step range (see `read_trends_data`) and map it to the rows and columns
+    to read from each result file.
+
+    :param result_files:
+        The result files open to read, the files in the metadata that are not open (being
+        recreated or removed since the metadata was read) are skipped.
+
+    :return:
+        - the trends to read (without repetitions);
+        - the selection in each result file with some of the trends to read (in base
+          time step order);
+    """
+    trends_metadata = result_metadata.trends
+
     output_keys_to_read: Iterable[OutputKeyType]
     if output_keys is None:
         output_keys_to_read = result_metadata.trends.keys()
     else:
         output_keys_to_read = output_keys
+    output_keys_to_read = list(dict.fromkeys(output_keys_to_read))
 
     if initial_trends_time_step_index is None:
         initial_trends_time_step_index = result_metadata.time_steps_boundaries[0][1]
@@ -1550,45 +2727,506 @@ def _read_trends_data(
         )
 
     # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
-    try:
-        time_set_info = result_metadata.time_set_info[TRENDS_GROUP_NAME]  # type:ignore[index]
-    except KeyError:
-        return {
-            trend_key: np.empty((0,), dtype=np.float64)
-            for trend_key in output_keys_to_read
-        }
+    time_set_info = result_metadata.time_set_info.get(TRENDS_GROUP_NAME, {})  # type:ignore[call-overload]
+
+    # Collect the columns to read from each file, so each file is read only once.
+    selections = []
+    for base_ts, time_set_info_item in sorted(time_set_info.items()):
+        if result_files is not None and base_ts not in result_files:
+            continue
+        keys_in_file = []
+        columns = []
+        for trend_key in output_keys_to_read:
+            index = trends_metadata[trend_key]["index"].get(base_ts)
+            if index is not None:
+                keys_in_file.append(trend_key)
+                columns.append(index)
+        if len(columns) == 0:
+            continue
 
-    # Read data from files.
-    trends: dict[OutputKeyType, list[np.ndarray]] = {}
-    for trend_key in output_keys_to_read:
-        trends_entry = trends[trend_key] = []
-        meta = trends_metadata[trend_key]
+        time_set_start = time_set_info_item.global_start
+        time_set_size = time_set_info_item.size
+        start_index = _global_index_to_file_based_index(
+            initial_trends_time_step_index, time_set_start, time_set_size
+        )
+        stop_index = _global_index_to_file_based_index(
+            final_trends_time_step_index, time_set_start, time_set_size
+        )
+        selections.append(
+            _TrendsFileSelection(
+                base_ts, start_index, stop_index, keys_in_file, columns
+            )
+        )
 
-        for base_ts, dset in trends_dsets.items():
-            index = meta["index"].get(base_ts)
-            if index is not None:
-                time_set_info_item = time_set_info[base_ts]
-                time_set_start = time_set_info_item.global_start
-                time_set_size = time_set_info_item.size
-                start_index = _global_index_to_file_based_index(
-                    initial_trends_time_step_index, time_set_start, time_set_size
-                )
-                stop_index = _global_index_to_file_based_index(
-                    final_trends_time_step_index, time_set_start, time_set_size
+    return output_keys_to_read, selections
+
+
+def _read_result_file_trends_columns(
+    filename: Path, start_index: int, stop_index: int, columns: list[int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    `_read_trends_columns` for a result file (this runs in worker processes).
+    """
+    with _open_result_file(filename) as result_file:
+        return _read_trends_columns(
+            result_file[TRENDS_GROUP_NAME]["trends"], start_index, stop_index, columns
+        )
+
+
+def _memmap_dataset(dset: h5py.Dataset) -> np.memmap | None:
+    """
+    Map the data of a data set stored contiguously (not chunked and not compressed) in a
+    result file which is not being written.
+
+    Note that the results of a running simulation are stored in chunked data sets (since they
+    are resizable), so only result files that were repacked with a contiguous layout can be
+    mapped.
+
+    :return:
+        A read-only `numpy.memmap` with the data set contents, or `None` if the data set can
+        not be mapped.
+    """
+    if (
+        dset.chunks is not None
+        or dset.compression is not None
+        or dset.external is not None
+        or dset.dtype.hasobject
+        or dset.size == 0
+        or dset.file.driver != "sec2"
+    ):
+        return None
+
+    offset = dset.id.get_offset()
+    if offset is None:  # pragma: no cover
+        return None  # Storage not allocated.
+
+    filename = Path(dset.file.filename)
+    if _is_result_file_being_written(filename):
+        return None  # pragma: no cover
+
+    return np.memmap(
+        filename, mode="r", dtype=dset.dtype, offset=offset, shape=dset.shape
+    )
+
+
+_DENSE_TRENDS_COLUMNS_RATIO = 0.5
+"""\
+When the requested trend columns are at least this fraction of the columns between the first and
+last requested columns, the whole column span is read at once (instead of selecting the columns).
+"""
+
+
+@_timed
+def _read_trends_columns(
+    dset: h5py.Dataset | np.ndarray,
+    start_index: int,
+    stop_index: int,
+    columns: list[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read the given columns of the trends data set with a single read.
+
+    :return:
+        - the data read, a 2d array (rows are time steps);
+        - the column in the data read for each of the `columns`;
+    """
+    unique_columns = np.unique(columns)
+    first_column = int(unique_columns[0])
+    last_column = int(unique_columns[-1])
+    if len(unique_columns) >= _DENSE_TRENDS_COLUMNS_RATIO * (
+        last_column - first_column + 1
+    ):
+        data = _read_dataset(
+            dset, np.s_[start_index:stop_index, first_column : last_column + 1]
+        )
+        data_columns = np.asarray(columns) - first_column
+    else:
+        data = _read_dataset(dset, np.s_[start_index:stop_index, unique_columns])
+        data_columns = np.searchsorted(unique_columns, columns)
+    return data, data_columns
+
+
+class DecimatedTrend(NamedTuple):
+    """
+    The samples of a trend kept by `read_trends_decimated`, in time order.
+    """
+
+    time: np.ndarray
+    values: np.ndarray
+
+
+DecimationMethod = Literal["minmax", "lttb"]
+
+_DECIMATION_CHUNK_SIZE = 65536
+"""\
+The default number of time steps read at once by `read_trends_decimated`.
+"""
+
+
+@_instrumented
+def read_trends_decimated(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None = None,
+    initial_trends_time_step_index: int | None = None,
+    final_trends_time_step_index: int | None = None,
+    *,
+    max_points: int,
+    method: DecimationMethod = "minmax",
+    chunk_size: int = _DECIMATION_CHUNK_SIZE,
+) -> dict[OutputKeyType, DecimatedTrend]:
+    """
+    Read trends downsampled to at most `max_points` samples, to be plotted.
+
+    The time step range is read in chunks of `chunk_size` time steps from each result file and
+    only the samples selected are kept, so the memory used is bounded by the chunk size and by
+    `max_points` (not by the number of time steps in the range).
+
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param result_metadata:
+        The metadata for the results.
+
+    :param output_keys:
+        Must be trends output ids. Default to ALL trends found in `result_metadata`.
+
+    :param initial_trends_time_step_index:
+        If `None` the initial boundary of the result metadata is used.
+
+    :param final_trends_time_step_index:
+        If `None` the final boundary of the result metadata is used.
+
+    :param max_points:
+        The maximum number of samples of each trend. Trends with at most this number of
+        samples are not decimated.
+
+    :param method:
+        - "minmax": the time steps are split in `max_points // 2` buckets and the minimum and
+          maximum samples of each bucket are kept (peaks are never lost);
+        - "lttb": Largest-Triangle-Three-Buckets, the first and last samples are kept plus
+          the sample of each of `max_points - 2` buckets that forms the largest triangle with
+          the sample kept in the previous bucket and the average of the next bucket (keeps
+          the visual shape of the trend). Reads the range twice (the bucket averages are
+          computed in the first read).
+
+    :param chunk_size:
+        The number of time steps read at once.
+
+    :return:
+        The samples kept and their time, for the trends listed in `output_keys`.
+    """
+    if method == "minmax":
+        decimator_class: type[_TrendDecimator] = _MinMaxDecimator
+    elif method == "lttb":
+        decimator_class = _LTTBDecimator
+    else:
+        raise ValueError(f"Invalid decimation method ({method!r})")
+    if max_points < decimator_class.min_points:
+        raise ValueError(
+            f"Invalid max_points ({max_points}), {method!r} requires at least"
+            f" {decimator_class.min_points}"
+        )
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk_size ({chunk_size})")
+
+    with open_result_files(result_directory) as result_files:
+        output_keys_to_read, selections = _select_trends_in_files(
+            result_metadata,
+            output_keys,
+            initial_trends_time_step_index,
+            final_trends_time_step_index,
+            result_files=result_files,
+        )
+        trends_sizes = dict.fromkeys(output_keys_to_read, 0)
+        for _, start_index, stop_index, keys_in_file, _ in selections:
+            for trend_key in keys_in_file:
+                trends_sizes[trend_key] += stop_index - start_index
+
+        dtype = (
+            np.result_type(
+                *(
+                    result_files[selection.base_ts][TRENDS_GROUP_NAME]["trends"].dtype
+                    for selection in selections
                 )
-                trend_data = dset[start_index:stop_index, index]
-                trends_entry.append(trend_data)
+            )
+            if selections
+            else np.dtype(np.float64)
+        )
+        decimators: dict[OutputKeyType, _TrendDecimator] = {
+            trend_key: (
+                _AllSamplesCollector(size, dtype)
+                if size <= max_points
+                else decimator_class(size, max_points, dtype)
+            )
+            for trend_key, size in trends_sizes.items()
+        }
 
-    result: dict[OutputKeyType, np.ndarray] = {}
-    for trend_key, data_list in trends.items():
-        if len(data_list) != 0:
-            result[trend_key] = np.concatenate(data_list)
-        else:  # pragma: no cover (no data fragments)
-            result[trend_key] = np.empty((0,), dtype=np.float64)
+        for pass_index in range(decimator_class.passes):
+            offsets = dict.fromkeys(output_keys_to_read, 0)
+            for base_ts, start_index, stop_index, keys_in_file, columns in selections:
+                group = result_files[base_ts][TRENDS_GROUP_NAME]
+                for chunk_start in range(start_index, stop_index, chunk_size):
+                    chunk_stop = min(chunk_start + chunk_size, stop_index)
+                    data, data_columns = _read_trends_columns(
+                        group["trends"], chunk_start, chunk_stop, columns
+                    )
+                    time = _read_dataset(
+                        group[TIME_SET_DSET_NAME], slice(chunk_start, chunk_stop)
+                    )
+                    for trend_key, data_column in zip(keys_in_file, data_columns):
+                        decimators[trend_key].feed(
+                            pass_index, offsets[trend_key], time, data[:, data_column]
+                        )
+                        offsets[trend_key] += chunk_stop - chunk_start
 
-    return result
+    return {
+        trend_key: decimator.result() for trend_key, decimator in decimators.items()
+    }
+
+
+class _TrendDecimator(ABC):
+    """
+    Select the samples of a trend to plot, fed with consecutive chunks of the trend.
+
+    :cvar passes:
+        The number of times the whole trend must be fed.
+
+    :cvar min_points:
+        The minimum number of samples to keep supported.
+    """
+
+    passes = 1
+    min_points = 1
+
+    def __init__(self, size: int, max_points: int, dtype: np.dtype) -> None:
+        self.size = size
+        self.max_points = max_points
+        self.dtype = dtype
 
+    @abstractmethod
+    def feed(
+        self, pass_index: int, start: int, time: np.ndarray, values: np.ndarray
+    ) -> None:
+        """
+        :param pass_index:
+            The pass over the trend, see `passes`.
+
+        :param start:
+            The position of the chunk in the trend.
+        """
+
+    @abstractmethod
+    def result(self) -> DecimatedTrend:
+        """
+        Return the samples selected (once the trend was fed `passes` times).
+        """
+
+
+class _AllSamplesCollector(_TrendDecimator):
+    """
+    Keep all samples (for trends with no more than the maximum number of points).
+    """
+
+    def __init__(self, size: int, dtype: np.dtype) -> None:
+        super().__init__(size, size, dtype)
+        self._time = np.empty((size,), dtype=np.float64)
+        self._values = np.empty((size,), dtype=dtype)
+
+    def feed(
+        self, pass_index: int, start: int, time: np.ndarray, values: np.ndarray
+    ) -> None:
+        if pass_index == 0:
+            self._time[start : start + len(values)] = time
+            self._values[start : start + len(values)] = values
 
+    def result(self) -> DecimatedTrend:
+        return DecimatedTrend(self._time, self._values)
+
+
+class _MinMaxDecimator(_TrendDecimator):
+    """
+    Keep the minimum and maximum samples of `max_points // 2` buckets of (almost) the same
+    number of time steps. `NaN` values are ignored, on ties the first sample is kept.
+    """
+
+    min_points = 2
+
+    def __init__(self, size: int, max_points: int, dtype: np.dtype) -> None:
+        super().__init__(size, max_points, dtype)
+        self._buckets = max_points // 2
+        # The minimum and maximum (stored negated, so both are minimums) of each bucket.
+        self._extremes = [
+            (
+                sign,
+                np.full((self._buckets,), -1, dtype=np.int64),
+                np.empty((self._buckets,), dtype=np.float64),
+                np.full((self._buckets,), np.inf, dtype=np.float64),
+                np.empty((self._buckets,), dtype=dtype),
+            )
+            for sign in (1.0, -1.0)
+        ]
+
+    def feed(
+        self, pass_index: int, start: int, time: np.ndarray, values: np.ndarray
+    ) -> None:
+        positions = np.arange(start, start + len(values), dtype=np.int64)
+        valid = ~np.isnan(values)
+        if not valid.all():
+            positions = positions[valid]
+            time = time[valid]
+            values = values[valid]
+        if len(values) == 0:
+            return
+
+        buckets = positions * self._buckets // self.size
+        for sign, best_positions, best_time, best_keys, best_values in self._extremes:
+            keys = sign * values.astype(np.float64, copy=False)
+            # Sorted by bucket then value, a stable sort keeps the first sample on ties.
+            order = np.lexsort((keys, buckets))
+            chunk_buckets, first = np.unique(buckets[order], return_index=True)
+            chosen = order[first]
+            better = keys[chosen] < best_keys[chunk_buckets]
+            chunk_buckets = chunk_buckets[better]
+            chosen = chosen[better]
+            best_positions[chunk_buckets] = positions[chosen]
+            best_time[chunk_buckets] = time[chosen]
+            best_keys[chunk_buckets] = keys[chosen]
+            best_values[chunk_buckets] = values[chosen]
+
+    def result(self) -> DecimatedTrend:
+        positions = []
+        time = []
+        values = []
+        for _, best_positions, best_time, _, best_values in self._extremes:
+            found = best_positions >= 0
+            positions.append(best_positions[found])
+            time.append(best_time[found])
+            values.append(best_values[found])
+        _, kept = np.unique(np.concatenate(positions), return_index=True)
+        return DecimatedTrend(np.concatenate(time)[kept], np.concatenate(values)[kept])
+
+
+class _LTTBDecimator(_TrendDecimator):
+    """
+    Largest-Triangle-Three-Buckets downsampling (Steinarsson, 2013), over two passes: the
+    first computes the average of each bucket and the second selects the samples.
+    """
+
+    passes = 2
+    min_points = 3
+
+    def __init__(self, size: int, max_points: int, dtype: np.dtype) -> None:
+        super().__init__(size, max_points, dtype)
+        # The first and last samples are always kept, the others are split in buckets.
+        buckets = max_points - 2
+        every = (size - 2) / buckets
+        self._bucket_starts = (np.arange(buckets + 1) * every).astype(np.int64) + 1
+        self._bucket_starts[-1] = size - 1
+        self._time_sums = np.zeros((buckets,), dtype=np.float64)
+        self._values_sums = np.zeros((buckets,), dtype=np.float64)
+        self._values_counts = np.zeros((buckets,), dtype=np.int64)
+        self._first = (0.0, np.nan)
+        self._last = (0.0, np.nan)
+
+        # Selection state (second pass).
+        self._next_points: np.ndarray | None = None
+        self._bucket = 0
+        self._previous = (0.0, np.nan)
+        self._best: tuple[float, Any, Any] = (-np.inf, 0.0, np.nan)
+        self._selected = 0
+        self._selected_time = np.empty((max_points,), dtype=np.float64)
+        self._selected_values = np.empty((max_points,), dtype=dtype)
+
+    def feed(
+        self, pass_index: int, start: int, time: np.ndarray, values: np.ndarray
+    ) -> None:
+        stop = start + len(values)
+        if start == 0:
+            self._first = (time[0], values[0])
+        if stop == self.size:
+            self._last = (time[-1], values[-1])
+        lo = max(start, 1)
+        hi = min(stop, self.size - 1)
+        if lo >= hi:
+            return
+
+        if pass_index == 0:
+            buckets = (
+                np.searchsorted(self._bucket_starts, np.arange(lo, hi), side="right")
+                - 1
+            )
+            chunk_time = time[lo - start : hi - start]
+            chunk_values = values[lo - start : hi - start].astype(np.float64)
+            valid = ~np.isnan(chunk_values)
+            n_buckets = len(self._time_sums)
+            self._time_sums += np.bincount(buckets, chunk_time, minlength=n_buckets)
+            self._values_sums += np.bincount(
+                buckets[valid], chunk_values[valid], minlength=n_buckets
+            )
+            self._values_counts += np.bincount(buckets[valid], minlength=n_buckets)
+            return
+
+        if self._next_points is None:
+            self._start_selection()
+        assert self._next_points is not None
+        while lo < hi:
+            bucket_stop = int(self._bucket_starts[self._bucket + 1])
+            segment_stop = min(hi, bucket_stop)
+            segment_time = time[lo - start : segment_stop - start]
+            segment_values = values[lo - start : segment_stop - start]
+            previous_time, previous_value = self._previous
+            next_time, next_value = self._next_points[self._bucket]
+            areas = np.abs(
+                (previous_time - next_time) * (segment_values - previous_value)
+                - (previous_time - segment_time) * (next_value - previous_value)
+            )
+            areas[np.isnan(areas)] = -np.inf
+            chosen = int(np.argmax(areas))
+            # The first segment of a bucket always sets the selection (even if all its
+            # areas are `NaN`), the following ones only when larger.
+            if lo == self._bucket_starts[self._bucket] or areas[chosen] > self._best[0]:
+                self._best = (
+                    areas[chosen],
+                    segment_time[chosen],
+                    segment_values[chosen],
+                )
+            if segment_stop == bucket_stop:
+                self._select(self._best[1], self._best[2])
+                self._previous = (self._best[1], self._best[2])
+                self._best = (-np.inf, 0.0, np.nan)
+                self._bucket += 1
+            lo = segment_stop
+
+    def _start_selection(self) -> None:
+        counts = np.maximum(self._values_counts, 1)
+        averages = np.empty((len(self._time_sums), 2), dtype=np.float64)
+        averages[:, 0] = self._time_sums / (
+            self._bucket_starts[1:] - self._bucket_starts[:-1]
+        )
+        averages[:, 1] = np.where(
+            self._values_counts > 0, self._values_sums / counts, np.nan
+        )
+        # The point used for each bucket is the average of the next bucket (the last sample
+        # for the last bucket).
+        self._next_points = np.concatenate([averages[1:], [self._last]])
+        self._previous = self._first
+        self._select(*self._first)
+
+    def _select(self, time: Any, value: Any) -> None:
+        self._selected_time[self._selected] = time
+        self._selected_values[self._selected] = value
+        self._selected += 1
+
+    def result(self) -> DecimatedTrend:
+        self._select(*self._last)
+        return DecimatedTrend(
+            self._selected_time[: self._selected],
+            self._selected_values[: self._selected],
+        )
+
+
+@_instrumented
 def read_time_sets(
     result_directory: Path,
     result_metadata: ALFASimResultMetadata,
@@ -1693,59 +3331,389 @@ def _read_time_sets(
                 }
             dsets = dsets_by_source_id[source_id]
 
-            if global_start is not None and global_stop is not None:
-                cache[time_set_key] = _read_time_set(
-                    dsets,
-                    base_ts_list,
-                    time_set_info,
-                    global_start,
-                    global_stop,
+            if global_start is not None and global_stop is not None:
+                cache[time_set_key] = _read_time_set(
+                    dsets,
+                    base_ts_list,
+                    time_set_info,
+                    global_start,
+                    global_stop,
+                )
+
+    return _concatenate_values(cache)
+
+
+@_timed
+def _read_time_set(
+    dsets: dict[int, h5py.File],
+    base_ts_list: tuple[int, ...],
+    time_set_info: dict[int, TimeSetInfoItem],
+    global_start: int,
+    global_stop: int,
+) -> list[np.ndarray]:
+    """
+    Read a single Time Set (used by `ReadTimeSets`).
+
+    :param dsets:
+        The time set data sets used to collect the data.
+
+    :param base_ts_list:
+        The base time steps relevant to this time set.
+
+    :param time_set_info:
+        The metadata associated with the time set.
+
+    :param global_start:
+        The global start of the read.
+
+    :param global_stop:
+        The global stop (exclusive) of the read.
+    """
+    result = []
+    for base_ts in base_ts_list:
+        time_set_dset = dsets.get(base_ts)
+        if time_set_dset:
+            time_set_info_item = time_set_info[base_ts]
+            time_set_start = time_set_info_item.global_start
+            time_set_size = time_set_info_item.size
+            start_index = _global_index_to_file_based_index(
+                global_start, time_set_start, time_set_size
+            )
+            stop_index = _global_index_to_file_based_index(
+                global_stop, time_set_start, time_set_size
+            )
+            result.append(_read_dataset(time_set_dset, slice(start_index, stop_index)))
+
+    return result
+
+
+TimeSearchSide = Literal["left", "right", "nearest"]
+
+
+@_instrumented
+def find_trends_time_step_index(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    time: float,
+    side: TimeSearchSide = "left",
+) -> int:
+    """
+    Find the (global) trends time step index of a time value, doing a binary search in the
+    time set of each result file (only O(log n) time steps are read from each file).
+
+    :param time:
+        The time value, in the unit of the stored time sets (seconds).
+
+    :param side:
+        - "left": the first time step at or after `time`;
+        - "right": the first time step after `time`;
+        - "nearest": the time step closest to `time` (the earlier one on ties).
+
+    :return:
+        The time step index, as accepted by `read_trends_data`. For "left"/"right" it is the
+        number of time steps when all time steps are before `time`.
+    """
+    with open_result_files(result_directory) as result_files:
+        return _find_time_step_index(
+            result_files, result_metadata, TRENDS_GROUP_NAME, None, time, side
+        )
+
+
+@_instrumented
+def find_profiles_time_step_index(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    profile_key: OutputKeyType,
+    time: float,
+    side: TimeSearchSide = "left",
+) -> int:
+    """
+    Find the time step index of a profile for a time value, doing a binary search in the
+    time set of each result file with the profile (only O(log n) time steps are read from each
+    file).
+
+    :param time:
+        The time value, in the unit of the stored time sets (seconds).
+
+    :param side:
+        See `find_trends_time_step_index`.
+
+    :return:
+        The time step index, as accepted by `read_profiles_data` and `read_profiles_range`.
+    """
+    with open_result_files(result_directory) as result_files:
+        return _find_time_step_index(
+            result_files,
+            result_metadata,
+            PROFILES_GROUP_NAME,
+            result_metadata.profiles[profile_key]["time_set_key"],
+            time,
+            side,
+        )
+
+
+@_instrumented
+def read_trends_data_by_time(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None = None,
+    t_start: float | None = None,
+    t_stop: float | None = None,
+    *,
+    mmap: bool = False,
+    workers: int | None = None,
+) -> dict[OutputKeyType, np.ndarray]:
+    """
+    Same as `read_trends_data`, but the range is given by time values (see
+    `find_trends_time_step_index`).
+
+    :param t_start:
+        Read the time steps at or after this time. If `None` the initial boundary of the
+        result metadata is used.
+
+    :param t_stop:
+        Read the time steps at or before this time. If `None` the final boundary of the
+        result metadata is used.
+    """
+    with keep_result_files_open(result_directory):
+        initial_index, final_index = _find_trends_time_step_range(
+            result_directory, result_metadata, t_start, t_stop
+        )
+        return read_trends_data(
+            result_directory,
+            result_metadata,
+            output_keys,
+            initial_index,
+            final_index,
+            mmap=mmap,
+            workers=workers,
+        )
+
+
+@_instrumented
+def read_profiles_range_by_time(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType],
+    t_start: float | None = None,
+    t_stop: float | None = None,
+    step: int = 1,
+    *,
+    mmap: bool = False,
+    workers: int | None = None,
+) -> dict[OutputKeyType, np.ndarray | None]:
+    """
+    Same as `read_profiles_range`, but the range is given by time values (see
+    `find_profiles_time_step_index`).
+
+    :param t_start:
+        Read the time steps at or after this time. If `None` read from the first time step.
+
+    :param t_stop:
+        Read the time steps at or before this time. If `None` read up to the last time step.
+    """
+    profiles: dict[OutputKeyType, np.ndarray | None] = {}
+    with keep_result_files_open(result_directory):
+        for time_set_key, keys in _group_profiles_by_time_set_key(
+            result_metadata, output_keys
+        ).items():
+            start = stop = None
+            with open_result_files(result_directory) as result_files:
+                if t_start is not None:
+                    start = _find_time_step_index(
+                        result_files,
+                        result_metadata,
+                        PROFILES_GROUP_NAME,
+                        time_set_key,
+                        t_start,
+                        "left",
+                    )
+                if t_stop is not None:
+                    stop = _find_time_step_index(
+                        result_files,
+                        result_metadata,
+                        PROFILES_GROUP_NAME,
+                        time_set_key,
+                        t_stop,
+                        "right",
+                    )
+            if start is not None and stop is not None:
+                stop = max(start, stop)
+            profiles.update(
+                read_profiles_range(
+                    result_directory,
+                    result_metadata,
+                    keys,
+                    start,
+                    stop,
+                    step,
+                    mmap=mmap,
+                    workers=workers,
+                )
+            )
+    return {profile_key: profiles[profile_key] for profile_key in output_keys}
+
+
+@_instrumented
+def read_profiles_data_by_time(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType],
+    t_nearest: float,
+) -> dict[OutputKeyType, np.ndarray | None]:
+    """
+    Same as `read_profiles_data`, but reading the time step nearest to a time value (see
+    `find_profiles_time_step_index`).
+
+    :param t_nearest:
+        The time value, in the unit of the stored time sets (seconds).
+    """
+    profiles: dict[OutputKeyType, np.ndarray | None] = {}
+    with keep_result_files_open(result_directory):
+        for time_set_key, keys in _group_profiles_by_time_set_key(
+            result_metadata, output_keys
+        ).items():
+            with open_result_files(result_directory) as result_files:
+                time_step_index = _find_time_step_index(
+                    result_files,
+                    result_metadata,
+                    PROFILES_GROUP_NAME,
+                    time_set_key,
+                    t_nearest,
+                    "nearest",
+                )
+            profiles.update(
+                read_profiles_data(
+                    result_directory, result_metadata, keys, time_step_index
                 )
+            )
+    return {profile_key: profiles[profile_key] for profile_key in output_keys}
 
-    return _concatenate_values(cache)
+
+def _find_trends_time_step_range(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    t_start: float | None,
+    t_stop: float | None,
+) -> tuple[int, int]:
+    """
+    :return:
+        The initial and final trends time step indexes for the time range, within the
+        boundaries of the result metadata.
+    """
+    first_index, last_index = result_metadata.trends_time_steps_boundaries
+    initial_index = first_index
+    final_index = last_index
+    with open_result_files(result_directory) as result_files:
+        if t_start is not None:
+            initial_index = _find_time_step_index(
+                result_files, result_metadata, TRENDS_GROUP_NAME, None, t_start, "left"
+            )
+        if t_stop is not None:
+            final_index = _find_time_step_index(
+                result_files, result_metadata, TRENDS_GROUP_NAME, None, t_stop, "right"
+            )
+    initial_index = min(max(initial_index, first_index), last_index)
+    final_index = min(max(final_index, initial_index), last_index)
+    return initial_index, final_index
 
 
-def _read_time_set(
-    dsets: dict[int, h5py.File],
-    base_ts_list: tuple[int, ...],
-    time_set_info: dict[int, TimeSetInfoItem],
-    global_start: int,
-    global_stop: int,
-) -> list[np.ndarray]:
+def _group_profiles_by_time_set_key(
+    result_metadata: ALFASimResultMetadata, output_keys: list[OutputKeyType]
+) -> dict[TimeSetKeyType, list[OutputKeyType]]:
     """
-    Read a single Time Set (used by `ReadTimeSets`).
+    Group the profiles sharing the time steps (so the time sets are searched only once).
+    """
+    groups: dict[TimeSetKeyType, list[OutputKeyType]] = {}
+    for profile_key in output_keys:
+        time_set_key = tuple(result_metadata.profiles[profile_key]["time_set_key"])
+        groups.setdefault(time_set_key, []).append(profile_key)
+    return groups
 
-    :param dsets:
-        The time set data sets used to collect the data.
 
-    :param base_ts_list:
-        The base time steps relevant to this time set.
+def _find_time_step_index(
+    result_files: dict[int, h5py.File],
+    result_metadata: ALFASimResultMetadata,
+    group_name: str,
+    time_set_key: Sequence[int] | None,
+    time: float,
+    side: TimeSearchSide,
+) -> int:
+    """
+    See `find_trends_time_step_index`.
 
-    :param time_set_info:
-        The metadata associated with the time set.
+    :param time_set_key:
+        The result files to search (the time step index counts only the time steps in these
+        files). Default to all files with the group.
+    """
+    # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+    time_set_info = result_metadata.time_set_info.get(group_name, {})  # type:ignore[call-overload]
+    if time_set_key is None:
+        time_set_key = sorted(time_set_info)
+    time_sets = [
+        result_files[base_ts][group_name][TIME_SET_DSET_NAME]
+        for base_ts in time_set_key
+    ]
+    sizes = [time_set_info[base_ts].size for base_ts in time_set_key]
+
+    if side not in ("left", "right", "nearest"):
+        raise ValueError(f"Invalid side ({side!r})")
+    # The time sets of the files are sorted and don't overlap (the sizes exclude the time
+    # steps dropped by restarts), so the index is the sum of the index in each file.
+    index = sum(
+        _search_time_set(time_set, size, time, "right" if side == "right" else "left")
+        for time_set, size in zip(time_sets, sizes)
+    )
+    if side != "nearest":
+        return index
+
+    candidates = []
+    for candidate_index in (index - 1, index):
+        for i, local_slice in _split_range(
+            sizes, candidate_index, candidate_index + 1, 1
+        ):
+            candidate_time = time_sets[i][local_slice.start]
+            candidates.append((abs(candidate_time - time), candidate_index))
+    if len(candidates) == 0:
+        raise ValueError(
+            f"Can not locate the time step nearest to {time} (no time steps)"
+        )
+    return min(candidates)[1]
 
-    :param global_start:
-        The global start of the read.
 
-    :param global_stop:
-        The global stop (exclusive) of the read.
+def _search_time_set(
+    time_set: h5py.Dataset, size: int, time: float, side: Literal["left", "right"]
+) -> int:
     """
-    result = []
-    for base_ts in base_ts_list:
-        time_set_dset = dsets.get(base_ts)
-        if time_set_dset:
-            time_set_info_item = time_set_info[base_ts]
-            time_set_start = time_set_info_item.global_start
-            time_set_size = time_set_info_item.size
-            start_index = _global_index_to_file_based_index(
-                global_start, time_set_start, time_set_size
-            )
-            stop_index = _global_index_to_file_based_index(
-                global_stop, time_set_start, time_set_size
-            )
-            result.append(time_set_dset[start_index:stop_index])
+    Binary search in the first `size` time steps of a (sorted) time set data set, reading
+    one time step at a time.
 
-    return result
+    :return:
+        Same as `np.searchsorted(time_set[:size], time, side)`.
+    """
+    if size == 0:
+        return 0
+    # Most files are entirely before or after the time.
+    if _time_set_before(time_set[size - 1], time, side):
+        return size
+    if not _time_set_before(time_set[0], time, side):
+        return 0
+    lo, hi = 1, size - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _time_set_before(time_set[mid], time, side):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _time_set_before(
+    time_step_time: float, time: float, side: Literal["left", "right"]
+) -> bool:
+    if side == "left":
+        return time_step_time < time
+    return time_step_time <= time
 
 
 def _concatenate_values(
@@ -1853,13 +3821,14 @@ def concatenate_metadata(
 
                 for attr_name in update:
                     a_meta_item[attr_name].update(b_meta_item[attr_name])
+                # `fmin`/`fmax` ignore `NaN` (no statistics, like in files being written).
                 for attr_name in min_:
-                    a_meta_item[attr_name] = np.nanmin(
-                        (a_meta_item[attr_name], b_meta_item[attr_name]), axis=0
+                    a_meta_item[attr_name] = np.fmin(
+                        a_meta_item[attr_name], b_meta_item[attr_name]
                     )
                 for attr_name in max_:
-                    a_meta_item[attr_name] = np.nanmax(
-                        (a_meta_item[attr_name], b_meta_item[attr_name]), axis=0
+                    a_meta_item[attr_name] = np.fmax(
+                        a_meta_item[attr_name], b_meta_item[attr_name]
                     )
 
                 a_meta_item["time_set_key"] = update_time_set(
@@ -1946,9 +3915,15 @@ def read_uncertainty_propagation_analyses_meta_data(
 class UPResult:
     """
     Holder for each uncertainty propagation result.
+
+    :ivar realization_output:
+        The realizations of the output, an array with shape
+        `(number of samples, number of time steps)`.
     """
 
-    realization_output: list[np.ndarray] = attr.ib(default=attr.Factory(list))
+    realization_output: np.ndarray = attr.ib(
+        default=attr.Factory(lambda: np.empty((0, 0)))
+    )
     std_result: np.ndarray = attr.ib(default=attr.Factory(lambda: np.array([])))
     mean_result: np.ndarray = attr.ib(default=attr.Factory(lambda: np.array([])))
 
@@ -1963,14 +3938,28 @@ class UPResult:
         )
 
 
+_DENSE_REALIZATIONS_RATIO = 0.5
+"""\
+When the samples read are at least this fraction of the samples between the first and last
+samples read, the whole sample span is read at once (instead of selecting the samples).
+"""
+
+
+@_instrumented
 def read_uncertainty_propagation_results(
     result_directory: Path,
     metadata: UncertaintyPropagationAnalysesMetaData,
     result_keys: Sequence[UPOutputKey] | None = None,
+    *,
+    summary_only: bool = False,
+    sample_subset: Sequence[int] | None = None,
 ) -> dict[UPOutputKey, UPResult]:
     """
     Get the uncertainty propagation results.
 
+    The realizations of each result are read with a single read for each quantity of
+    interest (usually one) in the item `sample_indexes`.
+
     :param result_directory:
         The directory the provided metadata was read.
 
@@ -1980,6 +3969,14 @@ def read_uncertainty_propagation_results(
     :param result_keys:
         A sequence of result key in the form of "<property_id>@<trend_id>". If None, will read the
         result of all entries found in the metadata.
+
+    :param summary_only:
+        If `True` only the mean and standard deviation are read (the realizations are
+        empty).
+
+    :param sample_subset:
+        The samples to read (indexes in the item `sample_indexes`), the realizations
+        rows are in this order. Default to all samples.
     """
     with open_result_file(result_directory) as file:
         if file is None:
@@ -1996,28 +3993,322 @@ def read_uncertainty_propagation_results(
             for r_key, meta in metadata.items.items()
             if r_key in result_keys
         }
+        if len(items_meta) == 0:
+            return {}
+
+        mean_results, std_results = (
+            _read_rows(
+                up_group[dset_name], [m.result_index for m in items_meta.values()]
+            )
+            for dset_name in (
+                UNCERTAINTY_PROPAGATION_DSET_MEAN_RESULT,
+                UNCERTAINTY_PROPAGATION_DSET_STD_RESULT,
+            )
+        )
 
         result: dict[UPOutputKey, UPResult] = {}
-        for key, meta in items_meta.items():
-            realization_outputs = [
-                realization_output_samples[sample_index][qoi_index]
-                for qoi_index, sample_index in meta.sample_indexes
-            ]
-            mean_result = up_group[UNCERTAINTY_PROPAGATION_DSET_MEAN_RESULT][
-                meta.result_index
-            ]
-            std_result = up_group[UNCERTAINTY_PROPAGATION_DSET_STD_RESULT][
-                meta.result_index
-            ]
+        for i, (key, meta) in enumerate(items_meta.items()):
+            if summary_only:
+                realization_outputs = np.empty(
+                    (0, realization_output_samples.shape[-1]),
+                    dtype=realization_output_samples.dtype,
+                )
+            else:
+                sample_indexes = meta.sample_indexes
+                if sample_subset is not None:
+                    sample_indexes = [sample_indexes[j] for j in sample_subset]
+                realization_outputs = _read_realizations(
+                    realization_output_samples, sample_indexes
+                )
             result[key] = UPResult(
                 realization_output=realization_outputs,
-                mean_result=mean_result,
-                std_result=std_result,
+                mean_result=mean_results[i],
+                std_result=std_results[i],
+            )
+
+        return result
+
+
+def _read_realizations(
+    realization_output_samples: h5py.Dataset,
+    sample_indexes: Sequence[Sequence[int]],
+    time_steps: slice = slice(None),
+) -> np.ndarray:
+    """
+    Read the realizations of the given `(qoi index, sample index)` pairs from the
+    realizations data set (shape `(samples, quantities of interest, time steps)`).
+
+    :param time_steps:
+        The time steps to read, all by default.
+
+    :return:
+        An array with shape `(len(sample_indexes), number of time steps read)`.
+    """
+    n_time_steps = len(range(*time_steps.indices(realization_output_samples.shape[-1])))
+    result = np.empty(
+        (len(sample_indexes), n_time_steps), dtype=realization_output_samples.dtype
+    )
+    if len(sample_indexes) == 0:
+        return result
+
+    pairs = np.asarray(sample_indexes, dtype=np.intp).reshape(-1, 2)
+    for qoi_index in np.unique(pairs[:, 0]):
+        (rows,) = np.nonzero(pairs[:, 0] == qoi_index)
+        result[rows] = _read_rows(
+            realization_output_samples, pairs[rows, 1], int(qoi_index), time_steps
+        )
+    return result
+
+
+def _read_rows(
+    dset: h5py.Dataset, indexes: Sequence[int] | np.ndarray, *prefix: int | slice
+) -> np.ndarray:
+    """
+    Read the rows `dset[index, *prefix]` of each index in `indexes`, with a single read: the
+    whole span of rows when the indexes are dense, sorted unique indexes otherwise.
+    """
+    unique_indexes, positions = np.unique(np.asarray(indexes), return_inverse=True)
+    first = int(unique_indexes[0])
+    last = int(unique_indexes[-1])
+    if len(unique_indexes) >= _DENSE_REALIZATIONS_RATIO * (last - first + 1):
+        data = _read_dataset(dset, (slice(first, last + 1), *prefix))
+        return data[unique_indexes[positions] - first]
+    data = _read_dataset(dset, (unique_indexes, *prefix))
+    return data[positions]
+
+
+@attr.s(frozen=True, eq=False)
+class UPQuantileBands:
+    """
+    The quantile bands (and histograms) of an uncertainty propagation result, see
+    `read_uncertainty_propagation_quantiles`.
+
+    :ivar quantiles:
+        The probabilities of the quantiles (between 0 and 1).
+
+    :ivar bands:
+        The quantiles of the realizations at each time step, an array with shape
+        `(len(quantiles), number of time steps)`.
+
+    :ivar histogram:
+        The number of realizations in each bin at each time step, an array with shape
+        `(number of time steps, number of bins)` (`None` when not computed).
+
+    :ivar bin_edges:
+        The edges of the histogram bins at each time step, an array with shape
+        `(number of time steps, number of bins + 1)` (`None` when not computed).
+    """
+
+    quantiles: np.ndarray = attr.ib()
+    bands: np.ndarray = attr.ib()
+    histogram: np.ndarray | None = attr.ib(default=None)
+    bin_edges: np.ndarray | None = attr.ib(default=None)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, UPQuantileBands):
+            return False
+
+        return all(
+            (a is None and b is None)
+            or (
+                a is not None and b is not None and np.array_equal(a, b, equal_nan=True)
+            )
+            for a, b in (
+                (self.quantiles, other.quantiles),
+                (self.bands, other.bands),
+                (self.histogram, other.histogram),
+                (self.bin_edges, other.bin_edges),
+            )
+        )
+
+
+UP_QUANTILES_BLOCK_SIZE = 2**22
+"""\
+The default maximum number of realization values read at once by
+`read_uncertainty_propagation_quantiles` (32 MiB of 64 bits floats).
+"""
+
+
+@_instrumented
+def read_uncertainty_propagation_quantiles(
+    result_directory: Path,
+    metadata: UncertaintyPropagationAnalysesMetaData,
+    quantiles: Sequence[float] = (0.1, 0.5, 0.9),
+    result_keys: Sequence[UPOutputKey] | None = None,
+    *,
+    bins: SupportsIndex | Sequence[float] | None = None,
+    sample_subset: Sequence[int] | None = None,
+    block_size: int = UP_QUANTILES_BLOCK_SIZE,
+) -> dict[UPOutputKey, UPQuantileBands]:
+    """
+    Compute the quantile bands (P10/P50/P90 by default) and optionally the histograms of the
+    realizations at each time step of the uncertainty propagation results.
+
+    The realizations are read in blocks of time steps (all the samples of each time step), so
+    at most `block_size` values are in memory at once (about `block_size` times the number of
+    quantities computed), regardless of the number of samples and time steps.
+
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param metadata:
+        The uncertainty propagation metadata previously read.
+
+    :param quantiles:
+        The probabilities of the quantiles to compute (between 0 and 1).
+
+    :param result_keys:
+        A sequence of result key in the form of "<property_id>@<trend_id>". If None, will read the
+        result of all entries found in the metadata.
+
+    :param bins:
+        When given, also compute the histogram of the realizations at each time step: the
+        number of equal-width bins between the minimum and maximum of each time step, or the
+        bin edges (the same for all time steps, realizations outside them are not counted).
+
+    :param sample_subset:
+        The samples to use (indexes in the item `sample_indexes`). Default to all samples.
+
+    :param block_size:
+        The maximum number of realization values read at once (at least one time step of
+        all the samples is read at once).
+    """
+    quantiles_array = np.asarray(quantiles, dtype=float)
+    if quantiles_array.ndim != 1 or np.any(
+        ~((quantiles_array >= 0.0) & (quantiles_array <= 1.0))
+    ):
+        raise ValueError(f"Invalid quantiles ({quantiles}), must be between 0 and 1")
+    if block_size < 1:
+        raise ValueError(f"Invalid block_size ({block_size}), must be positive")
+    histogram_bins: int | np.ndarray | None
+    if bins is None:
+        histogram_bins = None
+    elif isinstance(bins, (Sequence, np.ndarray)):
+        histogram_bins = np.asarray(bins, dtype=float)
+        if (
+            histogram_bins.ndim != 1
+            or len(histogram_bins) < 2
+            or np.any(np.diff(histogram_bins) <= 0.0)
+        ):
+            raise ValueError("The bin edges must increase monotonically")
+    else:
+        # Any integral type (`numpy` integers included) is a number of bins.
+        histogram_bins = operator.index(bins)
+        if histogram_bins < 1:
+            raise ValueError(f"Invalid bins ({bins}), must be positive")
+
+    with open_result_file(result_directory) as file:
+        if file is None:
+            return {}
+
+        up_group = file[UNCERTAINTY_PROPAGATION_GROUP_NAME]
+        realization_output_samples = up_group[
+            UNCERTAINTY_PROPAGATION_DSET_REALIZATION_OUTPUTS
+        ]
+        n_time_steps = realization_output_samples.shape[-1]
+
+        result_keys = result_keys if result_keys else list(metadata.items.keys())
+        result: dict[UPOutputKey, UPQuantileBands] = {}
+        for key, meta in metadata.items.items():
+            if key not in result_keys:
+                continue
+            sample_indexes = meta.sample_indexes
+            if sample_subset is not None:
+                sample_indexes = [sample_indexes[j] for j in sample_subset]
+            if len(sample_indexes) == 0:
+                raise ValueError(f"No samples to compute the quantiles of {key}")
+
+            bands = np.empty((len(quantiles_array), n_time_steps))
+            histogram = bin_edges = None
+            if histogram_bins is not None:
+                n_bins = (
+                    histogram_bins
+                    if isinstance(histogram_bins, int)
+                    else len(histogram_bins) - 1
+                )
+                histogram = np.empty((n_time_steps, n_bins), dtype=np.int64)
+                bin_edges = np.empty((n_time_steps, n_bins + 1))
+
+            time_steps_per_block = max(1, block_size // len(sample_indexes))
+            for start in range(0, n_time_steps, time_steps_per_block):
+                stop = min(start + time_steps_per_block, n_time_steps)
+                block = _read_realizations(
+                    realization_output_samples, sample_indexes, slice(start, stop)
+                )
+                bands[:, start:stop] = np.quantile(block, quantiles_array, axis=0)
+                if histogram_bins is not None:
+                    assert histogram is not None and bin_edges is not None
+                    (
+                        histogram[start:stop],
+                        bin_edges[start:stop],
+                    ) = _column_histograms(block, histogram_bins)
+
+            result[key] = UPQuantileBands(
+                quantiles=quantiles_array,
+                bands=bands,
+                histogram=histogram,
+                bin_edges=bin_edges,
             )
 
         return result
 
 
+def _column_histograms(
+    values: np.ndarray,
+    bins: int | np.ndarray,
+    value_range: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the histogram of each column of `values` (like `np.histogram` of each column).
+
+    :param bins:
+        The number of equal-width bins in the range of each column (non finite values are not
+        counted) or the bin edges of all columns.
+
+    :param value_range:
+        The lower and upper range of the bins of each column (values outside it are not
+        counted), instead of the range of each column values (only when `bins` is a number).
+
+    :return:
+        The histogram and bin edges of each column (one per row).
+    """
+    n_columns = values.shape[1]
+    if isinstance(bins, int):
+        n_bins = bins
+        finite = np.isfinite(values)
+        if value_range is None:
+            low = np.where(finite, values, np.inf).min(axis=0, initial=np.inf)
+            high = np.where(finite, values, -np.inf).max(axis=0, initial=-np.inf)
+        else:
+            low = np.array(value_range[0], dtype=float)
+            high = np.array(value_range[1], dtype=float)
+            finite &= (values >= low) & (values <= high)
+        low[~np.isfinite(low)] = 0.0
+        high[~np.isfinite(high)] = 1.0
+        # Same as `np.histogram` when all values are the same.
+        same = low == high
+        low[same] -= 0.5
+        high[same] += 0.5
+        edges = low[:, np.newaxis] + np.outer(
+            high - low, np.linspace(0.0, 1.0, n_bins + 1)
+        )
+        with np.errstate(invalid="ignore"):
+            bin_indexes = np.floor((values - low) / (high - low) * n_bins)
+        bin_indexes[~finite] = 0
+        valid = finite
+    else:
+        n_bins = len(bins) - 1
+        edges = np.broadcast_to(bins, (n_columns, n_bins + 1))
+        bin_indexes = np.searchsorted(bins, values, side="right") - 1
+        valid = (values >= bins[0]) & (values <= bins[-1])
+
+    # The last bin includes its right edge.
+    bin_indexes = np.clip(bin_indexes, 0, n_bins - 1).astype(np.intp)
+    bin_indexes += np.arange(n_columns) * n_bins
+    counts = np.bincount(bin_indexes[valid], minlength=n_columns * n_bins)
+    return counts.reshape(n_columns, n_bins), edges
+
+
 def read_uq_time_set(result_directory: Path, group_name: str) -> np.ndarray | None:
     """
     Get the time set for uq-based analysis results (Global Sensitivity Analysis or Uncertainty Propagation).
@@ -2031,9 +4322,10 @@ def read_uq_time_set(result_directory: Path, group_name: str) -> np.ndarray | No
     with open_result_file(result_directory, result_filename="result") as result_file:
         if not result_file:
             return None
-        return result_file[group_name]["time_set"][:]
+        return _read_dataset(result_file[group_name]["time_set"], slice(None))
 
 
+@_instrumented
 def read_global_sensitivity_coefficients(
     result_directory: Path,
     metadata: GlobalSensitivityAnalysisMetadata,
@@ -2065,16 +4357,189 @@ def read_global_sensitivity_coefficients(
             if r_key in coefficients_key
         }
 
+        gsa_group = result_file[GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME]
+        coefficients_dset = gsa_group[GLOBAL_SENSITIVITY_ANALYSIS_DSET_COEFFICIENTS]
         result: dict[GSAOutputKey, np.ndarray] = {}
         for output_key, meta in items_meta.items():
-            meta = metadata.items[output_key]
-            gsa_group = result_file[GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME]
-            coefficients_dset = gsa_group["global_sensitivity_analysis"]
-            result[output_key] = coefficients_dset[meta.qoi_index, meta.qoi_data_index]
+            result[output_key] = _read_dataset(
+                coefficients_dset, (meta.qoi_index, meta.qoi_data_index)
+            )
 
     return result
 
 
+GSAOutput = tuple[str, str]
+"""\
+A global sensitivity analysis output (quantity of interest): `(property name, element name)`.
+"""
+
+
+@attr.s(frozen=True, eq=False)
+class GSACoefficientMatrix:
+    """
+    All the global sensitivity analysis coefficients, see
+    `read_global_sensitivity_coefficient_matrix`.
+
+    :ivar timeset:
+        The time of each coefficient (seconds).
+
+    :ivar coefficients:
+        The coefficients, an array with shape
+        `(len(outputs), len(parametric_var_ids), len(timeset))` (NaN for the parametric
+        variables without coefficients for an output).
+
+    :ivar outputs:
+        The outputs, in the order of the coefficients first axis.
+
+    :ivar parametric_var_ids:
+        The parametric variables, in the order of the coefficients second axis.
+
+    :ivar output_indexes:
+        The index of each output in `outputs`.
+
+    :ivar parametric_var_indexes:
+        The index of each parametric variable in `parametric_var_ids`.
+    """
+
+    timeset: np.ndarray = attr.ib()
+    coefficients: np.ndarray = attr.ib()
+    outputs: list[GSAOutput] = attr.ib()
+    parametric_var_ids: list[str] = attr.ib()
+    output_indexes: dict[GSAOutput, int] = attr.ib()
+    parametric_var_indexes: dict[str, int] = attr.ib()
+
+    def __getitem__(self, output_key: GSAOutputKey) -> np.ndarray:
+        """
+        :return:
+            The coefficients of an output key (as `read_global_sensitivity_coefficients`).
+        """
+        return self.coefficients[
+            self.output_indexes[(output_key.property_name, output_key.element_name)],
+            self.parametric_var_indexes[output_key.parametric_var_id],
+        ]
+
+    def time_integrated_sensitivity(self) -> np.ndarray:
+        """
+        :return:
+            The time average of the absolute coefficients (trapezoidal rule), an array with
+            shape `(len(outputs), len(parametric_var_ids))`. When the time set spans no time
+            (a single time step) the average of the samples is returned instead.
+        """
+        magnitude = np.abs(self.coefficients)
+        if len(self.timeset) == 0:
+            return magnitude.sum(-1)
+        time_span = self.timeset[-1] - self.timeset[0]
+        if time_span == 0.0:
+            return magnitude.mean(axis=-1)
+        time_steps = np.diff(self.timeset)
+        integral = 0.5 * ((magnitude[..., 1:] + magnitude[..., :-1]) * time_steps).sum(
+            axis=-1
+        )
+        return integral / time_span
+
+    def top_k_indexes(self, k: int, time_index: int | None = None) -> np.ndarray:
+        """
+        :param time_index:
+            Rank the parametric variables by the absolute coefficients at this time index
+            instead of the time integrated sensitivity (see `time_integrated_sensitivity`).
+
+        :return:
+            The indexes (in `parametric_var_ids`) of the `k` most influential parametric
+            variables of each output, from the most influential, an array with shape
+            `(len(outputs), min(k, len(parametric_var_ids)))`.
+        """
+        if time_index is None:
+            scores = self.time_integrated_sensitivity()
+        else:
+            scores = np.abs(self.coefficients[..., time_index])
+        # NaN (no coefficients) are sorted last.
+        return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+    def top_k(
+        self, k: int, time_index: int | None = None
+    ) -> dict[GSAOutput, list[str]]:
+        """
+        :return:
+            The ids of the `k` most influential parametric variables of each output, see
+            `top_k_indexes`.
+        """
+        parametric_var_ids = np.array(self.parametric_var_ids, dtype=object)
+        return {
+            output: parametric_var_ids[indexes].tolist()
+            for output, indexes in zip(
+                self.outputs, self.top_k_indexes(k, time_index), strict=True
+            )
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, GSACoefficientMatrix):
+            return False
+
+        return (
+            np.array_equal(self.timeset, other.timeset)
+            and np.array_equal(self.coefficients, other.coefficients, equal_nan=True)
+            and self.outputs == other.outputs
+            and self.parametric_var_ids == other.parametric_var_ids
+        )
+
+
+@_instrumented
+def read_global_sensitivity_coefficient_matrix(
+    result_directory: Path,
+    metadata: GlobalSensitivityAnalysisMetadata,
+) -> GSACoefficientMatrix | None:
+    """
+    Read all the global sensitivity analysis coefficients at once, as a matrix of outputs,
+    parametric variables and time (the outputs and parametric variables are in the order
+    they appear in the metadata).
+
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param metadata:
+        The global sensitivity analysis result metadata previously read.
+    """
+    outputs: dict[GSAOutput, int] = {}
+    parametric_vars: dict[str, int] = {}
+    item_indexes = []
+    data_indexes = []
+    for output_key, meta in metadata.items.items():
+        output = (output_key.property_name, output_key.element_name)
+        output_index = outputs.setdefault(output, len(outputs))
+        var_index = parametric_vars.setdefault(
+            output_key.parametric_var_id, len(parametric_vars)
+        )
+        if meta.qoi_index is None or meta.qoi_data_index is None:
+            continue
+        item_indexes.append((output_index, var_index))
+        data_indexes.append((meta.qoi_index, meta.qoi_data_index))
+
+    with open_result_file(result_directory, result_filename="result") as result_file:
+        if result_file is None:
+            return None
+
+        gsa_group = result_file[GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME]
+        timeset = _read_dataset(gsa_group[TIME_SET_DSET_NAME], ())
+        data = _read_dataset(
+            gsa_group[GLOBAL_SENSITIVITY_ANALYSIS_DSET_COEFFICIENTS], ()
+        )
+
+    coefficients = np.full((len(outputs), len(parametric_vars), data.shape[-1]), np.nan)
+    if item_indexes:
+        output_indexes, var_indexes = np.array(item_indexes).T
+        qoi_indexes, qoi_data_indexes = np.array(data_indexes).T
+        coefficients[output_indexes, var_indexes] = data[qoi_indexes, qoi_data_indexes]
+
+    return GSACoefficientMatrix(
+        timeset=timeset,
+        coefficients=coefficients,
+        outputs=list(outputs),
+        parametric_var_ids=list(parametric_vars),
+        output_indexes=outputs,
+        parametric_var_indexes=parametric_vars,
+    )
+
+
 def read_history_matching_metadata(
     result_directory: Path,
 ) -> HistoryMatchingMetadata | None:
@@ -2085,6 +4550,7 @@ def read_history_matching_metadata(
     return HistoryMatchingMetadata.from_result_directory(result_directory)
 
 
+@_instrumented
 def read_history_matching_result(
     result_directory: Path,
     metadata: HistoryMatchingMetadata,
@@ -2128,19 +4594,22 @@ def read_history_matching_result(
         if not result_file:
             return {}
 
-        result = result_file[HISTORY_MATCHING_GROUP_NAME][dataset_key]
+        dset = result_file[HISTORY_MATCHING_GROUP_NAME][dataset_key]
 
-        result_map = {}
+        result_map: dict[HMOutputKey, np.ndarray | float] = {}
         if hm_result_key is None:
+            # Read the data set once for all the parametric vars.
+            result = _read_dataset(dset, ())
             for key, meta in metadata.hm_items.items():
                 result_map[key] = result[slicer(meta.data_index)]
         else:
             if (m := metadata.hm_items.get(hm_result_key)) is not None:
-                result_map[hm_result_key] = result[slicer(m.data_index)]
+                result_map[hm_result_key] = _read_dataset(dset, slicer(m.data_index))
 
-        return result_map
+    return result_map
 
 
+@_instrumented
 def read_history_matching_historic_data_curves(
     result_directory: Path,
     metadata: HistoryMatchingMetadata,
@@ -2169,7 +4638,7 @@ def read_history_matching_historic_data_curves(
             return {}
 
         return {
-            info.curve_id: result[info.curve_id][:]
+            info.curve_id: _read_dataset(result[info.curve_id], slice(None))
             for info in (metadata.historic_data_curve_infos or ())
         }
 
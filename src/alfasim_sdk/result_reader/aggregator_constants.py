@@ -2,6 +2,7 @@ TRENDS_GROUP_NAME = "trends"
 TRENDS_META_ATTR_NAME = "trends"
 GLOBAL_SENSITIVITY_ANALYSIS_META_ATTR_NAME = "global_sensitivity_analysis"
 GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME = "global_sensitivity_analysis"
+GLOBAL_SENSITIVITY_ANALYSIS_DSET_COEFFICIENTS = "global_sensitivity_analysis"
 
 HISTORY_MATCHING_GROUP_NAME = "history_matching"
 HISTORY_MATCHING_HISTORIC_DATA_GROUP_NAME = "history_matching_historic_data"
@@ -28,6 +29,7 @@ PROFILES_STATISTICS_DSET_NAME_SUFFIX = "_statistics"
 
 RESULT_FILE_PREFIX = "results_"
 RESULTS_FOLDER_NAME = "results"
+METADATA_CACHE_FILE_NAME = ".metadata_cache"
 MULTIPLE_RUNS_FOLDER = "multiple_runs"
 
 RESULT_FILE_LOCKING_MODE = False
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import dataclasses
+import operator
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from typing_extensions import Self
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    _global_index_to_file_based_index,
+    _split_range,
+    open_result_files,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    PROFILES_GROUP_NAME,
+    TIME_SET_DSET_NAME,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.instrumentation import _read_dataset
+
+
+@dataclasses.dataclass(frozen=True)
+class _ArraySegment:
+    """
+    The part of a lazy array stored in a result file.
+
+    :ivar base_ts:
+        The result file key.
+
+    :ivar dset_name:
+        The name of the data set holding the data (relative to the file root).
+
+    :ivar start:
+        The first row of the data set in the array.
+
+    :ivar stop:
+        The row of the data set after the last in the array.
+
+    :ivar column:
+        The column of the data set in the array, `None` to use all columns.
+    """
+
+    base_ts: int
+    dset_name: str
+    start: int
+    stop: int
+    column: int | None = None
+
+
+class _ResultArray:
+    """
+    An array which data is spread over result files, and is only read when indexed
+    (only the rows selected are read).
+
+    Supports `len`, indexing (integers and slices, negative values and steps included)
+    and conversion to `np.ndarray` (`np.asarray`).
+    """
+
+    def __init__(self, result_directory: Path, segments: Sequence[_ArraySegment]):
+        self.result_directory = result_directory
+        self._segments = [
+            segment for segment in segments if segment.start < segment.stop
+        ]
+        self._sizes = [segment.stop - segment.start for segment in self._segments]
+        self._row_shape: tuple[int, ...] | None = None
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        if self._row_shape is None:
+            self._row_shape = self[:1].shape[1:]
+        return (len(self), *self._row_shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, tuple):
+            if len(key) == 0:
+                return self[:]
+            index, *rest = key
+            data = self[index]
+            if isinstance(index, slice):
+                return data[(slice(None), *rest)]
+            return data[tuple(rest)]
+
+        if isinstance(key, slice):
+            return self._read(key)
+
+        index = operator.index(key)
+        size = len(self)
+        if index < 0:
+            index += size
+        if not (0 <= index < size):
+            raise IndexError(f"Index {key} out of range for an array of size {size}")
+        return self._read(slice(index, index + 1))[0]
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        data = self[:]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return data
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self)} rows>"
+
+    def _read(self, index: slice) -> np.ndarray:
+        """
+        Read the rows selected by `index`, doing one read (hyperslab) for each result file.
+        """
+        start, stop, step = index.indices(len(self))
+        reverse = step < 0
+        if reverse:
+            rows = range(start, stop, step)
+            if len(rows) == 0:
+                start, stop, step = 0, 0, 1
+            else:
+                start, stop, step = rows[-1], rows[0] + 1, -step
+
+        pieces = []
+        with open_result_files(self.result_directory) as result_files:
+            for i, local_slice in _split_range(self._sizes, start, stop, step):
+                segment = self._segments[i]
+                dset = result_files[segment.base_ts][segment.dset_name]
+                rows_slice = slice(
+                    segment.start + local_slice.start,
+                    segment.start + local_slice.stop,
+                    local_slice.step,
+                )
+                if segment.column is None:
+                    pieces.append(_read_dataset(dset, rows_slice))
+                else:
+                    pieces.append(_read_dataset(dset, (rows_slice, segment.column)))
+
+        if len(pieces) == 0:
+            return np.empty((0, *(self._row_shape or ())), dtype=np.float64)
+        data = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+        return data[::-1] if reverse else data
+
+
+class TrendArray(_ResultArray):
+    """
+    The samples of a trend (spread over the result files), read on demand:
+
+        pressure = results.get_overall_trend_array("pressure", "pipe 1")
+        last_samples = pressure[-1000:]
+        decimated = pressure[::100]
+
+    :ivar time:
+        The time of each sample (also read on demand).
+    """
+
+    time: _ResultArray
+
+    @classmethod
+    def from_metadata(
+        cls,
+        result_directory: Path,
+        metadata: ALFASimResultMetadata,
+        trend_key: OutputKeyType,
+    ) -> Self:
+        """
+        Create the array for a trend, in the time step range of the metadata.
+        """
+        # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+        time_set_info = metadata.time_set_info.get(TRENDS_GROUP_NAME, {})  # type:ignore[call-overload]
+        initial_index, final_index = metadata.trends_time_steps_boundaries
+
+        segments = []
+        time_segments = []
+        for base_ts, column in metadata.trends[trend_key]["index"].items():
+            time_set_info_item = time_set_info[base_ts]
+            start = _global_index_to_file_based_index(
+                initial_index, time_set_info_item.global_start, time_set_info_item.size
+            )
+            stop = _global_index_to_file_based_index(
+                final_index, time_set_info_item.global_start, time_set_info_item.size
+            )
+            segments.append(
+                _ArraySegment(
+                    base_ts, f"{TRENDS_GROUP_NAME}/trends", start, stop, column
+                )
+            )
+            time_segments.append(
+                _ArraySegment(
+                    base_ts, f"{TRENDS_GROUP_NAME}/{TIME_SET_DSET_NAME}", start, stop
+                )
+            )
+
+        trend_array = cls(result_directory, segments)
+        trend_array.time = _ResultArray(result_directory, time_segments)
+        return trend_array
+
+
+class ProfileArray(_ResultArray):
+    """
+    The time steps of a profile (spread over the result files), read on demand. The rows
+    are the time steps and the columns the profile points:
+
+        pressure = results.get_profile_array("pressure", "pipe 1")
+        last_profiles = pressure[-10:]
+
+    :ivar time:
+        The time of each time step (also read on demand).
+    """
+
+    time: _ResultArray
+
+    @classmethod
+    def from_metadata(
+        cls,
+        result_directory: Path,
+        metadata: ALFASimResultMetadata,
+        profile_key: OutputKeyType,
+    ) -> Self:
+        """
+        Create the array for a profile, with all its time steps.
+        """
+        # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+        time_set_info = metadata.time_set_info.get(PROFILES_GROUP_NAME, {})  # type:ignore[call-overload]
+        profile_metadata = metadata.profiles[profile_key]
+
+        segments = []
+        time_segments = []
+        for base_ts in profile_metadata["time_set_key"]:
+            data_id = profile_metadata["data_id"].get(base_ts)
+            if data_id is None:  # pragma: no cover
+                raise RuntimeError(
+                    f"profile_key {profile_key} has no data in result file {base_ts}"
+                )
+            size = time_set_info[base_ts].size
+            segments.append(
+                _ArraySegment(base_ts, f"{PROFILES_GROUP_NAME}/{data_id}", 0, size)
+            )
+            time_segments.append(
+                _ArraySegment(
+                    base_ts, f"{PROFILES_GROUP_NAME}/{TIME_SET_DSET_NAME}", 0, size
+                )
+            )
+
+        profile_array = cls(result_directory, segments)
+        profile_array.time = _ResultArray(result_directory, time_segments)
+        return profile_array
@@ -0,0 +1,678 @@
+"""
+A persistent catalog of many simulation results: the metadata of the results is indexed in a
+SQLite database, so the results can be searched without opening their result files.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, NamedTuple
+
+from barril.units import Scalar, UnitsError
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    _check_workers,
+    _map_in_processes,
+    keep_result_files_open,
+    read_metadata,
+    read_time_sets,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    RESULT_FILE_PREFIX,
+    RESULTS_FOLDER_NAME,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+_CATALOG_SCHEMA_VERSION = 1
+
+_CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_info (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS data_folders (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    files_signature TEXT NOT NULL,
+    status_signature TEXT,
+    status_state TEXT,
+    status TEXT,
+    time_sets_unit TEXT,
+    time_start REAL,
+    time_end REAL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS result_files (
+    data_folder_id INTEGER NOT NULL REFERENCES data_folders(id) ON DELETE CASCADE,
+    base_ts INTEGER NOT NULL,
+    uuid TEXT,
+    app_version TEXT,
+    PRIMARY KEY (data_folder_id, base_ts)
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    data_folder_id INTEGER NOT NULL REFERENCES data_folders(id) ON DELETE CASCADE,
+    output_type TEXT NOT NULL,
+    output_key TEXT NOT NULL,
+    property_id TEXT NOT NULL,
+    element_name TEXT,
+    category TEXT,
+    unit TEXT,
+    position REAL,
+    min REAL,
+    max REAL,
+    PRIMARY KEY (data_folder_id, output_type, output_key)
+);
+CREATE INDEX IF NOT EXISTS outputs_property_element
+    ON outputs (property_id, element_name);
+"""
+
+ThresholdType = float | tuple[float, str]
+"""\
+A threshold value in the unit of each output, or a `(value, unit)` converted to the unit of
+each output.
+"""
+
+
+class CatalogMatch(NamedTuple):
+    """
+    An output found by `ResultsCatalog.query`.
+
+    :ivar data_folder:
+        The data folder of the simulation (see `Results`).
+
+    :ivar output_type:
+        `"trend"` or `"profile"`.
+
+    :ivar output_key:
+        The output key (`"<property_id>@<trend_id>"` or `"<property_id>@<profile_id>"`).
+    """
+
+    data_folder: Path
+    output_type: Literal["trend", "profile"]
+    output_key: OutputKeyType
+
+
+@dataclasses.dataclass(frozen=True)
+class CatalogEntry:
+    """
+    A data folder indexed in a `ResultsCatalog`.
+
+    :ivar status:
+        The last status of the simulation (see `Results.status`), as of the last indexing.
+
+    :ivar time_start:
+        The first time of the results (in `time_sets_unit`).
+
+    :ivar time_end:
+        The last time of the results (in `time_sets_unit`).
+
+    :ivar app_version_info:
+        Map "base time steps" to the application version used in the simulation.
+
+    :ivar indexed_at:
+        When the data folder results were last indexed (seconds since the epoch).
+    """
+
+    data_folder: Path
+    status: dict[str, Any] | None
+    time_sets_unit: str | None
+    time_start: float | None
+    time_end: float | None
+    app_version_info: dict[int, str]
+    indexed_at: float
+
+
+@dataclasses.dataclass(frozen=True)
+class CatalogIndexReport:
+    """
+    The data folders processed by `ResultsCatalog.index`.
+
+    :ivar indexed:
+        The data folders whose results were (re)indexed.
+
+    :ivar unchanged:
+        The data folders whose result files did not change since the last indexing (their
+        status is updated).
+
+    :ivar removed:
+        The data folders without results anymore, removed from the catalog.
+
+    :ivar failed:
+        The data folders whose results could not be read, with the error message (their
+        previous entries, if any, are kept).
+    """
+
+    indexed: list[Path] = dataclasses.field(default_factory=list)
+    unchanged: list[Path] = dataclasses.field(default_factory=list)
+    removed: list[Path] = dataclasses.field(default_factory=list)
+    failed: dict[Path, str] = dataclasses.field(default_factory=dict)
+
+
+class ResultsCatalog:
+    """
+    A catalog of the results of many simulations (data folders), indexed in a SQLite
+    database: the outputs of each simulation (with units, positions and global min/max), the
+    application versions, the time span and the status of the simulation.
+
+    Indexing is incremental: the results of a data folder are only read again when its result
+    files changed (by name, size and modification time). Queries only use the database:
+
+    .. code-block:: python
+
+        with ResultsCatalog(Path("catalog.sqlite")) as catalog:
+            catalog.index(find_data_folders(Path("/studies")), workers=8)
+            for match in catalog.query(
+                "pressure", "riser", output_type="trend", max_above=(200.0, "bar")
+            ):
+                results = Results(match.data_folder)
+                trend_metadata = results.metadata.trends[match.output_key]
+
+    :param database:
+        The SQLite database file (created if needed).
+    """
+
+    def __init__(self, database: Path) -> None:
+        self._database = database
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            self._connection.executescript(_CATALOG_SCHEMA)
+            row = self._connection.execute(
+                "SELECT value FROM catalog_info WHERE name = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                self._connection.execute(
+                    "INSERT INTO catalog_info VALUES ('schema_version', ?)",
+                    (str(_CATALOG_SCHEMA_VERSION),),
+                )
+        if row is not None and int(row[0]) != _CATALOG_SCHEMA_VERSION:
+            self._connection.close()
+            raise ValueError(
+                f"Unsupported results catalog version {row[0]} in {database}"
+                f" (expected {_CATALOG_SCHEMA_VERSION})"
+            )
+
+    @property
+    def database(self) -> Path:
+        return self._database
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> ResultsCatalog:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def index(
+        self,
+        data_folders: Iterable[Path],
+        *,
+        workers: int | None = None,
+        use_metadata_cache: bool = False,
+        force: bool = False,
+    ) -> CatalogIndexReport:
+        """
+        Index (or update the index of) the results of the given data folders.
+
+        :param workers:
+            If greater than 1, the results are read in parallel by a pool of processes with
+            this size.
+
+        :param use_metadata_cache:
+            Keep the metadata of finished result files in a cache file (see `read_metadata`),
+            note that it is written in the results folder of each data folder.
+
+        :param force:
+            Read the results of all data folders again, even when not changed.
+        """
+        workers = _check_workers(workers)
+        report = CatalogIndexReport()
+        indexed_signatures = dict(
+            self._connection.execute("SELECT path, files_signature FROM data_folders")
+        )
+
+        to_read = []
+        for data_folder in data_folders:
+            path = _catalog_path(data_folder)
+            try:
+                files_signature = _result_files_signature(data_folder)
+            except OSError as error:
+                report.failed[data_folder] = _error_message(error)
+                continue
+            if files_signature is None:
+                if path in indexed_signatures:
+                    with self._connection:
+                        self._connection.execute(
+                            "DELETE FROM data_folders WHERE path = ?", (path,)
+                        )
+                    report.removed.append(data_folder)
+                continue
+            if not force and indexed_signatures.get(path) == files_signature:
+                with self._connection:
+                    self._update_status(path, data_folder)
+                report.unchanged.append(data_folder)
+            else:
+                to_read.append((data_folder, files_signature))
+
+        entries = _map_in_processes(
+            _read_catalog_entry,
+            [(data_folder, use_metadata_cache) for data_folder, _ in to_read],
+            workers,
+        )
+        for (data_folder, files_signature), entry in zip(to_read, entries, strict=True):
+            if isinstance(entry, str):
+                report.failed[data_folder] = entry
+                continue
+            with self._connection:
+                self._store_entry(data_folder, files_signature, entry)
+            report.indexed.append(data_folder)
+        return report
+
+    def remove(self, data_folder: Path) -> None:
+        """
+        Remove a data folder from the catalog.
+        """
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM data_folders WHERE path = ?", (_catalog_path(data_folder),)
+            )
+
+    def prune(self) -> list[Path]:
+        """
+        Remove the data folders without results anymore from the catalog.
+
+        :return:
+            The data folders removed.
+        """
+        removed = [
+            data_folder
+            for data_folder in self.data_folders()
+            if not (data_folder / RESULTS_FOLDER_NAME).is_dir()
+        ]
+        for data_folder in removed:
+            self.remove(data_folder)
+        return removed
+
+    def data_folders(self) -> list[Path]:
+        """
+        The data folders in the catalog.
+        """
+        return [
+            Path(path)
+            for (path,) in self._connection.execute(
+                "SELECT path FROM data_folders ORDER BY path"
+            )
+        ]
+
+    def get_entry(self, data_folder: Path) -> CatalogEntry | None:
+        """
+        :return:
+            The catalog entry of a data folder, `None` if not in the catalog.
+        """
+        row = self._connection.execute(
+            "SELECT id, status, time_sets_unit, time_start, time_end, indexed_at"
+            " FROM data_folders WHERE path = ?",
+            (_catalog_path(data_folder),),
+        ).fetchone()
+        if row is None:
+            return None
+        data_folder_id, status, time_sets_unit, time_start, time_end, indexed_at = row
+        app_version_info = dict(
+            self._connection.execute(
+                "SELECT base_ts, app_version FROM result_files"
+                " WHERE data_folder_id = ? ORDER BY base_ts",
+                (data_folder_id,),
+            )
+        )
+        return CatalogEntry(
+            data_folder=data_folder,
+            status=None if status is None else json.loads(status),
+            time_sets_unit=time_sets_unit,
+            time_start=time_start,
+            time_end=time_end,
+            app_version_info=app_version_info,
+            indexed_at=indexed_at,
+        )
+
+    def query(
+        self,
+        property_id: str | None = None,
+        element_name: str | None = None,
+        *,
+        output_type: Literal["trend", "profile"] | None = None,
+        category: str | None = None,
+        position: float | None = None,
+        min_below: ThresholdType | None = None,
+        max_above: ThresholdType | None = None,
+        status: str | None = None,
+        app_version: str | None = None,
+    ) -> list[CatalogMatch]:
+        """
+        Find the outputs in the catalog matching all the given criteria.
+
+        The names (`property_id`, `element_name`, `category`, `status` and `app_version`)
+        accept shell style wildcards (`*`, `?` and `[...]`, case-sensitive).
+
+        :param position:
+            The position of positional trends (meters), matched with the same margin of
+            `Results`.
+
+        :param min_below:
+            Only outputs whose global minimum is below this value (in the unit of each
+            output), or a `(value, unit)`.
+
+        :param max_above:
+            Only outputs whose global maximum is above this value (in the unit of each
+            output), or a `(value, unit)`.
+
+        :param status:
+            The state of the last status of the simulation (`"FINISHED"`, ...).
+
+        :param app_version:
+            Only results with a result file written by this application version.
+
+        :return:
+            The matching outputs, ordered by data folder and output key.
+        """
+        conditions = []
+        params: list[Any] = []
+        for column, value in (
+            ("outputs.property_id", property_id),
+            ("outputs.element_name", element_name),
+            ("outputs.output_type", output_type),
+            ("outputs.category", category),
+            ("data_folders.status_state", status),
+        ):
+            if value is not None:
+                conditions.append(f"{column} GLOB ?")
+                params.append(value)
+        if position is not None:
+            conditions.append("abs(outputs.position - ?) <= ?")
+            params += [position, _POSITION_MARGIN]
+        if app_version is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM result_files WHERE"
+                " result_files.data_folder_id = data_folders.id"
+                " AND result_files.app_version GLOB ?)"
+            )
+            params.append(app_version)
+
+        for column, operator, threshold in (
+            ("min", "<", min_below),
+            ("max", ">", max_above),
+        ):
+            if threshold is None:
+                continue
+            if not isinstance(threshold, tuple):
+                conditions.append(f"outputs.{column} {operator} ?")
+                params.append(threshold)
+                continue
+            # Convert the threshold to each of the units of the candidate outputs.
+            units = [
+                unit
+                for (unit,) in self._connection.execute(
+                    _OUTPUTS_QUERY.format(
+                        columns="DISTINCT outputs.unit",
+                        conditions=" AND ".join(conditions) or "1",
+                    ),
+                    params,
+                )
+            ]
+            unit_conditions = []
+            for unit in units:
+                unit_threshold = _convert_threshold(threshold, unit)
+                if unit_threshold is not None:
+                    unit_conditions.append(
+                        f"(outputs.unit IS ? AND outputs.{column} {operator} ?)"
+                    )
+                    params += [unit, unit_threshold]
+            conditions.append(f"({' OR '.join(unit_conditions) or '0'})")
+
+        rows = self._connection.execute(
+            _OUTPUTS_QUERY.format(
+                columns="data_folders.path, outputs.output_type, outputs.output_key",
+                conditions=" AND ".join(conditions) or "1",
+            )
+            + " ORDER BY data_folders.path, outputs.output_type, outputs.output_key",
+            params,
+        )
+        return [
+            CatalogMatch(Path(path), output_type, output_key)
+            for path, output_type, output_key in rows
+        ]
+
+    def _update_status(self, path: str, data_folder: Path) -> None:
+        status_signature = _status_signature(data_folder)
+        row = self._connection.execute(
+            "SELECT status_signature FROM data_folders WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None and row[0] == status_signature:
+            return
+        status = _read_status(data_folder)
+        self._connection.execute(
+            "UPDATE data_folders SET status_signature = ?, status_state = ?, status = ?"
+            " WHERE path = ?",
+            (
+                status_signature,
+                None if status is None else status.get("state"),
+                None if status is None else json.dumps(status),
+                path,
+            ),
+        )
+
+    def _store_entry(
+        self, data_folder: Path, files_signature: str, entry: dict[str, Any]
+    ) -> None:
+        path = _catalog_path(data_folder)
+        self._connection.execute("DELETE FROM data_folders WHERE path = ?", (path,))
+        cursor = self._connection.execute(
+            "INSERT INTO data_folders (path, files_signature, time_sets_unit, time_start,"
+            " time_end, indexed_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                files_signature,
+                entry["time_sets_unit"],
+                entry["time_start"],
+                entry["time_end"],
+                time.time(),
+            ),
+        )
+        data_folder_id = cursor.lastrowid
+        self._connection.executemany(
+            "INSERT INTO result_files VALUES (?, ?, ?, ?)",
+            [(data_folder_id, *row) for row in entry["result_files"]],
+        )
+        self._connection.executemany(
+            "INSERT INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(data_folder_id, *row) for row in entry["outputs"]],
+        )
+        self._update_status(path, data_folder)
+
+
+_POSITION_MARGIN = 0.01
+"""\
+The margin (meters) to match the position of positional trends, the same of `Results`.
+"""
+
+_OUTPUTS_QUERY = (
+    "SELECT {columns} FROM outputs"
+    " JOIN data_folders ON data_folders.id = outputs.data_folder_id"
+    " WHERE {conditions}"
+)
+
+
+def find_data_folders(root: Path) -> Iterator[Path]:
+    """
+    Find the data folders with results under `root` (including `root` itself), like the data
+    folders of simulations and of the runs of multiple runs simulations.
+    """
+    for dirpath, dirnames, _ in os.walk(root):
+        if RESULTS_FOLDER_NAME in dirnames:
+            yield Path(dirpath)
+            # The results folder does not have data folders.
+            dirnames.remove(RESULTS_FOLDER_NAME)
+        dirnames.sort()
+
+
+def _catalog_path(data_folder: Path) -> str:
+    return str(data_folder.absolute())
+
+
+def _result_files_signature(data_folder: Path) -> str | None:
+    """
+    :return:
+        The name, size and modification time of the result files (and `.creating` markers)
+        of a data folder, `None` if the data folder has no results folder.
+
+    :raises OSError:
+        When the results folder (or a result file) can't be read, or a result file is
+        removed while listed.
+    """
+    results_folder = data_folder / RESULTS_FOLDER_NAME
+    try:
+        entries = list(os.scandir(results_folder))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    signature = []
+    for entry in entries:
+        if entry.name.startswith(RESULT_FILE_PREFIX) and entry.is_file():
+            stat = entry.stat()
+            signature.append([entry.name, stat.st_size, stat.st_mtime_ns])
+    return json.dumps(sorted(signature))
+
+
+def _status_signature(data_folder: Path) -> str | None:
+    try:
+        stat = (data_folder / "communication.sqlite").stat()
+    except OSError:
+        return None
+    return json.dumps([stat.st_size, stat.st_mtime_ns])
+
+
+def _read_status(data_folder: Path) -> dict[str, Any] | None:
+    try:
+        status = Results(data_folder).status
+    except (OSError, sqlite3.Error):
+        return None
+    return None if status is None else dict(status)
+
+
+def _read_catalog_entry(
+    data_folder: Path, use_metadata_cache: bool
+) -> dict[str, Any] | str:
+    """
+    Read the results of a data folder to be stored in the catalog (this runs in the worker
+    processes).
+
+    :return:
+        The catalog entry, or the error message when the results can't be read (any error,
+        such as unreadable files or corrupt metadata, so the other data folders are still
+        indexed).
+    """
+    results_folder = data_folder / RESULTS_FOLDER_NAME
+    try:
+        with keep_result_files_open(results_folder):
+            metadata = read_metadata(
+                results_folder, use_metadata_cache=use_metadata_cache
+            )
+            time_sets = read_time_sets(results_folder, metadata)
+
+        time_values = [values for values in time_sets.values() if len(values) > 0]
+        return {
+            "time_sets_unit": metadata.time_sets_unit or None,
+            "time_start": min((float(v[0]) for v in time_values), default=None),
+            "time_end": max((float(v[-1]) for v in time_values), default=None),
+            "result_files": _result_files_rows(metadata),
+            "outputs": _outputs_rows(metadata),
+        }
+    except Exception as error:
+        return _error_message(error)
+
+
+def _error_message(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _result_files_rows(metadata: ALFASimResultMetadata) -> list[tuple]:
+    uuids = {
+        base_ts: info.uuid
+        for time_set_info in metadata.time_set_info.values()
+        for base_ts, info in time_set_info.items()
+    }
+    return [
+        (base_ts, uuids.get(base_ts), metadata.app_version_info.get(base_ts))
+        for base_ts in sorted(uuids.keys() | metadata.app_version_info.keys())
+    ]
+
+
+def _outputs_rows(metadata: ALFASimResultMetadata) -> list[tuple]:
+    rows = []
+    for key, trend in metadata.trends.items():
+        rows.append(
+            (
+                "trend",
+                key,
+                trend["property_id"],
+                trend.get("network_element_name"),
+                trend.get("category"),
+                trend.get("unit"),
+                trend.get("position"),
+                _finite_or_none(trend.get("min")),
+                _finite_or_none(trend.get("max")),
+            )
+        )
+    for key, profile in metadata.profiles.items():
+        rows.append(
+            (
+                "profile",
+                key,
+                profile["property_id"],
+                profile.get("network_element_name"),
+                profile.get("category"),
+                profile.get("unit"),
+                None,
+                _finite_or_none(profile.get("global_min")),
+                _finite_or_none(profile.get("global_max")),
+            )
+        )
+    return rows
+
+
+def _finite_or_none(value: float | None) -> float | None:
+    if value is None or not math.isfinite(value):
+        return None
+    return float(value)
+
+
+def _convert_threshold(threshold: tuple[float, str], unit: str | None) -> float | None:
+    """
+    :return:
+        The threshold in `unit`, `None` if it can't be converted (unknown or incompatible
+        units).
+    """
+    value, threshold_unit = threshold
+    if unit is None:
+        return None
+    if unit == threshold_unit:
+        return value
+    try:
+        return Scalar(value, threshold_unit).GetValue(unit)
+    except UnitsError:
+        return None
@@ -0,0 +1,492 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterator, Mapping
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    _iter_profile_chunks,
+    _read_trends_data,
+    _select_trends_in_files,
+    keep_result_files_open,
+    open_result_files,
+    read_metadata,
+)
+from alfasim_sdk.result_reader.aggregator_constants import PROFILES_GROUP_NAME
+from alfasim_sdk.result_reader.instrumentation import _instrumented
+
+OutputKind = Literal["trend", "profile"]
+
+OutputMatchKey = tuple[str, str | None, float | None]
+"""\
+The key used to match the outputs of different results: the property id, the network element
+name and the position (`None` for profiles and trends which are not positional).
+"""
+
+_COMPARE_TRENDS_CHUNK_SIZE = 65536
+_COMPARE_PROFILES_CHUNK_SIZE = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class OutputComparison:
+    """
+    The comparison of an output in two results.
+
+    :ivar kind:
+        The kind of the output.
+
+    :ivar key_a:
+        The output key in the first results.
+
+    :ivar key_b:
+        The output key in the second results.
+
+    :ivar size_a:
+        The number of time steps in the first results.
+
+    :ivar size_b:
+        The number of time steps in the second results.
+
+    :ivar compared:
+        The number of time steps compared (the comparison stops at the first chunk of time
+        steps out of the tolerance).
+
+    :ivar mismatch_index:
+        The first time step out of the tolerance (or the size of the smaller output when the
+        sizes differ), `None` if the outputs match.
+
+    :ivar max_deviation:
+        The maximum absolute difference in the time steps compared (infinite when only one of
+        the values is `NaN`).
+
+    :ivar max_deviation_index:
+        The time step of the maximum difference, `None` if nothing was compared.
+
+    :ivar max_deviation_point:
+        The profile point of the maximum difference, `None` for trends.
+    """
+
+    kind: OutputKind
+    key_a: OutputKeyType
+    key_b: OutputKeyType
+    size_a: int
+    size_b: int
+    compared: int
+    mismatch_index: int | None
+    max_deviation: float
+    max_deviation_index: int | None
+    max_deviation_point: int | None = None
+
+    @property
+    def equal(self) -> bool:
+        return self.mismatch_index is None
+
+
+@dataclasses.dataclass(frozen=True)
+class ResultsComparison:
+    """
+    The comparison of two results (see `compare_results`).
+
+    :ivar outputs:
+        The comparison of the outputs found in both results.
+
+    :ivar only_in_a:
+        The outputs (keys) found only in the first results.
+
+    :ivar only_in_b:
+        The outputs (keys) found only in the second results.
+    """
+
+    outputs: list[OutputComparison]
+    only_in_a: list[OutputKeyType]
+    only_in_b: list[OutputKeyType]
+
+    @property
+    def equal(self) -> bool:
+        return (
+            not self.only_in_a
+            and not self.only_in_b
+            and all(output.equal for output in self.outputs)
+        )
+
+    @property
+    def mismatches(self) -> list[OutputComparison]:
+        return [output for output in self.outputs if not output.equal]
+
+
+@_instrumented
+def compare_results(
+    result_directory_a: Path,
+    result_directory_b: Path,
+    rtol: float = 1e-05,
+    atol: float = 1e-08,
+    keys: list[OutputKeyType] | None = None,
+    *,
+    trends_chunk_size: int = _COMPARE_TRENDS_CHUNK_SIZE,
+    profiles_chunk_size: int = _COMPARE_PROFILES_CHUNK_SIZE,
+) -> ResultsComparison:
+    """
+    Compare the trends and profiles of two results, with tolerances.
+
+    The outputs are matched by `(property id, network element name, position)` (see
+    `OutputMatchKey`) and read from both results in aligned chunks of time steps, the comparison
+    of an output stops at the first chunk out of the tolerance (so the memory used is bounded by
+    the chunk sizes and results that differ are compared quickly).
+
+    The values match when `abs(a - b) <= atol + rtol * abs(b)` (as `np.isclose`, `NaN` values
+    match each other).
+
+    :param result_directory_a:
+        The directory of the first results.
+
+    :param result_directory_b:
+        The directory of the second results.
+
+    :param keys:
+        The outputs (keys in the first results) to compare. Default to ALL outputs.
+
+    :param trends_chunk_size:
+        The number of trend time steps read at once.
+
+    :param profiles_chunk_size:
+        The number of profile time steps read at once.
+    """
+    with (
+        keep_result_files_open(result_directory_a),
+        keep_result_files_open(result_directory_b),
+    ):
+        metadata_a = read_metadata(result_directory_a)
+        metadata_b = read_metadata(result_directory_b)
+        trend_pairs, trends_only_in_a, trends_only_in_b = _match_outputs(
+            metadata_a.trends, metadata_b.trends, keys
+        )
+        profile_pairs, profiles_only_in_a, profiles_only_in_b = _match_outputs(
+            metadata_a.profiles, metadata_b.profiles, keys
+        )
+
+        comparisons = _compare_trends(
+            result_directory_a,
+            metadata_a,
+            result_directory_b,
+            metadata_b,
+            trend_pairs,
+            rtol,
+            atol,
+            trends_chunk_size,
+        )
+        comparisons += _compare_profiles(
+            result_directory_a,
+            metadata_a,
+            result_directory_b,
+            metadata_b,
+            profile_pairs,
+            rtol,
+            atol,
+            profiles_chunk_size,
+        )
+
+    return ResultsComparison(
+        outputs=comparisons,
+        only_in_a=trends_only_in_a + profiles_only_in_a,
+        only_in_b=trends_only_in_b + profiles_only_in_b,
+    )
+
+
+def _output_match_key(output_metadata: Mapping[str, Any]) -> OutputMatchKey:
+    return (
+        output_metadata["property_id"],
+        output_metadata.get("network_element_name"),
+        output_metadata.get("position"),
+    )
+
+
+def _match_outputs(
+    outputs_a: Mapping[OutputKeyType, Any],
+    outputs_b: Mapping[OutputKeyType, Any],
+    keys: list[OutputKeyType] | None,
+) -> tuple[
+    list[tuple[OutputKeyType, OutputKeyType]], list[OutputKeyType], list[OutputKeyType]
+]:
+    """
+    Match the outputs of two results (outputs with the same match key are matched in order).
+
+    :param keys:
+        Restrict the outputs of the first results to these.
+
+    :return:
+        - the pairs of matched output keys;
+        - the output keys only in the first results;
+        - the output keys only in the second results (only when `keys` is `None`);
+    """
+    grouped_a: dict[OutputMatchKey, list[OutputKeyType]] = {}
+    for key, output_metadata in outputs_a.items():
+        if keys is None or key in keys:
+            grouped_a.setdefault(_output_match_key(output_metadata), []).append(key)
+    grouped_b: dict[OutputMatchKey, list[OutputKeyType]] = {}
+    for key, output_metadata in outputs_b.items():
+        grouped_b.setdefault(_output_match_key(output_metadata), []).append(key)
+
+    pairs = []
+    only_in_a = []
+    only_in_b = []
+    for match_key in grouped_a.keys() | grouped_b.keys():
+        for key_a, key_b in zip_longest(
+            grouped_a.get(match_key, []), grouped_b.get(match_key, [])
+        ):
+            if key_a is None:
+                if keys is None:
+                    only_in_b.append(key_b)
+            elif key_b is None:
+                only_in_a.append(key_a)
+            else:
+                pairs.append((key_a, key_b))
+
+    order_a = {key: i for i, key in enumerate(outputs_a)}
+    order_b = {key: i for i, key in enumerate(outputs_b)}
+    pairs.sort(key=lambda pair: order_a[pair[0]])
+    only_in_a.sort(key=order_a.__getitem__)
+    only_in_b.sort(key=order_b.__getitem__)
+    return pairs, only_in_a, only_in_b
+
+
+class _OutputComparator:
+    """
+    Compare an output given in chunks of time steps, which may be split differently for each
+    results (the time steps not compared yet are kept until the other results reach them).
+    """
+
+    def __init__(
+        self,
+        kind: OutputKind,
+        key_a: OutputKeyType,
+        key_b: OutputKeyType,
+        size_a: int,
+        size_b: int,
+        rtol: float,
+        atol: float,
+    ) -> None:
+        self.kind = kind
+        self.key_a = key_a
+        self.key_b = key_b
+        self.size_a = size_a
+        self.size_b = size_b
+        self.rtol = rtol
+        self.atol = atol
+        self.compared = 0
+        self.mismatch_index: int | None = None
+        self.max_deviation = 0.0
+        self.max_deviation_index: int | None = None
+        self.max_deviation_point: int | None = None
+        self._pending_a: np.ndarray | None = None
+        self._pending_b: np.ndarray | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.mismatch_index is None and self.compared < min(
+            self.size_a, self.size_b
+        )
+
+    def feed(self, values_a: np.ndarray | None, values_b: np.ndarray | None) -> None:
+        if not self.active:
+            return
+        pending_a = _append(self._pending_a, values_a)
+        pending_b = _append(self._pending_b, values_b)
+        if pending_a is None or pending_b is None:
+            self._pending_a, self._pending_b = pending_a, pending_b
+            return
+        count = min(len(pending_a), len(pending_b))
+        self._compare(pending_a[:count], pending_b[:count])
+        self._pending_a = pending_a[count:]
+        self._pending_b = pending_b[count:]
+
+    def _compare(self, values_a: np.ndarray, values_b: np.ndarray) -> None:
+        if len(values_a) == 0:
+            return
+        if values_a.shape != values_b.shape:
+            self.mismatch_index = self.compared
+            return
+
+        with np.errstate(invalid="ignore"):
+            deviation = np.abs(
+                values_a.astype(np.float64, copy=False)
+                - values_b.astype(np.float64, copy=False)
+            )
+        nan_a = np.isnan(values_a)
+        nan_b = np.isnan(values_b)
+        deviation[nan_a & nan_b] = 0.0
+        deviation[nan_a ^ nan_b] = np.inf
+
+        position = np.unravel_index(int(np.argmax(deviation)), deviation.shape)
+        if self.max_deviation_index is None or deviation[position] > self.max_deviation:
+            self.max_deviation = float(deviation[position])
+            self.max_deviation_index = self.compared + int(position[0])
+            if self.kind == "profile":
+                self.max_deviation_point = int(position[1])
+
+        close = np.isclose(
+            values_a, values_b, rtol=self.rtol, atol=self.atol, equal_nan=True
+        )
+        if not close.all():
+            rows_close = close.reshape(len(close), -1).all(axis=1)
+            self.mismatch_index = self.compared + int(np.argmin(rows_close))
+        self.compared += len(values_a)
+
+    def result(self) -> OutputComparison:
+        mismatch_index = self.mismatch_index
+        if mismatch_index is None and self.size_a != self.size_b:
+            mismatch_index = min(self.size_a, self.size_b)
+        return OutputComparison(
+            kind=self.kind,
+            key_a=self.key_a,
+            key_b=self.key_b,
+            size_a=self.size_a,
+            size_b=self.size_b,
+            compared=self.compared,
+            mismatch_index=mismatch_index,
+            max_deviation=self.max_deviation,
+            max_deviation_index=self.max_deviation_index,
+            max_deviation_point=self.max_deviation_point,
+        )
+
+
+def _append(pending: np.ndarray | None, values: np.ndarray | None) -> np.ndarray | None:
+    if values is None:
+        return pending
+    if pending is None or len(pending) == 0:
+        return values
+    return np.concatenate([pending, values])
+
+
+def _trends_sizes(metadata: ALFASimResultMetadata) -> dict[OutputKeyType, int]:
+    output_keys, selections = _select_trends_in_files(metadata, None, None, None)
+    sizes = dict.fromkeys(output_keys, 0)
+    for _, start_index, stop_index, keys_in_file, _ in selections:
+        for trend_key in keys_in_file:
+            sizes[trend_key] += stop_index - start_index
+    return sizes
+
+
+def _compare_trends(
+    result_directory_a: Path,
+    metadata_a: ALFASimResultMetadata,
+    result_directory_b: Path,
+    metadata_b: ALFASimResultMetadata,
+    pairs: list[tuple[OutputKeyType, OutputKeyType]],
+    rtol: float,
+    atol: float,
+    chunk_size: int,
+) -> list[OutputComparison]:
+    """
+    Compare the trends reading the same range of time steps of each results at once (a single
+    read for each result file, with all trends not compared yet).
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk_size ({chunk_size})")
+    sizes_a = _trends_sizes(metadata_a)
+    sizes_b = _trends_sizes(metadata_b)
+    comparators = [
+        _OutputComparator(
+            "trend", key_a, key_b, sizes_a[key_a], sizes_b[key_b], rtol, atol
+        )
+        for key_a, key_b in pairs
+    ]
+
+    first_a, last_a = metadata_a.trends_time_steps_boundaries
+    first_b, last_b = metadata_b.trends_time_steps_boundaries
+    with (
+        open_result_files(result_directory_a) as result_files_a,
+        open_result_files(result_directory_b) as result_files_b,
+    ):
+        start = 0
+        while start < max(last_a - first_a, last_b - first_b):
+            active = [comparator for comparator in comparators if comparator.active]
+            if len(active) == 0:
+                break
+            data_a = _read_trends_data(
+                metadata_a,
+                [comparator.key_a for comparator in active],
+                min(first_a + start, last_a),
+                min(first_a + start + chunk_size, last_a),
+                result_files=result_files_a,
+            )
+            data_b = _read_trends_data(
+                metadata_b,
+                [comparator.key_b for comparator in active],
+                min(first_b + start, last_b),
+                min(first_b + start + chunk_size, last_b),
+                result_files=result_files_b,
+            )
+            for comparator in active:
+                comparator.feed(data_a[comparator.key_a], data_b[comparator.key_b])
+            start += chunk_size
+
+    return [comparator.result() for comparator in comparators]
+
+
+def _compare_profiles(
+    result_directory_a: Path,
+    metadata_a: ALFASimResultMetadata,
+    result_directory_b: Path,
+    metadata_b: ALFASimResultMetadata,
+    pairs: list[tuple[OutputKeyType, OutputKeyType]],
+    rtol: float,
+    atol: float,
+    chunk_size: int,
+) -> list[OutputComparison]:
+    """
+    Compare the profiles, reading chunks of time steps of each profile from both results.
+    """
+    comparisons = []
+    with (
+        open_result_files(result_directory_a) as result_files_a,
+        open_result_files(result_directory_b) as result_files_b,
+    ):
+        for key_a, key_b in pairs:
+            comparator = _OutputComparator(
+                "profile",
+                key_a,
+                key_b,
+                _profile_size(metadata_a, key_a),
+                _profile_size(metadata_b, key_b),
+                rtol,
+                atol,
+            )
+            chunks_a = _iter_profile_values(
+                result_files_a, metadata_a, key_a, chunk_size
+            )
+            chunks_b = _iter_profile_values(
+                result_files_b, metadata_b, key_b, chunk_size
+            )
+            for values_a, values_b in zip_longest(chunks_a, chunks_b):
+                comparator.feed(values_a, values_b)
+                if not comparator.active:
+                    break
+            comparisons.append(comparator.result())
+    return comparisons
+
+
+def _profile_size(metadata: ALFASimResultMetadata, profile_key: OutputKeyType) -> int:
+    # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+    time_set_info = metadata.time_set_info[PROFILES_GROUP_NAME]  # type:ignore[index]
+    return sum(
+        time_set_info[base_ts].size
+        for base_ts in metadata.profiles[profile_key]["time_set_key"]
+    )
+
+
+def _iter_profile_values(
+    result_files: dict[int, Any],
+    metadata: ALFASimResultMetadata,
+    profile_key: OutputKeyType,
+    chunk_size: int,
+) -> Iterator[np.ndarray]:
+    for _, _, _, values in _iter_profile_chunks(
+        result_files, metadata, profile_key, None, None, chunk_size=chunk_size
+    ):
+        yield values
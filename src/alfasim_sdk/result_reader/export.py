@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    TimeSetKeyType,
+    _read_trends_columns,
+    _select_trends_in_files,
+    open_result_files,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    TIME_SET_DSET_NAME,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.instrumentation import _instrumented, _read_dataset
+
+if TYPE_CHECKING:
+    import pyarrow
+
+ExportFormat = Literal["parquet", "arrow"]
+
+TIME_COLUMN_NAME = "time"
+
+_EXPORT_ROW_GROUP_SIZE = 65536
+"""\
+The default number of time steps of each row group (record batch) exported.
+"""
+
+_TREND_FIELD_METADATA_EXCLUDED = frozenset(["index", "time_set_key"])
+
+
+@_instrumented
+def export_trends(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_directory: Path,
+    output_keys: list[OutputKeyType] | None = None,
+    *,
+    file_format: ExportFormat = "parquet",
+    row_group_size: int = _EXPORT_ROW_GROUP_SIZE,
+) -> dict[TimeSetKeyType, Path]:
+    """
+    Export trends to Apache Parquet or Arrow IPC files, one file (table) for each time set.
+
+    The trends are streamed from the result files straight into Arrow arrays, one row group
+    at a time, so the memory used is bounded by the row group size (and not by the size of the
+    results). Requires `pyarrow`.
+
+    Each table has a `time` column and a column for each trend (named by the output key),
+    the trend metadata (`property_id`, `unit`, `category`, `network_element_name`, `position`,
+    ...) is stored in the metadata of the column (see `trends_arrow_schemas`).
+
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param result_metadata:
+        The metadata for the results, the trends time step boundaries are exported.
+
+    :param output_directory:
+        The directory where the files are written (`trends_<base time steps>.parquet` or
+        `.arrow`), it is created if needed.
+
+    :param output_keys:
+        Must be trends output ids. Default to ALL trends found in `result_metadata`.
+
+    :param file_format:
+        "parquet" for Apache Parquet files or "arrow" for Arrow IPC files.
+
+    :param row_group_size:
+        The (maximum) number of time steps of each row group.
+
+    :return:
+        The file written for each time set.
+    """
+    if file_format not in ("parquet", "arrow"):
+        raise ValueError(f"Invalid export format ({file_format!r})")
+    pa = _import_pyarrow()
+
+    output_directory.mkdir(parents=True, exist_ok=True)
+    exported = {}
+    for time_set_key, schema in trends_arrow_schemas(
+        result_metadata, output_keys
+    ).items():
+        suffix = "_".join(str(base_ts) for base_ts in time_set_key)
+        filename = output_directory / f"trends_{suffix}.{file_format}"
+        batches = iter_trends_record_batches(
+            result_directory,
+            result_metadata,
+            schema,
+            row_group_size=row_group_size,
+        )
+        if file_format == "parquet":
+            import pyarrow.parquet
+
+            with pyarrow.parquet.ParquetWriter(filename, schema) as parquet_writer:
+                for batch in batches:
+                    parquet_writer.write_batch(batch, row_group_size=row_group_size)
+        else:
+            with pa.ipc.new_file(filename, schema) as ipc_writer:
+                for batch in batches:
+                    ipc_writer.write_batch(batch)
+        exported[time_set_key] = filename
+    return exported
+
+
+def trends_arrow_schemas(
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None = None,
+) -> dict[TimeSetKeyType, pyarrow.Schema]:
+    """
+    :param output_keys:
+        Must be trends output ids. Default to ALL trends found in `result_metadata`.
+
+    :return:
+        The Arrow schema of the table of each time set: a `time` column and a column for each
+        trend, with the trend metadata as the column metadata (values that are not strings are
+        JSON encoded). The time set key is stored in the schema metadata (`time_set_key`).
+    """
+    pa = _import_pyarrow()
+    if output_keys is None:
+        output_keys = list(result_metadata.trends)
+
+    trend_keys_by_time_set: dict[TimeSetKeyType, list[OutputKeyType]] = {}
+    for trend_key in dict.fromkeys(output_keys):
+        time_set_key = tuple(result_metadata.trends[trend_key]["time_set_key"])
+        trend_keys_by_time_set.setdefault(time_set_key, []).append(trend_key)
+
+    schemas = {}
+    for time_set_key, trend_keys in trend_keys_by_time_set.items():
+        fields = [
+            pa.field(TIME_COLUMN_NAME, pa.float64(), nullable=False),
+            *(
+                pa.field(
+                    trend_key,
+                    pa.float64(),
+                    metadata=_encode_field_metadata(result_metadata.trends[trend_key]),
+                )
+                for trend_key in trend_keys
+            ),
+        ]
+        schemas[time_set_key] = pa.schema(
+            fields, metadata={"time_set_key": json.dumps(list(time_set_key))}
+        )
+    return schemas
+
+
+def iter_trends_record_batches(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    schema: pyarrow.Schema,
+    *,
+    row_group_size: int = _EXPORT_ROW_GROUP_SIZE,
+) -> Iterator[pyarrow.RecordBatch]:
+    """
+    Read the trends of a time set in record batches of at most `row_group_size` time steps
+    (one read of all the trends for each batch).
+
+    :param schema:
+        The schema of the time set table (see `trends_arrow_schemas`).
+    """
+    if row_group_size < 1:
+        raise ValueError(f"Invalid row_group_size ({row_group_size})")
+    pa = _import_pyarrow()
+
+    trend_keys = [name for name in schema.names if name != TIME_COLUMN_NAME]
+    with open_result_files(result_directory) as result_files:
+        _, selections = _select_trends_in_files(
+            result_metadata, trend_keys, None, None, result_files=result_files
+        )
+        for base_ts, start_index, stop_index, keys_in_file, columns in selections:
+            if keys_in_file != trend_keys:  # pragma: no cover
+                raise RuntimeError(
+                    f"Result file {base_ts} does not have all trends of the time set"
+                )
+            group = result_files[base_ts][TRENDS_GROUP_NAME]
+            for chunk_start in range(start_index, stop_index, row_group_size):
+                chunk_stop = min(chunk_start + row_group_size, stop_index)
+                data, data_columns = _read_trends_columns(
+                    group["trends"], chunk_start, chunk_stop, columns
+                )
+                time = _read_dataset(
+                    group[TIME_SET_DSET_NAME], slice(chunk_start, chunk_stop)
+                )
+                yield pa.record_batch(
+                    [
+                        pa.array(time, type=pa.float64()),
+                        *(
+                            pa.array(data[:, data_column], type=pa.float64())
+                            for data_column in data_columns
+                        ),
+                    ],
+                    schema=schema,
+                )
+
+
+def _encode_field_metadata(trend_metadata: Any) -> dict[str, str]:
+    return {
+        name: value if isinstance(value, str) else json.dumps(value)
+        for name, value in trend_metadata.items()
+        if name not in _TREND_FIELD_METADATA_EXCLUDED and value is not None
+    }
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("Exporting results requires `pyarrow` to be installed") from e
+    return pyarrow
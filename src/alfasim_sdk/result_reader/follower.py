@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import dataclasses
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    ResultsNeedFullReloadError,
+    SourceTimeSetKeyType,
+    TimeSetInfoItem,
+    _is_result_file_being_written,
+    _list_result_files,
+    concatenate_metadata,
+    keep_result_files_open,
+    read_metadata,
+    read_profiles_range,
+    read_time_sets,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    PROFILES_GROUP_NAME,
+    RESULT_FILE_PREFIX,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ResultsDelta:
+    """
+    The results appended since the last poll of a `ResultsFollower`.
+
+    :ivar metadata:
+        The metadata of the new time steps, its time step boundaries are the appended range.
+
+    :ivar time_sets:
+        The new time step values of each time set.
+
+    :ivar trends:
+        The new samples of the followed trends.
+
+    :ivar profiles:
+        The new time steps of the followed profiles, as arrays of shape
+        `(number of time steps, number of points)`. `None` when the profile has no data
+        in some of the result files (see `read_profiles_range`).
+
+    :ivar reset:
+        If `True` the results were truncated (a simulation restart) and the delta contains
+        the whole results, any data collected from former deltas must be discarded.
+    """
+
+    metadata: ALFASimResultMetadata
+    time_sets: dict[SourceTimeSetKeyType, np.ndarray]
+    trends: dict[OutputKeyType, np.ndarray]
+    profiles: dict[OutputKeyType, np.ndarray | None]
+    reset: bool = False
+
+
+class ResultsFollower:
+    """
+    Follow the results of a running simulation, reading only the data appended since the
+    last poll.
+
+    Poll explicitly:
+
+        follower = ResultsFollower(result_directory)
+        delta = follower.poll()  # `None` if nothing new.
+
+    Or iterate until the simulation finishes (`async for` is also supported):
+
+        for delta in ResultsFollower(result_directory, poll_interval=2.0):
+            if delta.reset:
+                clear_plots()
+            update_plots(delta.time_sets, delta.trends)
+
+    :param result_directory:
+        The directory where the result files are written.
+
+    :param trend_keys:
+        The trends to read. Default to ALL trends.
+
+    :param profile_keys:
+        The profiles to read. Default to ALL profiles.
+
+    :param poll_interval:
+        The time (in seconds) to wait between polls when iterating.
+
+    :param stop_when_finished:
+        If `True` the iteration stops when there is no writer for the result files anymore.
+    """
+
+    def __init__(
+        self,
+        result_directory: Path,
+        *,
+        trend_keys: Iterable[OutputKeyType] | None = None,
+        profile_keys: Iterable[OutputKeyType] | None = None,
+        poll_interval: float = 1.0,
+        stop_when_finished: bool = True,
+    ) -> None:
+        self.result_directory = result_directory
+        self.trend_keys = None if trend_keys is None else list(trend_keys)
+        self.profile_keys = None if profile_keys is None else list(profile_keys)
+        self.poll_interval = poll_interval
+        self.stop_when_finished = stop_when_finished
+        self._metadata: ALFASimResultMetadata | None = None
+
+    @property
+    def metadata(self) -> ALFASimResultMetadata | None:
+        """
+        The metadata of all the results read so far (`None` before the first poll).
+        """
+        return self._metadata
+
+    def poll(self) -> ResultsDelta | None:
+        """
+        Read the results appended since the last poll.
+
+        :return:
+            The new results, or `None` if there is nothing new.
+        """
+        with keep_result_files_open(self.result_directory):
+            reset = False
+            previous_metadata = self._metadata
+            if previous_metadata is None:
+                metadata = read_metadata(self.result_directory)
+            else:
+                initial_profiles_index, initial_trends_index = (
+                    previous_metadata.time_steps_boundaries[1]
+                )
+                try:
+                    metadata = read_metadata(
+                        self.result_directory,
+                        initial_profiles_time_step_index=initial_profiles_index,
+                        initial_trends_time_step_index=initial_trends_index,
+                        previous_time_set_info=previous_metadata.time_set_info,
+                    )
+                except ResultsNeedFullReloadError:
+                    metadata = read_metadata(self.result_directory)
+                    reset = True
+
+            initial_index, final_index = metadata.time_steps_boundaries
+            if initial_index == final_index and not reset:
+                return None
+
+            delta = ResultsDelta(
+                metadata=metadata,
+                time_sets=read_time_sets(self.result_directory, metadata),
+                trends=self._read_trends(metadata),
+                profiles=self._read_profiles(metadata),
+                reset=reset,
+            )
+
+        # `concatenate_metadata` updates the metadata items in place, so keep a copy
+        # to not change the metadata already handed out.
+        if previous_metadata is None or reset:
+            self._metadata = copy.deepcopy(metadata)
+        else:
+            self._metadata = concatenate_metadata(
+                previous_metadata, _copy_new_items(previous_metadata, metadata)
+            )
+        return delta
+
+    def is_finished(self) -> bool:
+        """
+        Check if the simulation finished writing the results (there are result files and
+        none of them is being written).
+        """
+        if not self.result_directory.is_dir():
+            return False
+        if any(self.result_directory.glob(RESULT_FILE_PREFIX + "*.creating")):
+            return False
+        result_files = _list_result_files(self.result_directory)
+        return len(result_files) > 0 and not any(
+            _is_result_file_being_written(filename)
+            for filename in result_files.values()
+        )
+
+    def __iter__(self) -> Iterator[ResultsDelta]:
+        while True:
+            # Check before polling, so the data written before finishing is not missed.
+            finished = self.stop_when_finished and self.is_finished()
+            delta = self.poll()
+            if delta is not None:
+                yield delta
+            if finished:
+                return
+            time.sleep(self.poll_interval)
+
+    async def __aiter__(self) -> AsyncIterator[ResultsDelta]:
+        while True:
+            finished = self.stop_when_finished and await asyncio.to_thread(
+                self.is_finished
+            )
+            delta = await asyncio.to_thread(self.poll)
+            if delta is not None:
+                yield delta
+            if finished:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    def _read_trends(
+        self, metadata: ALFASimResultMetadata
+    ) -> dict[OutputKeyType, np.ndarray]:
+        keys = _filter_keys(self.trend_keys, metadata.trends)
+        if len(keys) == 0:
+            return {}
+        return read_trends_data(self.result_directory, metadata, keys)
+
+    def _read_profiles(
+        self, metadata: ALFASimResultMetadata
+    ) -> dict[OutputKeyType, np.ndarray | None]:
+        initial_index, final_index = metadata.profile_time_steps_boundaries
+        # Invalid index type "str" for "dict[Literal['profiles', 'trends'], dict[int, TimeSetInfoItem]]"; expected type "Literal['profiles', 'trends']"  [index]
+        time_set_info = metadata.time_set_info.get(PROFILES_GROUP_NAME, {})  # type:ignore[call-overload]
+
+        profiles: dict[OutputKeyType, np.ndarray | None] = {}
+        for profile_key in _filter_keys(self.profile_keys, metadata.profiles):
+            time_set_key = metadata.profiles[profile_key]["time_set_key"]
+            profiles.update(
+                read_profiles_range(
+                    self.result_directory,
+                    metadata,
+                    [profile_key],
+                    _to_time_set_key_index(time_set_info, time_set_key, initial_index),
+                    _to_time_set_key_index(time_set_info, time_set_key, final_index),
+                )
+            )
+        return profiles
+
+
+def _filter_keys(
+    keys: list[OutputKeyType] | None, available: Iterable[OutputKeyType]
+) -> list[OutputKeyType]:
+    if keys is None:
+        return list(available)
+    available = set(available)
+    return [key for key in keys if key in available]
+
+
+def _to_time_set_key_index(
+    time_set_info: dict[int, TimeSetInfoItem],
+    time_set_key: tuple[int, ...],
+    global_index: int,
+) -> int:
+    """
+    Convert a global profile time step index to the index used by the profile readers,
+    which counts only the time steps stored in the files of the profile time set key.
+    """
+    return sum(
+        min(
+            max(global_index - time_set_info[base_ts].global_start, 0),
+            time_set_info[base_ts].size,
+        )
+        for base_ts in time_set_key
+    )
+
+
+def _copy_new_items(
+    previous_metadata: ALFASimResultMetadata, metadata: ALFASimResultMetadata
+) -> ALFASimResultMetadata:
+    """
+    Return `metadata` with copies of the items not in `previous_metadata`.
+
+    When concatenated the new items are taken as they are (and updated in place by the
+    next concatenations), the items already known are only read.
+    """
+    return dataclasses.replace(
+        metadata,
+        profiles={
+            key: item if key in previous_metadata.profiles else copy.deepcopy(item)
+            for key, item in metadata.profiles.items()
+        },
+        trends={
+            key: item if key in previous_metadata.trends else copy.deepcopy(item)
+            for key, item in metadata.trends.items()
+        },
+    )
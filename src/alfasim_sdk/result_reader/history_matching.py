@@ -0,0 +1,255 @@
+"""
+Vectorized analysis of History Matching results: the posterior statistics of the parametric vars
+(probabilistic analysis) and the misfit between simulated trends and the historic data curves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import attr
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    HistoryMatchingMetadata,
+    HMOutputKey,
+    OutputKeyType,
+    _column_histograms,
+    open_result_file,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    HISTORY_MATCHING_GROUP_NAME,
+    HISTORY_MATCHING_PROBABILISTIC_DSET_NAME,
+)
+from alfasim_sdk.result_reader.instrumentation import _instrumented, _read_dataset
+
+MISFIT_NORMS = ("l1", "l2", "rms", "max")
+
+DEFAULT_POSTERIOR_QUANTILES = (0.1, 0.5, 0.9)
+
+
+@attr.s(frozen=True, eq=False)
+class HMPosterior:
+    """
+    The posterior samples of all the parametric vars of a probabilistic History Matching
+    analysis, see `read_history_matching_posterior`.
+
+    :ivar keys:
+        The parametric vars, in the order of the samples columns.
+
+    :ivar samples:
+        The samples, an array with shape `(number of samples, len(keys))`.
+
+    :ivar min_values:
+        The lower limit of the specified range of each parametric var.
+
+    :ivar max_values:
+        The upper limit of the specified range of each parametric var.
+
+    :ivar key_indexes:
+        The column of each parametric var in the samples.
+    """
+
+    keys: list[HMOutputKey] = attr.ib()
+    samples: np.ndarray = attr.ib()
+    min_values: np.ndarray = attr.ib()
+    max_values: np.ndarray = attr.ib()
+    key_indexes: dict[HMOutputKey, int] = attr.ib()
+
+    def __getitem__(self, key: HMOutputKey) -> np.ndarray:
+        """
+        :return:
+            The samples of a parametric var.
+        """
+        return self.samples[:, self.key_indexes[key]]
+
+    def mean(self) -> np.ndarray:
+        return self.samples.mean(axis=0)
+
+    def std(self) -> np.ndarray:
+        return self.samples.std(axis=0)
+
+    def quantiles(
+        self, quantiles: Sequence[float] = DEFAULT_POSTERIOR_QUANTILES
+    ) -> np.ndarray:
+        """
+        :return:
+            The quantiles of each parametric var, an array with shape
+            `(len(quantiles), len(keys))`.
+        """
+        return np.quantile(self.samples, quantiles, axis=0)
+
+    def histograms(
+        self, bins: int = 10, *, prior_range: bool = True
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :param prior_range:
+            If `True` the bins span the specified range of each parametric var (see
+            `min_values` and `max_values`), otherwise the range of its samples.
+
+        :return:
+            The histogram (shape `(len(keys), bins)`) and the bin edges (shape
+            `(len(keys), bins + 1)`) of each parametric var.
+        """
+        value_range = (self.min_values, self.max_values) if prior_range else None
+        return _column_histograms(self.samples, bins, value_range)
+
+    def summary(
+        self, quantiles: Sequence[float] = DEFAULT_POSTERIOR_QUANTILES
+    ) -> dict[HMOutputKey, dict[str, float]]:
+        """
+        :return:
+            The mean, standard deviation and quantiles (`"p10"`, `"p50"`, ...) of each
+            parametric var.
+        """
+        statistics = {"mean": self.mean(), "std": self.std()}
+        for quantile, values in zip(quantiles, self.quantiles(quantiles), strict=True):
+            statistics[f"p{quantile * 100:g}"] = values
+        return {
+            key: {name: float(values[i]) for name, values in statistics.items()}
+            for i, key in enumerate(self.keys)
+        }
+
+
+@_instrumented
+def read_history_matching_posterior(
+    result_directory: Path, metadata: HistoryMatchingMetadata
+) -> HMPosterior | None:
+    """
+    Read the samples of all the parametric vars of a probabilistic History Matching analysis at
+    once.
+
+    :param result_directory:
+        The directory the provided metadata was read.
+
+    :param metadata:
+        History Matching result metadata.
+
+    :return:
+        The posterior samples, `None` if there are no probabilistic results.
+    """
+    with open_result_file(result_directory) as result_file:
+        if not result_file:
+            return None
+
+        dset = result_file[HISTORY_MATCHING_GROUP_NAME].get(
+            HISTORY_MATCHING_PROBABILISTIC_DSET_NAME
+        )
+        if dset is None:
+            return None
+        result = _read_dataset(dset, ())
+
+    items = metadata.hm_items
+    return HMPosterior(
+        keys=list(items),
+        key_indexes={key: i for i, key in enumerate(items)},
+        samples=result[:, [meta.data_index for meta in items.values()]],
+        min_values=np.array([meta.min_value for meta in items.values()], dtype=float),
+        max_values=np.array([meta.max_value for meta in items.values()], dtype=float),
+    )
+
+
+def compute_history_matching_misfits(
+    metadata: HistoryMatchingMetadata,
+    historic_data_curves: Mapping[str, np.ndarray],
+    simulated_trends: Mapping[OutputKeyType, tuple[np.ndarray, np.ndarray]],
+    norms: Sequence[str] = ("rms",),
+) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Compute the misfit between simulated trends and the historic data curves of a History
+    Matching analysis (the objective functions of the metadata).
+
+    The simulated trends are linearly interpolated at the domain values of each historic
+    curve (like `np.interp`, values outside the simulated time are the first or last values),
+    then the norms of the residuals (simulated - observed) are computed. Many simulations
+    (realizations) of a trend can be given at once, as an array with the time in the last
+    axis:
+
+    .. code-block:: python
+
+        time_sets = read_time_sets(result_directory, result_metadata)
+        trends = read_trends_data(result_directory, result_metadata, trend_keys)
+        simulated_trends = {
+            key: (
+                time_sets["trend_id", result_metadata.trends[key]["time_set_key"]],
+                values,
+            )
+            for key, values in trends.items()
+        }
+        misfits = compute_history_matching_misfits(
+            hm_metadata,
+            read_history_matching_historic_data_curves(hm_directory, hm_metadata),
+            simulated_trends,
+            norms=["rms", "max"],
+        )
+
+    :param historic_data_curves:
+        The historic data curves (see `read_history_matching_historic_data_curves`), the
+        domain must be in the same unit of the simulated time.
+
+    :param simulated_trends:
+        The time and the values of the simulated trends (`"<property_id>@<trend_id>"`) of
+        the objective functions. The values can have any number of leading axes.
+
+    :param norms:
+        The misfit norms to compute: `"l1"` (sum of absolute residuals), `"l2"` (euclidean
+        norm), `"rms"` (root mean square) and `"max"` (maximum absolute residual).
+
+    :return:
+        The misfit norms of each historic data curve, with the shape of the leading axes of
+        the simulated trend values.
+    """
+    invalid_norms = sorted(set(norms).difference(MISFIT_NORMS))
+    if invalid_norms:
+        raise ValueError(
+            f"Invalid misfit norms: {', '.join(invalid_norms)} (valid: {', '.join(MISFIT_NORMS)})"
+        )
+
+    result: dict[str, dict[str, np.ndarray]] = {}
+    for curve_id, curve in historic_data_curves.items():
+        objective_function = metadata.objective_functions[curve_id]
+        trend_key = (
+            f"{objective_function['property_id']}@{objective_function['trend_id']}"
+        )
+        if trend_key not in simulated_trends:
+            raise ValueError(
+                f"No simulated trend {trend_key} for the historic data curve {curve_id}"
+            )
+        time, values = simulated_trends[trend_key]
+        observed, domain = curve
+        residuals = _interpolate_trends(time, values, domain) - observed
+        result[curve_id] = {norm: _misfit_norm(residuals, norm) for norm in norms}
+    return result
+
+
+def _interpolate_trends(
+    time: np.ndarray, values: np.ndarray, x: np.ndarray
+) -> np.ndarray:
+    """
+    Linearly interpolate the trends `values` (time in the last axis) at `x`, the same as
+    `np.interp` for each trend.
+    """
+    time = np.asarray(time, dtype=float)
+    values = np.asarray(values)
+    x = np.clip(np.asarray(x, dtype=float), time[0], time[-1])
+    if len(time) == 1:
+        return np.repeat(values, len(x), axis=-1)
+
+    right = np.clip(np.searchsorted(time, x, side="right"), 1, len(time) - 1)
+    left = right - 1
+    delta = time[right] - time[left]
+    weight = np.divide(x - time[left], delta, out=np.zeros_like(x), where=delta != 0.0)
+    return values[..., left] * (1.0 - weight) + values[..., right] * weight
+
+
+def _misfit_norm(residuals: np.ndarray, norm: str) -> np.ndarray:
+    if norm == "l1":
+        return np.abs(residuals).sum(axis=-1)
+    elif norm == "l2":
+        return np.sqrt(np.square(residuals).sum(axis=-1))
+    elif norm == "rms":
+        return np.sqrt(np.square(residuals).mean(axis=-1))
+    else:
+        assert norm == "max"
+        return np.abs(residuals).max(axis=-1)
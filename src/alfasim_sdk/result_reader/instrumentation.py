@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+import h5py
+import numpy as np
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+FILES_OPENED = "files_opened"
+HYPERSLAB_READS = "hyperslab_reads"
+ELEMENTS_READ = "elements_read"
+BYTES_READ = "bytes_read"
+JSON_BYTES_PARSED = "json_bytes_parsed"
+
+_active_recorder: InstrumentationRecorder | None = None
+_active_recorder_lock = threading.Lock()
+
+
+class InstrumentationRecorder:
+    """
+    Records counters and timings of the result reader (see `record_instrumentation`).
+
+    The counters are:
+
+    - `files_opened`: the result files opened;
+    - `hyperslab_reads`, `elements_read` and `bytes_read`: the reads of HDF5 data sets, also
+      recorded for each data set (by name);
+    - `json_bytes_parsed`: the size of the JSON metadata parsed.
+
+    The counters recorded during a public call of the result reader (`read_metadata`,
+    `read_trends_data`, ...) are also recorded for that call (nested public calls count for
+    the outermost call). Timings are recorded for the public calls and for the internal steps
+    of interest (`_read_global_metadata`, `read_time_set_info`, data reads, ...).
+
+    The recorder can be used from many threads, but reads done by worker processes
+    (`workers` argument) are not recorded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+        self._counters: dict[str, int] = {}
+        self._datasets: dict[str, dict[str, int]] = {}
+        self._timings: dict[str, dict[str, int]] = {}
+        self._calls: dict[str, dict[str, Any]] = {}
+        self._events: list[dict[str, Any]] = []
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increment the counter `name` (and the counter of the public call in progress).
+        """
+        call_counters = getattr(self._local, "call_counters", None)
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+            if call_counters is not None:
+                call_counters[name] = call_counters.get(name, 0) + value
+
+    def count_dataset_read(self, dataset_name: str, data: np.ndarray) -> None:
+        """
+        Count a read (one hyperslab selection) of the data set `dataset_name`.
+        """
+        call_counters = getattr(self._local, "call_counters", None)
+        counts = {HYPERSLAB_READS: 1, ELEMENTS_READ: data.size, BYTES_READ: data.nbytes}
+        with self._lock:
+            dataset_counters = self._datasets.setdefault(
+                dataset_name, dict.fromkeys(counts, 0)
+            )
+            for name, value in counts.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+                dataset_counters[name] += value
+                if call_counters is not None:
+                    call_counters[name] = call_counters.get(name, 0) + value
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the code executed in the context as `name`.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._add_timing(name, start_ns, time.perf_counter_ns(), "span", None)
+
+    @contextmanager
+    def call(self, name: str) -> Iterator[None]:
+        """
+        Time a public call `name` and record the counters incremented (in this thread)
+        during the call. Nested calls are timed but their counters count for the outermost
+        call.
+        """
+        if getattr(self._local, "call_counters", None) is not None:
+            with self.span(name):
+                yield
+            return
+
+        call_counters: dict[str, int] = {}
+        self._local.call_counters = call_counters
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            stop_ns = time.perf_counter_ns()
+            self._local.call_counters = None
+            self._add_timing(name, start_ns, stop_ns, "call", call_counters)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return:
+            The recorded data, a dict with:
+
+            - `counters`: the total of each counter;
+            - `datasets`: the read counters of each data set;
+            - `timings`: the `count`, `total` and `max` (seconds) of each timing;
+            - `calls`: the `count`, `total` (seconds) and `counters` of each public call.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "datasets": {
+                    name: dict(counters) for name, counters in self._datasets.items()
+                },
+                "timings": {
+                    name: {
+                        "count": timing["count"],
+                        "total": timing["total_ns"] / 1e9,
+                        "max": timing["max_ns"] / 1e9,
+                    }
+                    for name, timing in self._timings.items()
+                },
+                "calls": {
+                    name: {
+                        "count": call["count"],
+                        "total": call["total_ns"] / 1e9,
+                        "counters": dict(call["counters"]),
+                    }
+                    for name, call in self._calls.items()
+                },
+            }
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """
+        :return:
+            The recorded timings as Chrome trace events (complete events, the counters of the
+            public calls are in the event `args`), viewable in `chrome://tracing` or Perfetto.
+        """
+        with self._lock:
+            events = [dict(event) for event in self._events]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, filename: Path) -> None:
+        """
+        Write the Chrome trace events (see `as_chrome_trace`) to a JSON file.
+        """
+        filename.write_text(json.dumps(self.as_chrome_trace()), encoding="utf-8")
+
+    def _add_timing(
+        self,
+        name: str,
+        start_ns: int,
+        stop_ns: int,
+        category: str,
+        call_counters: dict[str, int] | None,
+    ) -> None:
+        duration_ns = stop_ns - start_ns
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1e3,
+            "dur": duration_ns / 1e3,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if call_counters is not None:
+            event["args"] = dict(call_counters)
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {"count": 0, "total_ns": 0, "max_ns": 0}
+            )
+            timing["count"] += 1
+            timing["total_ns"] += duration_ns
+            timing["max_ns"] = max(timing["max_ns"], duration_ns)
+            if call_counters is not None:
+                call = self._calls.setdefault(
+                    name, {"count": 0, "total_ns": 0, "counters": {}}
+                )
+                call["count"] += 1
+                call["total_ns"] += duration_ns
+                for counter_name, value in call_counters.items():
+                    call["counters"][counter_name] = (
+                        call["counters"].get(counter_name, 0) + value
+                    )
+            self._events.append(event)
+
+
+@contextmanager
+def record_instrumentation() -> Iterator[InstrumentationRecorder]:
+    """
+    Record the counters and timings of the result reader calls done in the context, in any
+    thread (the instrumentation is disabled otherwise):
+
+    .. code-block:: python
+
+        with record_instrumentation() as recorder:
+            metadata = read_metadata(result_directory)
+            trends = read_trends_data(result_directory, metadata)
+        print(recorder.as_dict()["calls"]["read_trends_data"])
+        recorder.dump_chrome_trace(Path("trace.json"))
+    """
+    global _active_recorder
+    recorder = InstrumentationRecorder()
+    with _active_recorder_lock:
+        previous_recorder = _active_recorder
+        _active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        with _active_recorder_lock:
+            _active_recorder = previous_recorder
+
+
+def get_instrumentation_recorder() -> InstrumentationRecorder | None:
+    """
+    :return:
+        The recorder in use (see `record_instrumentation`), `None` when disabled.
+    """
+    return _active_recorder
+
+
+def _instrumented(function: Callable[_P, _R]) -> Callable[_P, _R]:
+    """
+    Record the calls of a public function of the result reader (when enabled).
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def instrumented_function(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        recorder = _active_recorder
+        if recorder is None:
+            return function(*args, **kwargs)
+        with recorder.call(name):
+            return function(*args, **kwargs)
+
+    return instrumented_function
+
+
+def _timed(function: Callable[_P, _R]) -> Callable[_P, _R]:
+    """
+    Record the time spent in an internal step of the result reader (when enabled).
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def timed_function(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        recorder = _active_recorder
+        if recorder is None:
+            return function(*args, **kwargs)
+        with recorder.span(name):
+            return function(*args, **kwargs)
+
+    return timed_function
+
+
+def _count(name: str, value: int = 1) -> None:
+    recorder = _active_recorder
+    if recorder is not None:
+        recorder.count(name, value)
+
+
+def _read_dataset(dset: h5py.Dataset | np.ndarray, selection: Any) -> np.ndarray:
+    """
+    Read `dset[selection]`, counting the read when `dset` is a HDF5 data set (when enabled).
+    """
+    data = dset[selection]
+    recorder = _active_recorder
+    if recorder is not None and isinstance(dset, h5py.Dataset):
+        recorder.count_dataset_read(dset.name, np.asarray(data))
+    return data
+
+
+def _parse_json(text: str | bytes) -> Any:
+    """
+    `json.loads`, counting the bytes parsed (when enabled).
+    """
+    recorder = _active_recorder
+    if recorder is not None:
+        size = len(text) if isinstance(text, bytes) else len(text.encode("utf-8"))
+        recorder.count(JSON_BYTES_PARSED, size)
+    return json.loads(text)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    _check_workers,
+    _map_in_processes,
+    keep_result_files_open,
+    read_metadata,
+    read_time_sets,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    MULTIPLE_RUNS_FOLDER,
+    RESULTS_FOLDER_NAME,
+)
+
+
+class MultipleRunsTrend(NamedTuple):
+    """
+    A trend of all runs, on a common time set.
+
+    :ivar time:
+        The time set, shared by all runs.
+
+    :ivar values:
+        The trend values, an array of shape `(number of runs, number of time steps)` (rows are
+        in the order of `MultipleRunsResults.run_ids`), `NaN` for the time steps a run does not
+        have.
+    """
+
+    time: np.ndarray
+    values: np.ndarray
+
+
+class MultipleRunsResults:
+    """
+    Reads the results of the runs of a multiple runs (parametric) simulation together.
+
+    Each run is a folder in the `multiple_runs` folder of the simulation data folder (named
+    by the run id), with the same layout of the simulation data folder:
+
+    .. code-block:: python
+
+        multiple_runs = MultipleRunsResults(data_folder)
+        trends = multiple_runs.read_trends([pressure_key])
+        # Shape (number of runs, number of samples).
+        pressure = trends[pressure_key].values
+
+    :param workers:
+        The size of the pool of processes used to read the runs metadata and data. Default
+        to the number of CPUs.
+
+    :param use_metadata_cache:
+        Keep the metadata of finished result files in a cache file (see `read_metadata`),
+        written in the results folder of each run.
+    """
+
+    def __init__(
+        self,
+        alfacase_data_folder: Path,
+        *,
+        workers: int | None = None,
+        use_metadata_cache: bool = False,
+    ) -> None:
+        self._data_folder = alfacase_data_folder
+        self._workers = _check_workers(os.cpu_count() if workers is None else workers)
+        self._use_metadata_cache = use_metadata_cache
+        self._run_ids: list[str] | None = None
+        self._metadata: dict[str, ALFASimResultMetadata] | None = None
+
+    @property
+    def data_folder(self) -> Path:
+        """
+        The data folder used to run the simulation.
+        """
+        return self._data_folder
+
+    @property
+    def runs_folder(self) -> Path:
+        return self._data_folder / MULTIPLE_RUNS_FOLDER
+
+    @property
+    def run_ids(self) -> list[str]:
+        """
+        The ids of the runs with results (numeric ids in numeric order).
+        """
+        if self._run_ids is None:
+            if self.runs_folder.is_dir():
+                run_ids = [
+                    run_folder.name
+                    for run_folder in self.runs_folder.iterdir()
+                    if (run_folder / RESULTS_FOLDER_NAME).is_dir()
+                ]
+            else:
+                run_ids = []
+            self._run_ids = sorted(run_ids, key=_run_id_sort_key)
+        return self._run_ids
+
+    def results_folder(self, run_id: str) -> Path:
+        return self.runs_folder / run_id / RESULTS_FOLDER_NAME
+
+    @property
+    def metadata(self) -> dict[str, ALFASimResultMetadata]:
+        """
+        The metadata of each run, read in parallel.
+        """
+        if self._metadata is None:
+            all_metadata = _map_in_processes(
+                _read_run_metadata,
+                [
+                    (self.results_folder(run_id), self._use_metadata_cache)
+                    for run_id in self.run_ids
+                ],
+                self._workers,
+            )
+            self._metadata = dict(zip(self.run_ids, all_metadata))
+        return self._metadata
+
+    def refresh(self) -> None:
+        """
+        Discard the runs found and their metadata, so they are read again on the next access.
+        """
+        self._run_ids = None
+        self._metadata = None
+
+    def read_trends(
+        self,
+        output_keys: list[OutputKeyType] | None = None,
+        *,
+        time: np.ndarray | None = None,
+    ) -> dict[OutputKeyType, MultipleRunsTrend]:
+        """
+        Read trends of all runs (each run is read by a worker process), stacked in arrays
+        of shape `(number of runs, number of samples)`.
+
+        :param output_keys:
+            Must be trends output ids. Default to ALL trends found in the runs.
+
+        :param time:
+            The common time set of the trends, the trends of each run are linearly
+            interpolated to it (`NaN` out of the run time range). If `None` the runs must
+            have the same time set.
+
+        :return:
+            The trend of all runs for the trends listed in `output_keys`.
+        """
+        all_metadata = self.metadata
+        if output_keys is None:
+            output_keys = list(
+                dict.fromkeys(
+                    trend_key
+                    for metadata in all_metadata.values()
+                    for trend_key in metadata.trends
+                )
+            )
+        runs_data = _map_in_processes(
+            _read_run_trends,
+            [
+                (
+                    self.results_folder(run_id),
+                    metadata,
+                    [key for key in output_keys if key in metadata.trends],
+                )
+                for run_id, metadata in all_metadata.items()
+            ],
+            self._workers,
+        )
+
+        result = {}
+        for trend_key in output_keys:
+            runs_trend = [run_data.get(trend_key) for run_data in runs_data]
+            if all(run_trend is None for run_trend in runs_trend):
+                raise KeyError(f"Trend {trend_key} not found in the runs")
+
+            trend_time = time
+            if trend_time is None:
+                trend_time = next(
+                    run_trend[0] for run_trend in runs_trend if run_trend is not None
+                )
+                if any(
+                    run_trend is not None
+                    and not np.array_equal(run_trend[0], trend_time)
+                    for run_trend in runs_trend
+                ):
+                    raise ValueError(
+                        f"The runs have different time sets for trend {trend_key},"
+                        f" a common `time` must be given"
+                    )
+
+            values = np.full((len(runs_trend), len(trend_time)), np.nan)
+            for i, run_trend in enumerate(runs_trend):
+                if run_trend is None:
+                    continue
+                run_time, run_values = run_trend
+                if time is None:
+                    values[i] = run_values
+                elif len(run_time) > 0:
+                    values[i] = np.interp(
+                        time, run_time, run_values, left=np.nan, right=np.nan
+                    )
+            result[trend_key] = MultipleRunsTrend(trend_time, values)
+        return result
+
+
+def _run_id_sort_key(run_id: str) -> tuple[int, int, str]:
+    if run_id.isdigit():
+        return (0, int(run_id), run_id)
+    return (1, 0, run_id)
+
+
+def _read_run_metadata(
+    results_folder: Path, use_metadata_cache: bool
+) -> ALFASimResultMetadata:
+    """
+    Read the metadata of a run (this runs in worker processes).
+    """
+    return read_metadata(results_folder, use_metadata_cache=use_metadata_cache)
+
+
+def _read_run_trends(
+    results_folder: Path,
+    metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType],
+) -> dict[OutputKeyType, tuple[np.ndarray, np.ndarray]]:
+    """
+    Read the trends of a run and their time sets (this runs in worker processes).
+    """
+    if len(output_keys) == 0:
+        return {}
+    time_set_keys = {
+        trend_key: ("trend_id", metadata.trends[trend_key]["time_set_key"])
+        for trend_key in output_keys
+    }
+    with keep_result_files_open(results_folder):
+        time_sets = read_time_sets(
+            results_folder, metadata, list(set(time_set_keys.values()))
+        )
+        trends = read_trends_data(results_folder, metadata, output_keys)
+    return {
+        trend_key: (time_sets[time_set_keys[trend_key]], trends[trend_key])
+        for trend_key in output_keys
+    }
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import bisect
+import dataclasses
 import sqlite3
-from collections.abc import Callable, Mapping, Sequence
-from contextlib import closing
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import ExitStack, closing
 from pathlib import Path
 from typing import Any
 
@@ -21,12 +23,15 @@ from alfasim_sdk.result_reader.aggregator import (
     HistoryMatchingMetadata,
     HMOutputKey,
     ProfileMetaItem,
+    ProfileTimeStep,
     TrendMetaItem,
     UncertaintyPropagationAnalysesMetaData,
     UPOutputKey,
     UPResult,
+    iter_profiles_range,
+    keep_result_files_open,
     read_global_sensitivity_analysis_meta_data,
-    read_global_sensitivity_coefficients,
+    read_global_sensitivity_coefficient_matrix,
     read_history_matching_historic_data_curves,
     read_history_matching_metadata,
     read_history_matching_result,
@@ -40,10 +45,10 @@ from alfasim_sdk.result_reader.aggregator import (
     read_uq_time_set,
 )
 from alfasim_sdk.result_reader.aggregator_constants import (
-    GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME,
     RESULTS_FOLDER_NAME,
     UNCERTAINTY_PROPAGATION_GROUP_NAME,
 )
+from alfasim_sdk.result_reader.arrays import ProfileArray, TrendArray
 
 
 @define(frozen=True)
@@ -85,16 +90,146 @@ class GlobalTrendMetadata:
         return self.property_name
 
 
+@dataclasses.dataclass
+class _OutputsIndex:
+    """
+    Indexes to locate outputs by name, built once for each metadata object.
+
+    :ivar metadata:
+        The indexed metadata.
+
+    :ivar positional_trends:
+        Map `(property_id, network_element_name)` to the positions (sorted) and
+        the positional trend keys, along with their order in the metadata.
+
+    :ivar overall_trends:
+        Map `(property_id, network_element_name)` to the first trend key without position.
+
+    :ivar global_trends:
+        Map `property_id` to the first trend key without network element.
+
+    :ivar profiles:
+        Map `(property_id, network_element_name)` to the first profile key.
+    """
+
+    metadata: ALFASimResultMetadata
+    positional_trends: dict[
+        tuple[str, str | None], tuple[list[float], list[tuple[int, str]]]
+    ]
+    overall_trends: dict[tuple[str, str | None], str]
+    global_trends: dict[str, str]
+    profiles: dict[tuple[str, str], str]
+
+    @classmethod
+    def from_metadata(cls, metadata: ALFASimResultMetadata) -> Self:
+        positional_entries: dict[
+            tuple[str, str | None], list[tuple[float, int, str]]
+        ] = {}
+        overall_trends: dict[tuple[str, str | None], str] = {}
+        global_trends: dict[str, str] = {}
+        for order, (trend_key, trend_metadata) in enumerate(metadata.trends.items()):
+            property_id = trend_metadata["property_id"]
+            element_name = trend_metadata["network_element_name"]
+            name = (property_id, element_name)
+            if "position" in trend_metadata:
+                position = trend_metadata["position"]
+                assert position is not None, (
+                    f"Trend position not found: {trend_metadata!r}"
+                )
+                positional_entries.setdefault(name, []).append(
+                    (position, order, trend_key)
+                )
+            else:
+                overall_trends.setdefault(name, trend_key)
+            if element_name is None:
+                global_trends.setdefault(property_id, trend_key)
+
+        positional_trends = {}
+        for name, entries in positional_entries.items():
+            entries.sort()
+            positional_trends[name] = (
+                [position for position, _, _ in entries],
+                [(order, trend_key) for _, order, trend_key in entries],
+            )
+
+        profiles: dict[tuple[str, str], str] = {}
+        for profile_key, profile_metadata in metadata.profiles.items():
+            name = (
+                profile_metadata["property_id"],
+                profile_metadata["network_element_name"],
+            )
+            profiles.setdefault(name, profile_key)
+
+        return cls(
+            metadata=metadata,
+            positional_trends=positional_trends,
+            overall_trends=overall_trends,
+            global_trends=global_trends,
+            profiles=profiles,
+        )
+
+    def find_positional_trend(
+        self, property_name: str, element_name: str, position: float, margin: float
+    ) -> str | None:
+        """
+        Find the first positional trend (in the metadata order) which position is
+        closer than `margin` to `position`.
+        """
+        entries = self.positional_trends.get((property_name, element_name))
+        if entries is None:
+            return None
+        positions, trends = entries
+        start = bisect.bisect_left(positions, position - margin)
+        stop = bisect.bisect_right(positions, position + margin)
+        candidates = [
+            trends[i]
+            for i in range(start, stop)
+            if abs(position - positions[i]) < margin
+        ]
+        if len(candidates) == 0:
+            return None
+        _, trend_key = min(candidates)
+        return trend_key
+
+
 class Results:
     """
     Allows reading trend and profile curves from alfasim simulation results
     using network element names instead internal alfasim ids.
+
+    Can be used as a context manager to keep the result files open between
+    reads (see `keep_result_files_open`):
+
+    .. code-block:: python
+
+        with Results(data_folder) as results:
+            for element_name in element_names:
+                results.get_overall_trend_curve("pressure", element_name)
+
+    :param use_metadata_cache:
+        Keep the metadata of finished result files in a cache file, so it is
+        not parsed again by the next `Results` objects (see `read_metadata`).
+        Note that the cache file is written in the results folder.
     """
 
-    def __init__(self, alfacase_data_folder: Path) -> None:
+    def __init__(
+        self, alfacase_data_folder: Path, *, use_metadata_cache: bool = False
+    ) -> None:
         self._data_folder = alfacase_data_folder
         self._position_margin = 0.01
+        self._use_metadata_cache = use_metadata_cache
         self._metadata: ALFASimResultMetadata | None = None
+        self._outputs_index: _OutputsIndex | None = None
+        self._open_files_stacks: list[ExitStack] = []
+
+    def __enter__(self) -> Self:
+        stack = ExitStack()
+        stack.enter_context(keep_result_files_open(self.results_folder))
+        self._open_files_stacks.append(stack)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._open_files_stacks.pop().close()
 
     @property
     def data_folder(self) -> Path:
@@ -111,10 +246,28 @@ class Results:
     def metadata(self) -> ALFASimResultMetadata:
         # Lazy load the metadata object.
         if self._metadata is None:
-            self._metadata = read_metadata(self.results_folder)
+            self._metadata = read_metadata(
+                self.results_folder, use_metadata_cache=self._use_metadata_cache
+            )
 
         return self._metadata
 
+    def refresh_metadata(self) -> None:
+        """
+        Discard the loaded metadata, so it is read again (along with the outputs index)
+        on the next access (useful when the simulation is still running).
+        """
+        self._metadata = None
+        self._outputs_index = None
+
+    @property
+    def _index(self) -> _OutputsIndex:
+        # Lazy build the index, rebuilding it when the metadata is replaced.
+        metadata = self.metadata
+        if self._outputs_index is None or self._outputs_index.metadata is not metadata:
+            self._outputs_index = _OutputsIndex.from_metadata(metadata)
+        return self._outputs_index
+
     @property
     def status(self) -> dict[str, Any] | None:
         communication_db = self.data_folder / "communication.sqlite"
@@ -145,10 +298,10 @@ class Results:
         metadata = self.metadata
         trend_metadata = metadata.trends[trend_key]
         time_set_key = ("trend_id", trend_metadata["time_set_key"])
-        time_sets = read_time_sets(self.results_folder, metadata, [time_set_key])
+        with keep_result_files_open(self.results_folder):
+            time_sets = read_time_sets(self.results_folder, metadata, [time_set_key])
+            trend_data = read_trends_data(self.results_folder, metadata, [trend_key])
         time_set = time_sets[time_set_key]
-
-        trend_data = read_trends_data(self.results_folder, metadata, [trend_key])
         data = trend_data[trend_key]
 
         return Curve(
@@ -166,16 +319,20 @@ class Results:
         """
         metadata = self.metadata
         profile_metadata = metadata.profiles[profile_key]
-        domains = read_profiles_domain_data(
-            self.results_folder, metadata, [profile_key], index
-        )
+        with keep_result_files_open(self.results_folder):
+            domains = read_profiles_domain_data(
+                self.results_folder, metadata, [profile_key], index
+            )
+            images = read_profiles_data(
+                self.results_folder, metadata, [profile_key], index
+            )
+
         domain = domains[profile_key]
         if domain is None:
             raise RuntimeError(
                 f"profile_key {profile_key} at index {index} has no domain"
             )
 
-        images = read_profiles_data(self.results_folder, metadata, [profile_key], index)
         image = images[profile_key]
         if image is None:
             raise RuntimeError(
@@ -193,33 +350,22 @@ class Results:
             ),
         )
 
-    def get_positional_trend_curve(
+    def _find_positional_trend_key(
         self,
         property_name: str,
         element_name: str,
         position: Scalar | tuple[float, str],
-    ) -> Curve:
-        """
-        Return a positional trend.
-        """
+    ) -> str:
         if not isinstance(position, Scalar):
             value, unit = position
             position = Scalar(value, unit)
 
-        metadata = self.metadata
         position_m: float = position.GetValue("m")
-        for trend_key, trend_metadata in metadata.trends.items():
-            if (
-                (trend_metadata["property_id"] == property_name)
-                and (trend_metadata["network_element_name"] == element_name)
-                and ("position" in trend_metadata)
-            ):
-                md_pos = trend_metadata["position"]
-                assert md_pos is not None, (
-                    f"Trend position not found: {trend_metadata!r}"
-                )
-                if abs(position_m - md_pos) < self._position_margin:
-                    return self._read_trend(trend_key)
+        trend_key = self._index.find_positional_trend(
+            property_name, element_name, position_m, self._position_margin
+        )
+        if trend_key is not None:
+            return trend_key
 
         msg = [
             f"Can not locate '{property_name}' trend for element '{element_name}' at position '{position_m}'.\nFound positional trends:",
@@ -227,18 +373,10 @@ class Results:
         ]
         raise RuntimeError("\n- ".join(msg))
 
-    def get_overall_trend_curve(self, property_name: str, element_name: str) -> Curve:
-        """
-        Return an overall trend.
-        """
-        metadata = self.metadata
-        for trend_key, trend_metadata in metadata.trends.items():
-            if (
-                (trend_metadata["property_id"] == property_name)
-                and (trend_metadata["network_element_name"] == element_name)
-                and ("position" not in trend_metadata)
-            ):
-                return self._read_trend(trend_key)
+    def _find_overall_trend_key(self, property_name: str, element_name: str) -> str:
+        trend_key = self._index.overall_trends.get((property_name, element_name))
+        if trend_key is not None:
+            return trend_key
 
         msg = [
             f"Can not locate overall '{property_name}' trend for element '{element_name}'.\nFound overall trends:",
@@ -246,16 +384,10 @@ class Results:
         ]
         raise RuntimeError("\n- ".join(msg))
 
-    def get_global_trend_curve(self, property_name: str) -> Curve:
-        """
-        Return a global trend.
-        """
-        metadata = self.metadata
-        for trend_key, trend_metadata in metadata.trends.items():
-            if (trend_metadata["property_id"] == property_name) and (
-                trend_metadata["network_element_name"] is None
-            ):
-                return self._read_trend(trend_key)
+    def _find_global_trend_key(self, property_name: str) -> str:
+        trend_key = self._index.global_trends.get(property_name)
+        if trend_key is not None:
+            return trend_key
 
         msg = [
             f"Can not locate '{property_name}' global trend.\nFound global trends:",
@@ -263,6 +395,81 @@ class Results:
         ]
         raise RuntimeError("\n- ".join(msg))
 
+    def _find_profile_key(self, property_name: str, element_name: str) -> str:
+        profile_key = self._index.profiles.get((property_name, element_name))
+        if profile_key is not None:
+            return profile_key
+
+        msg = [
+            f"Can not locate '{property_name}' profile for element '{element_name}'.\nFound profiles:",
+            *map(str, self.list_profiles()),
+        ]
+        raise RuntimeError("\n- ".join(msg))
+
+    def get_positional_trend_curve(
+        self,
+        property_name: str,
+        element_name: str,
+        position: Scalar | tuple[float, str],
+    ) -> Curve:
+        """
+        Return a positional trend.
+        """
+        return self._read_trend(
+            self._find_positional_trend_key(property_name, element_name, position)
+        )
+
+    def get_overall_trend_curve(self, property_name: str, element_name: str) -> Curve:
+        """
+        Return an overall trend.
+        """
+        return self._read_trend(
+            self._find_overall_trend_key(property_name, element_name)
+        )
+
+    def get_global_trend_curve(self, property_name: str) -> Curve:
+        """
+        Return a global trend.
+        """
+        return self._read_trend(self._find_global_trend_key(property_name))
+
+    def get_positional_trend_array(
+        self,
+        property_name: str,
+        element_name: str,
+        position: Scalar | tuple[float, str],
+    ) -> TrendArray:
+        """
+        Return a positional trend as a lazy array (the data is read when indexed).
+        """
+        return TrendArray.from_metadata(
+            self.results_folder,
+            self.metadata,
+            self._find_positional_trend_key(property_name, element_name, position),
+        )
+
+    def get_overall_trend_array(
+        self, property_name: str, element_name: str
+    ) -> TrendArray:
+        """
+        Return an overall trend as a lazy array (the data is read when indexed).
+        """
+        return TrendArray.from_metadata(
+            self.results_folder,
+            self.metadata,
+            self._find_overall_trend_key(property_name, element_name),
+        )
+
+    def get_global_trend_array(self, property_name: str) -> TrendArray:
+        """
+        Return a global trend as a lazy array (the data is read when indexed).
+        """
+        return TrendArray.from_metadata(
+            self.results_folder,
+            self.metadata,
+            self._find_global_trend_key(property_name),
+        )
+
     def list_positional_trends(self) -> Sequence[PositionalTrendMetadata]:
         """
         List the collected positional trends.
@@ -325,18 +532,57 @@ class Results:
         """
         Return a profile curve at a given time step index.
         """
-        metadata = self.metadata
-        for profile_key, profile_metadata in metadata.profiles.items():
-            if (profile_metadata["property_id"] == property_name) and (
-                profile_metadata["network_element_name"] == element_name
+        return self._read_profile(
+            self._find_profile_key(property_name, element_name), index
+        )
+
+    def get_profile_array(self, property_name: str, element_name: str) -> ProfileArray:
+        """
+        Return all the time steps of a profile as a lazy array (the data is read when
+        indexed), the rows are the time steps.
+        """
+        return ProfileArray.from_metadata(
+            self.results_folder,
+            self.metadata,
+            self._find_profile_key(property_name, element_name),
+        )
+
+    def iter_profiles(
+        self,
+        property_name: str,
+        element_name: str,
+        start: int | None = None,
+        stop: int | None = None,
+        *,
+        chunk: int = 64,
+        prefetch: bool = False,
+    ) -> Iterator[ProfileTimeStep]:
+        """
+        Iterate over the time steps of a profile, yielding `(time, domain, values)` tuples
+        (see `iter_profiles_range`):
+
+        .. code-block:: python
+
+            for time, domain, values in results.iter_profiles(
+                "holdup", "pipe 1", chunk=100
             ):
-                return self._read_profile(profile_key, index)
+                ...
 
-        msg = [
-            f"Can not locate '{property_name}' profile for element '{element_name}'.\nFound profiles:",
-            *map(str, self.list_profiles()),
-        ]
-        raise RuntimeError("\n- ".join(msg))
+        :param chunk:
+            The number of time steps read at once.
+
+        :param prefetch:
+            If `True` the next time steps are read in a background thread.
+        """
+        return iter_profiles_range(
+            self.results_folder,
+            self.metadata,
+            self._find_profile_key(property_name, element_name),
+            start,
+            stop,
+            chunk_size=chunk,
+            prefetch=prefetch,
+        )
 
     def list_profiles(self) -> Sequence[ProfileMetadata]:
         """
@@ -401,13 +647,13 @@ class GlobalSensitivityAnalysisResults:
         if metadata is None:
             return None
 
-        timeset = read_uq_time_set(result_dir, GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME)
-        assert timeset is not None, (
-            f"metadata {metadata!r} exists, so time-set must exist too"
+        matrix = read_global_sensitivity_coefficient_matrix(result_dir, metadata)
+        assert matrix is not None, (
+            f"metadata {metadata!r} exists, so coefficients must exist too"
         )
         return cls(
-            timeset=timeset,
-            coefficients=read_global_sensitivity_coefficients(result_dir, metadata),
+            timeset=matrix.timeset,
+            coefficients={key: matrix[key] for key in metadata.items},
             metadata=metadata,
         )
 
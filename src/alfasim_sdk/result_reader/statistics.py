@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    OutputKeyType,
+    _iter_profile_chunks,
+    _read_trends_columns,
+    _select_trends_in_files,
+    open_result_files,
+)
+from alfasim_sdk.result_reader.aggregator_constants import TRENDS_GROUP_NAME
+from alfasim_sdk.result_reader.instrumentation import _instrumented
+
+DEFAULT_STATISTICS = ("mean", "min", "max", "std")
+
+_MOMENT_STATISTICS = frozenset(["mean", "std", "var"])
+_SIMPLE_STATISTICS = frozenset(["count", "min", "max"]) | _MOMENT_STATISTICS
+_PERCENTILE_PATTERN = re.compile(r"p(\d+(\.\d*)?)")
+
+_STATISTICS_PROFILES_CHUNK_SIZE = 256
+_STATISTICS_TRENDS_CHUNK_SIZE = 65536
+
+_QUANTILE_COMPRESSION = 200
+"""\
+The compression of the percentile sketches (see `_QuantileSketch`), higher values are more
+accurate (and use more memory).
+"""
+
+
+@_instrumented
+def compute_profile_statistics(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType],
+    start: int | None = None,
+    stop: int | None = None,
+    stats: Sequence[str] = DEFAULT_STATISTICS,
+    *,
+    chunk_size: int = _STATISTICS_PROFILES_CHUNK_SIZE,
+    compression: int = _QUANTILE_COMPRESSION,
+) -> dict[OutputKeyType, dict[str, np.ndarray]]:
+    """
+    Compute statistics over time of each point of profiles (time-averaged profiles, envelopes,
+    ...), for a range of time steps.
+
+    The time steps are read in chunks which are accumulated (the data of all time steps is
+    never held at once): the mean and variance are accumulated with the Welford/Chan algorithm
+    (exact) and the percentiles with a t-digest like sketch (approximate, exact while the number
+    of time steps is below `compression`).
+
+    :param start:
+        The first time step index, negative values count from the end.
+        If `None` start from the first time step.
+
+    :param stop:
+        The time step index after the last, negative values count from the end.
+        If `None` go up to the last time step.
+
+    :param stats:
+        The statistics to compute:
+        - "count": the number of time steps;
+        - "mean", "std", "var": the mean, standard deviation and variance (population);
+        - "min", "max": the minimum and maximum;
+        - "p<percentile>" (e.g. "p10", "p50", "p99.9"): the percentile;
+        `NaN` values are propagated (as in numpy).
+
+    :param chunk_size:
+        The number of time steps read at once.
+
+    :param compression:
+        The compression of the percentile sketches.
+
+    :return:
+        For each profile, the value of each statistic for each profile point (arrays with
+        the size of the profile).
+    """
+    _check_statistics(stats)
+    result = {}
+    with open_result_files(result_directory) as result_files:
+        for profile_key in output_keys:
+            accumulator = _StatisticsAccumulator(stats, compression)
+            for _, _, _, values in _iter_profile_chunks(
+                result_files,
+                result_metadata,
+                profile_key,
+                start,
+                stop,
+                chunk_size=chunk_size,
+            ):
+                accumulator.add(values)
+            result[profile_key] = accumulator.result(
+                (result_metadata.profiles[profile_key]["size"],)
+            )
+    return result
+
+
+@_instrumented
+def compute_trend_statistics(
+    result_directory: Path,
+    result_metadata: ALFASimResultMetadata,
+    output_keys: list[OutputKeyType] | None = None,
+    initial_trends_time_step_index: int | None = None,
+    final_trends_time_step_index: int | None = None,
+    stats: Sequence[str] = DEFAULT_STATISTICS,
+    *,
+    chunk_size: int = _STATISTICS_TRENDS_CHUNK_SIZE,
+    compression: int = _QUANTILE_COMPRESSION,
+) -> dict[OutputKeyType, dict[str, float]]:
+    """
+    Compute statistics of trends in a time step range (window), streaming the time steps in
+    chunks (see `compute_profile_statistics`).
+
+    :param output_keys:
+        Must be trends output ids. Default to ALL trends found in `result_metadata`.
+
+    :param initial_trends_time_step_index:
+        If `None` the initial boundary of the result metadata is used.
+
+    :param final_trends_time_step_index:
+        If `None` the final boundary of the result metadata is used.
+
+    :param stats:
+        See `compute_profile_statistics`.
+
+    :return:
+        The value of each statistic, for each trend.
+    """
+    _check_statistics(stats)
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk_size ({chunk_size})")
+    with open_result_files(result_directory) as result_files:
+        output_keys_to_read, selections = _select_trends_in_files(
+            result_metadata,
+            output_keys,
+            initial_trends_time_step_index,
+            final_trends_time_step_index,
+            result_files=result_files,
+        )
+        accumulators = {
+            trend_key: _StatisticsAccumulator(stats, compression)
+            for trend_key in output_keys_to_read
+        }
+        for base_ts, start_index, stop_index, keys_in_file, columns in selections:
+            dset = result_files[base_ts][TRENDS_GROUP_NAME]["trends"]
+            for chunk_start in range(start_index, stop_index, chunk_size):
+                chunk_stop = min(chunk_start + chunk_size, stop_index)
+                data, data_columns = _read_trends_columns(
+                    dset, chunk_start, chunk_stop, columns
+                )
+                for trend_key, data_column in zip(keys_in_file, data_columns):
+                    accumulators[trend_key].add(data[:, data_column])
+
+    return {
+        trend_key: {
+            name: float(value) for name, value in accumulator.result(()).items()
+        }
+        for trend_key, accumulator in accumulators.items()
+    }
+
+
+def _check_statistics(stats: Sequence[str]) -> None:
+    for name in stats:
+        if name not in _SIMPLE_STATISTICS and _parse_percentile(name) is None:
+            raise ValueError(f"Invalid statistic ({name!r})")
+
+
+def _parse_percentile(name: str) -> float | None:
+    match = _PERCENTILE_PATTERN.fullmatch(name)
+    if match is None:
+        return None
+    percentile = float(match.group(1))
+    return percentile if percentile <= 100 else None
+
+
+class _StatisticsAccumulator:
+    """
+    Accumulate the statistics of arrays given in chunks along the first axis (time steps).
+    """
+
+    def __init__(self, stats: Sequence[str], compression: int) -> None:
+        self.stats = list(stats)
+        self.count = 0
+        self._moments = any(name in _MOMENT_STATISTICS for name in stats)
+        self._percentiles = {
+            name: percentile
+            for name in stats
+            if (percentile := _parse_percentile(name)) is not None
+        }
+        self._extremes = bool(self._percentiles) or any(
+            name in ("min", "max") for name in stats
+        )
+        self._shape: tuple[int, ...] | None = None
+        self._mean: np.ndarray | None = None
+        self._m2: np.ndarray | None = None
+        self._min: np.ndarray | None = None
+        self._max: np.ndarray | None = None
+        self._sketch = _QuantileSketch(compression) if self._percentiles else None
+
+    def add(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        if self._shape is None:
+            self._shape = values.shape[1:]
+        elif self._shape != values.shape[1:]:
+            raise ValueError(
+                f"Can not accumulate arrays of shape {values.shape[1:]}"
+                f" with arrays of shape {self._shape}"
+            )
+
+        count = len(values)
+        if self._moments:
+            mean = values.mean(axis=0)
+            m2 = np.square(values - mean).sum(axis=0)
+            if self._mean is None or self._m2 is None:
+                self._mean, self._m2 = mean, m2
+            else:
+                # Chan et al. pairwise update of the Welford accumulators.
+                total = self.count + count
+                delta = mean - self._mean
+                self._mean = self._mean + delta * (count / total)
+                self._m2 = (
+                    self._m2 + m2 + np.square(delta) * (self.count * count / total)
+                )
+
+        if self._extremes:
+            values_min = values.min(axis=0)
+            values_max = values.max(axis=0)
+            if self._min is None or self._max is None:
+                self._min, self._max = values_min, values_max
+            else:
+                self._min = np.minimum(self._min, values_min)
+                self._max = np.maximum(self._max, values_max)
+
+        if self._sketch is not None:
+            self._sketch.add(values)
+        self.count += count
+
+    def result(self, shape: tuple[int, ...]) -> dict[str, np.ndarray]:
+        """
+        :param shape:
+            The shape of the statistics when nothing was accumulated.
+        """
+        if self._shape is not None:
+            shape = self._shape
+        empty = np.full(shape, np.nan)
+
+        result = {}
+        for name in self.stats:
+            if name == "count":
+                result[name] = np.full(shape, self.count)
+            elif self.count == 0:
+                result[name] = empty.copy()
+            elif name == "mean":
+                assert self._mean is not None
+                result[name] = self._mean
+            elif name in ("var", "std"):
+                assert self._m2 is not None
+                variance = self._m2 / self.count
+                result[name] = variance if name == "var" else np.sqrt(variance)
+            elif name == "min":
+                assert self._min is not None
+                result[name] = self._min
+            elif name == "max":
+                assert self._max is not None
+                result[name] = self._max
+            else:
+                assert self._sketch is not None
+                assert self._min is not None and self._max is not None
+                result[name] = self._sketch.quantile(
+                    self._percentiles[name] / 100, self._min, self._max
+                ).reshape(shape)
+        return result
+
+
+class _QuantileSketch:
+    """
+    A vectorized t-digest like sketch of the distribution of each column of arrays given in
+    chunks along the first axis.
+
+    Each column is summarized by up to about `compression` centroids (mean and weight), the
+    centroids are merged so they span at most one unit of a t-digest scale function: the sum
+    of the `k1` (arcsine) and `k2` (logit, normalized by the number of samples) scale functions,
+    so the centroids are small near the tails (the `k2` size limit, `O(q (1 - q))`, keeps the
+    extreme percentiles accurate) and not too large in the middle (the `k1` limit).
+    """
+
+    def __init__(self, compression: int) -> None:
+        if compression < 2:
+            raise ValueError(f"Invalid compression ({compression})")
+        self.compression = compression
+        # Centroids of each column (sorted by the mean along the first axis), empty centroids
+        # have zero weight and an infinite mean.
+        self._means: np.ndarray | None = None
+        self._weights: np.ndarray | None = None
+
+    def add(self, values: np.ndarray) -> None:
+        values = values.reshape(len(values), -1)
+        weights = np.ones_like(values)
+        if self._means is not None and self._weights is not None:
+            values = np.concatenate([self._means, values])
+            weights = np.concatenate([self._weights, weights])
+        order = np.argsort(values, axis=0, kind="stable")
+        means = np.take_along_axis(values, order, axis=0)
+        weights = np.take_along_axis(weights, order, axis=0)
+        if len(means) > self.compression:
+            means, weights = self._compress(means, weights)
+        self._means = means
+        self._weights = weights
+
+    def _compress(
+        self, means: np.ndarray, weights: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        n_columns = means.shape[1]
+        cumulative = np.cumsum(weights, axis=0)
+        total = float(cumulative[-1].max())
+        q = (cumulative - weights / 2) / total
+        # k1 scale function, from -compression / 4 to compression / 4.
+        k1 = self.compression / (2 * math.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+        # k2 scale function, q is limited to the centers of the first and last samples so
+        # it ranges from -k2_limit to k2_limit (about compression / 4).
+        q_limit = 0.5 / total
+        q = np.clip(q, q_limit, 1 - q_limit)
+        k2_scale = self.compression / (
+            4 * math.log(max(total / self.compression, 1)) + 24
+        )
+        k2 = k2_scale * np.log(q / (1 - q))
+        k2_limit = k2_scale * math.log((1 - q_limit) / q_limit)
+
+        bins = np.floor(k1 + k2 + self.compression / 4 + k2_limit).astype(np.int64)
+        n_bins = math.ceil(self.compression / 2 + 2 * k2_limit) + 1
+        bins = np.clip(bins, 0, n_bins - 1)
+
+        flat_bins = (bins * n_columns + np.arange(n_columns)).ravel()
+        has_weight = weights > 0
+        new_weights = np.bincount(
+            flat_bins, weights.ravel(), minlength=n_bins * n_columns
+        ).reshape(n_bins, n_columns)
+        sums = np.bincount(
+            flat_bins,
+            (np.where(has_weight, means, 0.0) * weights).ravel(),
+            minlength=n_bins * n_columns,
+        ).reshape(n_bins, n_columns)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            new_means = np.where(new_weights > 0, sums / new_weights, np.inf)
+        # The bins are in ascending order, and empty bins (infinite mean) must be last.
+        order = np.argsort(new_means, axis=0, kind="stable")
+        return (
+            np.take_along_axis(new_means, order, axis=0),
+            np.take_along_axis(new_weights, order, axis=0),
+        )
+
+    def quantile(
+        self, q: float, minimum: np.ndarray, maximum: np.ndarray
+    ) -> np.ndarray:
+        """
+        Estimate the quantile `q` (in [0, 1]) of each column, interpolating between the
+        centroids (same as `np.quantile` with the "linear" method while no centroids were
+        merged).
+
+        :param minimum:
+            The exact minimum of each column (the quantiles never extrapolate it).
+
+        :param maximum:
+            The exact maximum of each column.
+        """
+        assert self._means is not None and self._weights is not None
+        minimum = minimum.ravel()
+        maximum = maximum.ravel()
+        weights = self._weights
+        # The position of each centroid center among the (sorted) samples, the empty
+        # centroids (last) are moved to the maximum so the positions are sorted.
+        last = weights.sum(axis=0) - 1
+        positions = np.minimum(np.cumsum(weights, axis=0) - weights / 2 - 0.5, last)
+        means = np.where(weights > 0, self._means, maximum)
+        xs = np.concatenate([np.zeros((1, len(last))), positions, last[np.newaxis]])
+        ys = np.concatenate([minimum[np.newaxis], means, maximum[np.newaxis]])
+
+        # Interpolate all the columns at once (as `np.interp`, which takes the last of
+        # repeated positions).
+        target = q * last
+        columns = np.arange(len(last))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            upper = np.minimum(np.sum(xs <= target, axis=0), len(xs) - 1)
+            lower = upper - 1
+            x0 = xs[lower, columns]
+            x1 = xs[upper, columns]
+            y0 = ys[lower, columns]
+            y1 = ys[upper, columns]
+            result = np.where(
+                target >= x1, y1, y0 + (target - x0) / (x1 - x0) * (y1 - y0)
+            )
+        return np.where(np.isnan(minimum), np.nan, result)
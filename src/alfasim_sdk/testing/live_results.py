@@ -0,0 +1,376 @@
+"""
+A stand-in for a running simulation, writing synthetic results in SWMR mode, and a harness to
+measure how quickly the results being written are picked up by a reader.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import queue
+import time
+from collections.abc import Iterator
+from multiprocessing.queues import Queue
+from pathlib import Path
+from types import TracebackType
+from typing import Any, NamedTuple
+
+import h5py
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import (
+    ALFASimResultMetadata,
+    ResultsNeedFullReloadError,
+    concatenate_metadata,
+    read_metadata,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    RESULT_FILE_PREFIX,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.testing.synthetic_results import (
+    SyntheticResultsSpec,
+    create_synthetic_result_file_layout,
+    write_synthetic_profiles,
+    write_synthetic_trends,
+)
+
+
+class WriterFlush(NamedTuple):
+    """
+    The time steps written to a result file and flushed (made visible to SWMR readers).
+
+    :ivar base_ts:
+        The base time step of the result file.
+
+    :ivar time_steps:
+        The number of trend time steps in the file after the flush.
+
+    :ivar time:
+        The `time.monotonic()` right after the flush.
+    """
+
+    base_ts: int
+    time_steps: int
+    time: float
+
+
+class SWMRResultsWriter:
+    """
+    Writes synthetic results (see `SyntheticResultsSpec`) in a separate process, like a
+    running simulation: each result file is created while a `.creating` marker exists, then
+    the writer switches to SWMR mode, removes the marker and appends the trends (and the
+    profiles of the time steps written) at a fixed rate. Each restart closes the former file
+    and creates a new one, its time set overlaps the former (see
+    `SyntheticResultsSpec.restart_overlap`).
+
+    .. code-block:: python
+
+        with SWMRResultsWriter(result_directory, spec, write_interval=0.1) as writer:
+            for delta in ResultsFollower(result_directory):
+                ...
+
+    :param spec:
+        The shape of the results written (must not be contiguous).
+
+    :param time_steps_per_write:
+        The number of trend time steps appended (and flushed) at once.
+
+    :param write_interval:
+        The time (in seconds) the writer waits after each flush.
+    """
+
+    def __init__(
+        self,
+        result_directory: Path,
+        spec: SyntheticResultsSpec,
+        *,
+        time_steps_per_write: int = 100,
+        write_interval: float = 0.1,
+    ) -> None:
+        if spec.contiguous:
+            raise ValueError("SWMR results must be written in resizable data sets")
+        if time_steps_per_write < 1:
+            raise ValueError(
+                f"Invalid time_steps_per_write ({time_steps_per_write}), must be positive"
+            )
+        self.result_directory = result_directory
+        self.spec = spec
+        self.time_steps_per_write = time_steps_per_write
+        self.write_interval = write_interval
+        context = multiprocessing.get_context("spawn")
+        self._flushes: Queue[WriterFlush] = context.Queue()
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=_write_swmr_results,
+            args=(
+                result_directory,
+                spec,
+                time_steps_per_write,
+                write_interval,
+                self._flushes,
+                self._stop_event,
+            ),
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._process.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Ask the writer to stop (the file being written is closed) and wait for it.
+        """
+        self._stop_event.set()
+        self.join(timeout)
+
+    def join(self, timeout: float | None = None) -> None:
+        """
+        Wait for the writer to finish writing all the results.
+        """
+        self._process.join(timeout)
+        if self._process.exitcode not in (None, 0):
+            raise RuntimeError(
+                f"The writer failed (exit code {self._process.exitcode})"
+            )
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def iter_flushes(self) -> Iterator[WriterFlush]:
+        """
+        Yield the flushes done since the last call (without waiting for new ones).
+        """
+        while True:
+            try:
+                yield self._flushes.get_nowait()
+            except queue.Empty:
+                return
+
+    def __enter__(self) -> SWMRResultsWriter:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+def _write_swmr_results(
+    result_directory: Path,
+    spec: SyntheticResultsSpec,
+    time_steps_per_write: int,
+    write_interval: float,
+    flushes: Queue[WriterFlush],
+    stop_event: Any,
+) -> None:
+    """
+    Write the results of a `SWMRResultsWriter` (this runs in the writer process).
+    """
+    result_directory.mkdir(parents=True, exist_ok=True)
+    for file_index, base_ts in enumerate(spec.base_time_steps):
+        if stop_event.is_set():
+            return
+        filename = result_directory / f"{RESULT_FILE_PREFIX}{base_ts:05d}"
+        creating_marker = filename.with_suffix(".creating")
+        creating_marker.touch()
+        with h5py.File(filename, "w", libver="latest") as result_file:
+            create_synthetic_result_file_layout(result_file, spec, file_index)
+            result_file.swmr_mode = True
+            creating_marker.unlink()
+
+            trends_time = spec.trends_time(file_index)
+            profiles_time = spec.profiles_time(file_index)
+            profiles_written = 0
+            for start in range(0, len(trends_time), time_steps_per_write):
+                stop = min(start + time_steps_per_write, len(trends_time))
+                write_synthetic_trends(
+                    result_file, spec, trends_time[start:stop], start
+                )
+                profiles_stop = int(
+                    np.searchsorted(profiles_time, trends_time[stop - 1], side="right")
+                )
+                write_synthetic_profiles(
+                    result_file,
+                    spec,
+                    profiles_time[profiles_written:profiles_stop],
+                    profiles_written,
+                )
+                profiles_written = profiles_stop
+                result_file.flush()
+                flushes.put(WriterFlush(base_ts, stop, time.monotonic()))
+                if stop_event.wait(write_interval):
+                    return
+
+
+@dataclasses.dataclass(frozen=True)
+class LiveReadingReport:
+    """
+    The measurements of `measure_live_reading`.
+
+    :ivar metadata:
+        The metadata of all the results read.
+
+    :ivar poll_durations:
+        The time (seconds) spent reading and concatenating the metadata in each poll.
+
+    :ivar latencies:
+        The time (seconds) from each writer flush to the end of the poll which picked up the
+        flushed time steps (flushes of time steps truncated by a restart are not included).
+
+    :ivar time_steps_read:
+        The number of trend time steps read in each poll (all the time steps in a full
+        reload).
+
+    :ivar full_reloads:
+        The number of polls that had to read the whole metadata again (new result file or
+        truncated results).
+
+    :ivar elapsed:
+        The total time (seconds) of the measurement.
+    """
+
+    metadata: ALFASimResultMetadata
+    poll_durations: np.ndarray
+    latencies: np.ndarray
+    time_steps_read: np.ndarray
+    full_reloads: int
+    elapsed: float
+
+    def summary(self) -> dict[str, float]:
+        """
+        :return:
+            The number of polls, the mean and maximum poll duration, the latency percentiles
+            and the throughput (trend time steps picked up per second of polling).
+        """
+        latencies = self.latencies if len(self.latencies) > 0 else np.array([np.nan])
+        poll_time = float(self.poll_durations.sum())
+        return {
+            "polls": float(len(self.poll_durations)),
+            "full_reloads": float(self.full_reloads),
+            "poll_duration_mean": float(self.poll_durations.mean()),
+            "poll_duration_max": float(self.poll_durations.max()),
+            "latency_p50": float(np.percentile(latencies, 50)),
+            "latency_p95": float(np.percentile(latencies, 95)),
+            "latency_max": float(np.max(latencies)),
+            "throughput": float(self.time_steps_read.sum()) / poll_time
+            if poll_time > 0
+            else np.nan,
+        }
+
+
+def measure_live_reading(
+    writer: SWMRResultsWriter,
+    *,
+    poll_interval: float = 0.1,
+    timeout: float | None = None,
+) -> LiveReadingReport:
+    """
+    Poll the results being written by `writer` (started if needed) until it finishes, reading
+    the metadata of the new time steps (`read_metadata` with `previous_time_set_info`) and
+    concatenating it to the metadata read so far (`concatenate_metadata`), like
+    `ResultsFollower` does.
+
+    :param poll_interval:
+        The time (in seconds) to wait between polls.
+
+    :param timeout:
+        Stop the writer and raise `TimeoutError` if it does not finish in this time
+        (in seconds).
+    """
+    result_directory = writer.result_directory
+    if not writer.is_alive():
+        writer.start()
+
+    metadata: ALFASimResultMetadata | None = None
+    pending_flushes: list[WriterFlush] = []
+    poll_durations: list[float] = []
+    latencies: list[float] = []
+    time_steps_read: list[int] = []
+    full_reloads = 0
+    start_time = time.monotonic()
+    while True:
+        finished = not writer.is_alive()
+        pending_flushes.extend(writer.iter_flushes())
+
+        poll_start = time.monotonic()
+        previous_final = 0
+        if metadata is None:
+            metadata = read_metadata(result_directory)
+        else:
+            initial_profiles_index, initial_trends_index = (
+                metadata.time_steps_boundaries[1]
+            )
+            previous_final = initial_trends_index
+            try:
+                new_metadata = read_metadata(
+                    result_directory,
+                    initial_profiles_time_step_index=initial_profiles_index,
+                    initial_trends_time_step_index=initial_trends_index,
+                    previous_time_set_info=metadata.time_set_info,
+                )
+                metadata = concatenate_metadata(metadata, new_metadata)
+            except ResultsNeedFullReloadError:
+                metadata = read_metadata(result_directory)
+                full_reloads += 1
+                previous_final = 0
+        poll_end = time.monotonic()
+
+        poll_durations.append(poll_end - poll_start)
+        time_steps_read.append(
+            metadata.trends_time_steps_boundaries[1] - previous_final
+        )
+        pending_flushes = _match_flushes(
+            pending_flushes,
+            metadata.time_set_info.get(TRENDS_GROUP_NAME, {}),  # type:ignore[call-overload]
+            poll_end,
+            latencies,
+        )
+
+        if finished:
+            writer.join()
+            break
+        if timeout is not None and poll_end - start_time > timeout:
+            writer.stop()
+            raise TimeoutError(f"The writer did not finish in {timeout} seconds")
+        time.sleep(poll_interval)
+
+    return LiveReadingReport(
+        metadata=metadata,
+        poll_durations=np.array(poll_durations),
+        latencies=np.array(latencies),
+        time_steps_read=np.array(time_steps_read),
+        full_reloads=full_reloads,
+        elapsed=time.monotonic() - start_time,
+    )
+
+
+def _match_flushes(
+    pending_flushes: list[WriterFlush],
+    trends_time_set_info: dict[int, Any],
+    seen_time: float,
+    latencies: list[float],
+) -> list[WriterFlush]:
+    """
+    Record the latency of the flushes whose time steps are in the results read (see
+    `LiveReadingReport.latencies`).
+
+    :return:
+        The flushes not read yet.
+    """
+    still_pending = []
+    for flush in pending_flushes:
+        time_set_info_item = trends_time_set_info.get(flush.base_ts)
+        if time_set_info_item is None:
+            still_pending.append(flush)
+        elif time_set_info_item.size >= flush.time_steps:
+            latencies.append(seen_time - flush.time)
+        elif any(base_ts > flush.base_ts for base_ts in trends_time_set_info):
+            pass  # Truncated by a restart, never read.
+        else:
+            still_pending.append(flush)
+    return still_pending
@@ -0,0 +1,452 @@
+"""
+Writes synthetic ALFAsim result files, with the same layout of the files written by the
+simulator, to test and benchmark the result reader with results of any size.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import uuid
+from pathlib import Path
+from typing import Any
+
+import h5py
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator_constants import (
+    META_GROUP_NAME,
+    PROFILES_GROUP_NAME,
+    PROFILES_STATISTICS_DSET_NAME_SUFFIX,
+    RESULT_FILE_PREFIX,
+    TIME_SET_DSET_NAME,
+    TRENDS_GROUP_NAME,
+)
+
+SYNTHETIC_PROPERTIES = (
+    ("pressure", "Pa", "pressure"),
+    ("temperature", "K", "temperature"),
+    ("holdup", "m3/m3", "volume fraction"),
+    ("mixture velocity", "m/s", "velocity"),
+)
+"""\
+The (property id, unit, category) of the synthetic outputs, in turns.
+"""
+
+SYNTHETIC_APPLICATION_VERSION = "synthetic"
+
+_WRITE_BLOCK_SIZE = 4096
+"""\
+The number of trend time steps written at once.
+"""
+
+_DATA_SET_CHUNK_BYTES = 1 << 20
+"""\
+The (maximum) size of the chunks of the resizable data sets.
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticResultsSpec:
+    """
+    The shape of synthetic results (see `write_synthetic_results`).
+
+    The outputs are spread over pipes (`Pipe 0`, `Pipe 1`, ...) and properties (see
+    `SYNTHETIC_PROPERTIES`). The first trend is a global trend (`timestep`), the others are
+    positional trends.
+
+    :ivar trends:
+        The number of trends.
+
+    :ivar profiles:
+        The number of profiles.
+
+    :ivar time_steps:
+        The number of trend time steps stored in each result file.
+
+    :ivar profile_time_steps:
+        The number of profile time steps stored in each result file.
+
+    :ivar cells:
+        The number of points of each profile.
+
+    :ivar restarts:
+        The number of restarts, each restart writes a new result file (so the results have
+        `restarts + 1` files).
+
+    :ivar restart_overlap:
+        The number of trend time steps at the end of a result file which are simulated again
+        by the next result file (the time sets overlap, so the former file is truncated when
+        reading).
+
+    :ivar time_step:
+        The time (seconds) between trend time steps.
+
+    :ivar contiguous:
+        Store the data sets contiguously (like a repacked result file) instead of in
+        resizable chunked data sets (like a running simulation).
+
+    :ivar seed:
+        The seed of the outputs shapes and of the time set uuids.
+    """
+
+    trends: int = 100
+    profiles: int = 10
+    time_steps: int = 1000
+    profile_time_steps: int = 10
+    cells: int = 100
+    restarts: int = 0
+    restart_overlap: int = 0
+    time_step: float = 1.0
+    contiguous: bool = False
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.trends < 1 or self.time_steps < 1 or self.cells < 1:
+            raise ValueError("trends, time_steps and cells must be positive")
+        if self.profiles < 0 or self.profile_time_steps < 0 or self.restarts < 0:
+            raise ValueError(
+                "profiles, profile_time_steps and restarts can't be negative"
+            )
+        if self.profile_time_steps > self.time_steps:
+            raise ValueError("profile_time_steps can't be greater than time_steps")
+        if not 0 <= self.restart_overlap < self.time_steps:
+            raise ValueError(
+                f"Invalid restart_overlap ({self.restart_overlap}), must be smaller than"
+                f" time_steps ({self.time_steps})"
+            )
+
+    @property
+    def pipes(self) -> int:
+        """
+        The number of pipes the profiles are spread over (each pipe has a profile of
+        each property).
+        """
+        return max(1, math.ceil(self.profiles / len(SYNTHETIC_PROPERTIES)))
+
+    @property
+    def base_time_steps(self) -> list[int]:
+        """
+        The base time step (the global index of the first time step) of each result file.
+        """
+        return [
+            i * (self.time_steps - self.restart_overlap)
+            for i in range(self.restarts + 1)
+        ]
+
+    def trends_time(self, file_index: int) -> np.ndarray:
+        """
+        :return:
+            The trends time set stored in the result file `file_index`.
+        """
+        start = self.base_time_steps[file_index]
+        return (start + np.arange(self.time_steps)) * self.time_step
+
+    def profiles_time(self, file_index: int) -> np.ndarray:
+        """
+        :return:
+            The profiles time set stored in the result file `file_index` (evenly spread over
+            the trends time set).
+        """
+        trends_time = self.trends_time(file_index)
+        interval = self.time_steps // max(self.profile_time_steps, 1)
+        return trends_time[: self.profile_time_steps * interval : interval]
+
+    def trends_values(self, time: np.ndarray) -> np.ndarray:
+        """
+        :return:
+            The values of all trends at `time`, an array with shape
+            `(len(time), number of trends)`.
+        """
+        offset, amplitude, frequency = self._shapes(0, self.trends)
+        values = offset + amplitude * np.sin(np.multiply.outer(time, frequency))
+        values[:, 0] = self.time_step
+        return values
+
+    def profile_values(self, profile_index: int, time: np.ndarray) -> np.ndarray:
+        """
+        :return:
+            The values of the profile `profile_index` at `time`, an array with shape
+            `(len(time), number of cells)`.
+        """
+        offset, amplitude, frequency = (
+            shape[profile_index] for shape in self._shapes(1, self.profiles)
+        )
+        phase = np.linspace(0.0, np.pi, self.cells)
+        return offset + amplitude * np.sin(np.add.outer(frequency * time, phase))
+
+    def trend_key(self, trend_index: int) -> str:
+        property_id = (
+            "timestep" if trend_index == 0 else self._property(trend_index - 1)[0]
+        )
+        return f"{property_id}@synthetic.trends.item{trend_index:06d}"
+
+    def profile_key(self, profile_index: int) -> str:
+        property_id, _, _ = self._property(profile_index)
+        return f"{property_id}@synthetic.profiles.item{profile_index:06d}"
+
+    def trends_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        :return:
+            The trends metadata stored in the result files (`meta` attribute `trends`).
+        """
+        trends_metadata: dict[str, dict[str, Any]] = {}
+        for trend_index in range(self.trends):
+            trend_key = self.trend_key(trend_index)
+            _, trend_id = trend_key.split("@")
+            if trend_index == 0:
+                trends_metadata[trend_key] = {
+                    "trend_id": trend_id,
+                    "property_id": "timestep",
+                    "network_element_name": None,
+                    "unit": "s",
+                    "category": "time",
+                    "index": trend_index,
+                }
+                continue
+
+            property_id, unit, category = self._property(trend_index - 1)
+            position_index, pipe = divmod(
+                (trend_index - 1) // len(SYNTHETIC_PROPERTIES), self.pipes
+            )
+            cell_index = position_index % self.cells
+            trends_metadata[trend_key] = {
+                "trend_id": trend_id,
+                "property_id": property_id,
+                "network_element_name": f"Pipe {pipe}",
+                "unit": unit,
+                "category": category,
+                "index": trend_index,
+                "position": float(position_index),
+                "cell_index": cell_index,
+                "cell_position": float(cell_index),
+                "location": "center",
+                "is_annulus": False,
+            }
+        return trends_metadata
+
+    def profiles_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        :return:
+            The profiles metadata stored in the result files (`meta` attribute `profiles`).
+        """
+        profiles_metadata: dict[str, dict[str, Any]] = {}
+        for profile_index in range(self.profiles):
+            profile_key = self.profile_key(profile_index)
+            _, profile_id = profile_key.split("@")
+            property_id, unit, category = self._property(profile_index)
+            pipe = profile_index // len(SYNTHETIC_PROPERTIES)
+            profiles_metadata[profile_key] = {
+                "profile_id": profile_id,
+                "property_id": property_id,
+                "size": self.cells,
+                "location": "center",
+                "is_annulus": False,
+                "network_element_name": f"Pipe {pipe}",
+                "unit": unit,
+                "category": category,
+                "domain_unit": "m",
+                "data_id": f"profile_data_{profile_index:06d}",
+                "domain_id": f"profile_domain_{pipe:06d}",
+            }
+        return profiles_metadata
+
+    def _property(self, index: int) -> tuple[str, str, str]:
+        return SYNTHETIC_PROPERTIES[index % len(SYNTHETIC_PROPERTIES)]
+
+    def _shapes(
+        self, stream: int, size: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :return:
+            The offset, amplitude and frequency of the sine of each output (of the output type
+            `stream`).
+        """
+        rng = np.random.default_rng([self.seed, stream])
+        offset = rng.uniform(0.0, 1e5, size)
+        amplitude = rng.uniform(1.0, 1e3, size)
+        frequency = rng.uniform(1e-3, 1e-1, size) / self.time_step
+        return offset, amplitude, frequency
+
+
+def write_synthetic_results(
+    result_directory: Path, spec: SyntheticResultsSpec
+) -> list[Path]:
+    """
+    Write the result files of synthetic results with the given shape.
+
+    The files have the layout of the files written by the simulator: the outputs metadata
+    (JSON) in the `meta` group attributes, the trends of each time step in a row of the
+    `trends/trends` data set (with the minimum and maximum of each trend in
+    `trends/trends_statistic`), a data set for each profile in `profiles` (with the
+    minimum and maximum of each time step in `<data id>_statistics`) and the time set of
+    each output type in `time_set`.
+
+    The data is written in blocks, so results larger than the memory can be written.
+
+    :param result_directory:
+        The directory where the result files are written (created if needed).
+
+    :return:
+        The files written, in the restarts order.
+    """
+    result_directory.mkdir(parents=True, exist_ok=True)
+    filenames = []
+    for file_index, base_ts in enumerate(spec.base_time_steps):
+        filename = result_directory / f"{RESULT_FILE_PREFIX}{base_ts:05d}"
+        with h5py.File(filename, "w", libver="latest") as result_file:
+            create_synthetic_result_file_layout(result_file, spec, file_index)
+            write_synthetic_trends(result_file, spec, spec.trends_time(file_index), 0)
+            write_synthetic_profiles(
+                result_file, spec, spec.profiles_time(file_index), 0
+            )
+            finish_synthetic_result_file(result_file)
+        filenames.append(filename)
+    return filenames
+
+
+def create_synthetic_result_file_layout(
+    result_file: h5py.File,
+    spec: SyntheticResultsSpec,
+    file_index: int,
+) -> None:
+    """
+    Create the groups, metadata and (empty) data sets of a synthetic result file, the data is
+    written by `write_synthetic_trends` and `write_synthetic_profiles`.
+    """
+    rng = np.random.default_rng([spec.seed, file_index])
+    meta_group = result_file.create_group(META_GROUP_NAME)
+    meta_group.attrs["time_set_uuid"] = str(uuid.UUID(bytes=rng.bytes(16)))
+    meta_group.attrs["application_version"] = SYNTHETIC_APPLICATION_VERSION
+    meta_group.attrs["trends"] = json.dumps(spec.trends_metadata())
+    profiles_metadata = spec.profiles_metadata()
+    meta_group.attrs["profiles"] = json.dumps(profiles_metadata)
+
+    size = spec.time_steps if spec.contiguous else 0
+    trends_group = result_file.create_group(TRENDS_GROUP_NAME)
+    _create_data_set(trends_group, TIME_SET_DSET_NAME, spec, size, ())
+    _create_data_set(trends_group, "trends", spec, size, (spec.trends,))
+    trends_group.create_dataset(
+        "trends_statistic", data=np.full((2, spec.trends), np.nan)
+    )
+
+    profiles_size = len(spec.profiles_time(file_index)) if spec.contiguous else 0
+    profiles_group = result_file.create_group(PROFILES_GROUP_NAME)
+    _create_data_set(profiles_group, TIME_SET_DSET_NAME, spec, profiles_size, ())
+    for profile_metadata in profiles_metadata.values():
+        data_id = profile_metadata["data_id"]
+        _create_data_set(profiles_group, data_id, spec, profiles_size, (spec.cells,))
+        _create_data_set(
+            profiles_group,
+            data_id + PROFILES_STATISTICS_DSET_NAME_SUFFIX,
+            spec,
+            profiles_size,
+            (2,),
+        )
+        domain_id = profile_metadata["domain_id"]
+        if domain_id not in meta_group:
+            meta_group.create_dataset(
+                domain_id, data=np.arange(spec.cells, dtype=np.float64)
+            )
+
+
+def write_synthetic_trends(
+    result_file: h5py.File, spec: SyntheticResultsSpec, time: np.ndarray, start: int
+) -> None:
+    """
+    Write the trends of the given time steps to a synthetic result file, updating the trends
+    statistics (data sets are resized when needed).
+
+    :param start:
+        The index of the first time step written in the file (the number of time steps
+        already written).
+    """
+    trends_group = result_file[TRENDS_GROUP_NAME]
+    time_set_dset = trends_group[TIME_SET_DSET_NAME]
+    trends_dset = trends_group["trends"]
+    trends_statistic = trends_group["trends_statistic"][:, :]
+    for block_start in range(0, len(time), _WRITE_BLOCK_SIZE):
+        block_time = time[block_start : block_start + _WRITE_BLOCK_SIZE]
+        values = spec.trends_values(block_time)
+        _write_rows(time_set_dset, start + block_start, block_time)
+        _write_rows(trends_dset, start + block_start, values)
+        trends_statistic[0] = np.fmin(trends_statistic[0], values.min(axis=0))
+        trends_statistic[1] = np.fmax(trends_statistic[1], values.max(axis=0))
+    trends_group["trends_statistic"][:, :] = trends_statistic
+
+
+def write_synthetic_profiles(
+    result_file: h5py.File, spec: SyntheticResultsSpec, time: np.ndarray, start: int
+) -> None:
+    """
+    Write the profiles of the given time steps to a synthetic result file (data sets are
+    resized when needed).
+
+    :param start:
+        The index of the first time step written in the file (the number of time steps
+        already written).
+    """
+    if len(time) == 0:
+        return
+    profiles_group = result_file[PROFILES_GROUP_NAME]
+    _write_rows(profiles_group[TIME_SET_DSET_NAME], start, time)
+    for profile_index, profile_metadata in enumerate(spec.profiles_metadata().values()):
+        data_id = profile_metadata["data_id"]
+        values = spec.profile_values(profile_index, time)
+        statistics = np.stack([values.min(axis=1), values.max(axis=1)], axis=1)
+        _write_rows(profiles_group[data_id], start, values)
+        _write_rows(
+            profiles_group[data_id + PROFILES_STATISTICS_DSET_NAME_SUFFIX],
+            start,
+            statistics,
+        )
+
+
+def finish_synthetic_result_file(result_file: h5py.File) -> None:
+    """
+    Store the global minimum and maximum of each profile, in the attributes of the profile
+    statistics data set (like the simulator, once a result file is complete).
+    """
+    profiles_metadata = json.loads(result_file[META_GROUP_NAME].attrs["profiles"])
+    profiles_group = result_file[PROFILES_GROUP_NAME]
+    for profile_metadata in profiles_metadata.values():
+        statistics_dset = profiles_group[
+            profile_metadata["data_id"] + PROFILES_STATISTICS_DSET_NAME_SUFFIX
+        ]
+        if statistics_dset.shape[0] == 0:
+            continue
+        statistics = statistics_dset[:, :]
+        statistics_dset.attrs["global_min"] = np.nanmin(statistics[:, 0])
+        statistics_dset.attrs["global_max"] = np.nanmax(statistics[:, 1])
+
+
+def _create_data_set(
+    group: h5py.Group,
+    name: str,
+    spec: SyntheticResultsSpec,
+    size: int,
+    row_shape: tuple[int, ...],
+) -> h5py.Dataset:
+    """
+    Create a data set with `size` rows (of shape `row_shape`), one for each time step:
+    contiguous if `spec.contiguous`, chunked and resizable otherwise.
+    """
+    if spec.contiguous:
+        return group.create_dataset(name, shape=(size, *row_shape), dtype=np.float64)
+
+    chunk_rows = max(1, _DATA_SET_CHUNK_BYTES // (8 * math.prod(row_shape)))
+    return group.create_dataset(
+        name,
+        shape=(size, *row_shape),
+        maxshape=(None, *row_shape),
+        chunks=(min(chunk_rows, spec.time_steps), *row_shape),
+        dtype=np.float64,
+    )
+
+
+def _write_rows(dset: h5py.Dataset, start: int, rows: np.ndarray) -> None:
+    stop = start + len(rows)
+    if dset.shape[0] < stop:
+        dset.resize(stop, axis=0)
+    dset[start:stop] = rows
@@ -0,0 +1,111 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader.aggregator import (
+    _is_result_file_being_written,
+    keep_result_files_open,
+    read_metadata,
+    read_time_sets,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.follower import ResultsFollower
+from alfasim_sdk.testing.live_results import SWMRResultsWriter, measure_live_reading
+from alfasim_sdk.testing.synthetic_results import SyntheticResultsSpec
+
+
+def test_measure_live_reading(tmp_path: Path) -> None:
+    spec = SyntheticResultsSpec(
+        trends=10,
+        profiles=4,
+        time_steps=60,
+        profile_time_steps=6,
+        cells=10,
+        restarts=2,
+        restart_overlap=10,
+    )
+    results_folder = tmp_path / "case.data/results"
+    writer = SWMRResultsWriter(
+        results_folder, spec, time_steps_per_write=5, write_interval=0.02
+    )
+    report = measure_live_reading(writer, poll_interval=0.01, timeout=60)
+    assert not writer.is_alive()
+
+    # All the results were picked up, each restart truncates the former file.
+    metadata = read_metadata(results_folder)
+    assert metadata.time_steps_boundaries == ((0, 0), (5 + 5 + 6, 50 + 50 + 60))
+    assert report.metadata.time_steps_boundaries == metadata.time_steps_boundaries
+    assert report.metadata.trends.keys() == metadata.trends.keys()
+    assert report.full_reloads >= spec.restarts
+    assert report.time_steps_read.sum() >= 160
+
+    # 12 flushes for each file, the 2 last of the truncated files are only read when
+    # picked up before the restart.
+    assert 3 * 12 - 2 * 2 <= len(report.latencies) <= 3 * 12
+    assert np.all(report.latencies >= 0)
+    summary = report.summary()
+    assert summary["polls"] == len(report.poll_durations)
+    assert summary["latency_p50"] <= summary["latency_max"]
+    assert summary["throughput"] > 0
+
+    trends = read_trends_data(results_folder, metadata)
+    time_sets = read_time_sets(results_folder, metadata)
+    trend_key = spec.trend_key(3)
+    time = time_sets["trend_id", metadata.trends[trend_key]["time_set_key"]]
+    np.testing.assert_array_equal(time, np.arange(160.0))
+    np.testing.assert_allclose(trends[trend_key], spec.trends_values(time)[:, 3])
+    assert not any(results_folder.glob("*.creating"))
+
+
+def test_follow_results_with_outer_pool(tmp_path: Path) -> None:
+    """
+    Files kept open by an outer pool across the writes see the data appended since.
+    """
+    spec = SyntheticResultsSpec(trends=3, profiles=2, time_steps=100, cells=5)
+    results_folder = tmp_path / "results"
+    trend_key = spec.trend_key(1)
+    times = []
+    trend_values = []
+    with keep_result_files_open(results_folder):
+        with SWMRResultsWriter(
+            results_folder, spec, time_steps_per_write=10, write_interval=0.02
+        ):
+            follower = ResultsFollower(
+                results_folder, trend_keys=[trend_key], poll_interval=0.01
+            )
+            for delta in follower:
+                assert not delta.reset
+                if trend_key not in delta.metadata.trends:
+                    continue  # Only profile time steps appended.
+                time_set_key = delta.metadata.trends[trend_key]["time_set_key"]
+                times.append(delta.time_sets["trend_id", time_set_key])
+                trend_values.append(delta.trends[trend_key])
+
+    time = np.concatenate(times)
+    np.testing.assert_array_equal(time, np.arange(100.0))
+    np.testing.assert_allclose(
+        np.concatenate(trend_values), spec.trends_values(time)[:, 1]
+    )
+
+
+def test_swmr_results_writer_stop(tmp_path: Path) -> None:
+    spec = SyntheticResultsSpec(trends=3, profiles=0, time_steps=100)
+    results_folder = tmp_path / "results"
+    with SWMRResultsWriter(
+        results_folder, spec, time_steps_per_write=10, write_interval=60
+    ) as writer:
+        deadline = time.monotonic() + 60
+        while not (flushes := list(writer.iter_flushes())):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert flushes[0].time_steps == 10
+        [result_file] = results_folder.iterdir()
+        assert _is_result_file_being_written(result_file)
+    assert not writer.is_alive()
+    assert not _is_result_file_being_written(result_file)
+    assert read_metadata(results_folder).trends_time_steps_boundaries == (0, 10)
+
+    with pytest.raises(ValueError, match="resizable"):
+        SWMRResultsWriter(results_folder, SyntheticResultsSpec(contiguous=True))
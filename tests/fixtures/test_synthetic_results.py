@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader.aggregator import (
+    read_metadata,
+    read_profiles_range,
+    read_time_sets,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.reader import Results
+from alfasim_sdk.testing.synthetic_results import (
+    SyntheticResultsSpec,
+    write_synthetic_results,
+)
+
+
+@pytest.mark.parametrize("contiguous", [False, True])
+def test_write_synthetic_results(tmp_path: Path, contiguous: bool) -> None:
+    spec = SyntheticResultsSpec(
+        trends=50,
+        profiles=9,
+        time_steps=500,
+        profile_time_steps=7,
+        cells=30,
+        restarts=2,
+        restart_overlap=100,
+        contiguous=contiguous,
+    )
+    results_folder = tmp_path / "data/results"
+    filenames = write_synthetic_results(results_folder, spec)
+    assert [f.name for f in filenames] == [
+        "results_00000",
+        "results_00400",
+        "results_00800",
+    ]
+
+    metadata = read_metadata(results_folder)
+    assert len(metadata.trends) == 50
+    assert len(metadata.profiles) == 9
+    # The restarts overlap, so former files are truncated.
+    assert metadata.trends_time_steps_boundaries == (0, 400 + 400 + 500)
+    assert metadata.profile_time_steps_boundaries == (0, 6 + 6 + 7)
+    assert metadata.app_version_info == dict.fromkeys([0, 400, 800], "synthetic")
+
+    time_sets = read_time_sets(results_folder, metadata)
+    trends = read_trends_data(results_folder, metadata)
+    for trend_index in (0, 1, 49):
+        trend_key = spec.trend_key(trend_index)
+        trend_metadata = metadata.trends[trend_key]
+        time = time_sets["trend_id", trend_metadata["time_set_key"]]
+        np.testing.assert_array_equal(time, np.arange(1300.0))
+        expected = spec.trends_values(time)[:, trend_index]
+        np.testing.assert_allclose(trends[trend_key], expected)
+        assert trend_metadata["min"] <= expected.min()
+        assert trend_metadata["max"] >= expected.max()
+
+    profile_keys = [spec.profile_key(i) for i in range(spec.profiles)]
+    profiles = read_profiles_range(results_folder, metadata, profile_keys, None, None)
+    for profile_index, profile_key in enumerate(profile_keys):
+        profile_metadata = metadata.profiles[profile_key]
+        time = time_sets["profile_id", profile_metadata["time_set_key"]]
+        expected = spec.profile_values(profile_index, time)
+        profile_data = profiles[profile_key]
+        assert profile_data is not None
+        np.testing.assert_allclose(profile_data, expected)
+        assert profile_metadata["global_min"] <= expected.min()
+        assert profile_metadata["global_max"] >= expected.max()
+
+    results = Results(results_folder.parent)
+    assert len(results.list_global_trends()) == 1
+    assert len(results.list_positional_trends()) == 49
+    assert len(results.list_profiles()) == 9
+    trend_array = results.get_positional_trend_array("holdup", "Pipe 1", (0.0, "m"))
+    # The global trend, then the 4 properties of each pipe (3 pipes) at each position.
+    np.testing.assert_allclose(
+        np.asarray(trend_array), trends[spec.trend_key(1 + 4 + 2)]
+    )
+
+
+def test_synthetic_results_spec_validation() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        SyntheticResultsSpec(trends=0)
+    with pytest.raises(ValueError, match="can't be negative"):
+        SyntheticResultsSpec(restarts=-1)
+    with pytest.raises(ValueError, match="can't be greater"):
+        SyntheticResultsSpec(time_steps=5, profile_time_steps=6)
+    with pytest.raises(ValueError, match="Invalid restart_overlap"):
+        SyntheticResultsSpec(time_steps=5, profile_time_steps=5, restart_overlap=5)
@@ -1,10 +1,15 @@
 import dataclasses
+import functools
 import itertools
+import os
 import re
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Literal
 
+import attr
+import h5py
 import numpy
 import numpy as np
 import pytest
@@ -13,6 +18,7 @@ from pytest_mock import MockerFixture
 from pytest_regressions.num_regression import NumericRegressionFixture
 
 from alfasim_sdk.result_reader.aggregator import (
+    GSACoefficientMatrix,
     GSAOutputKey,
     HistoricDataCurveMetadata,
     HistoryMatchingMetadata,
@@ -21,23 +27,44 @@ from alfasim_sdk.result_reader.aggregator import (
     TimeSetInfoItem,
     UPOutputKey,
     concatenate_metadata,
+    find_profiles_time_step_index,
+    find_trends_time_step_index,
+    keep_result_files_open,
     open_result_files,
     read_global_sensitivity_analysis_meta_data,
+    read_global_sensitivity_coefficient_matrix,
     read_global_sensitivity_coefficients,
     read_history_matching_historic_data_curves,
     read_history_matching_metadata,
     read_history_matching_result,
     read_metadata,
+    read_profiles_data,
+    read_profiles_data_by_time,
     read_profiles_local_statistics,
+    read_profiles_range,
+    read_profiles_range_by_time,
     read_time_sets,
     read_trends_data,
+    read_trends_data_by_time,
+    read_trends_decimated,
     read_uncertainty_propagation_analyses_meta_data,
+    read_uncertainty_propagation_quantiles,
     read_uncertainty_propagation_results,
     read_uq_time_set,
 )
 from alfasim_sdk.result_reader.aggregator_constants import (
     GLOBAL_SENSITIVITY_ANALYSIS_GROUP_NAME,
+    METADATA_CACHE_FILE_NAME,
     RESULTS_FOLDER_NAME,
+    UNCERTAINTY_PROPAGATION_DSET_MEAN_RESULT,
+    UNCERTAINTY_PROPAGATION_DSET_REALIZATION_OUTPUTS,
+    UNCERTAINTY_PROPAGATION_DSET_STD_RESULT,
+    UNCERTAINTY_PROPAGATION_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.instrumentation import (
+    ELEMENTS_READ,
+    HYPERSLAB_READS,
+    record_instrumentation,
 )
 from alfasim_sdk.result_reader.reader import Results
 
@@ -147,6 +174,136 @@ def test_read_metadata_invalid_index(results: Results, index_arg_name: str) -> N
         read_metadata(results.results_folder, **{index_arg_name: 999})  # type:ignore[arg-type]
 
 
+def test_read_metadata_with_cache(mocker: MockerFixture, results: Results) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    results_folder = results.results_folder
+    cache_file = results_folder / METADATA_CACHE_FILE_NAME
+    expected_md = read_metadata(results_folder)
+    assert not cache_file.exists()
+
+    outputs_spy = mocker.spy(
+        aggregator._ResultFilesMetadataReader, "read_outputs_metadata"
+    )
+    statistics_spy = mocker.spy(
+        aggregator._ResultFilesMetadataReader, "read_profiles_statistics"
+    )
+    assert read_metadata(results_folder, use_metadata_cache=True) == expected_md
+    assert cache_file.is_file()
+    assert outputs_spy.call_count == 6
+    assert statistics_spy.call_count == 3
+
+    # Nothing is read from the result files again.
+    assert read_metadata(results_folder, use_metadata_cache=True) == expected_md
+    assert outputs_spy.call_count == 6
+    assert statistics_spy.call_count == 3
+
+    # Only the changed file is read again.
+    os.utime(results_folder / "results_02605", ns=(0, 0))
+    assert read_metadata(results_folder, use_metadata_cache=True) == expected_md
+    assert outputs_spy.call_count == 8
+    assert statistics_spy.call_count == 4
+
+    # Partial reads use the cache too.
+    partial_md = read_metadata(
+        results_folder,
+        initial_profiles_time_step_index=2,
+        final_profiles_time_step_index=-2,
+        initial_trends_time_step_index=10,
+        final_trends_time_step_index=-10,
+        use_metadata_cache=True,
+    )
+    assert partial_md.trends_time_steps_boundaries == (10, 52)
+    assert outputs_spy.call_count == 8
+
+    # An invalid cache is ignored (and replaced).
+    cache_file.write_text("{")
+    assert read_metadata(results_folder, use_metadata_cache=True) == expected_md
+    assert outputs_spy.call_count == 14
+    assert read_metadata(results_folder, use_metadata_cache=True) == expected_md
+    assert outputs_spy.call_count == 14
+
+
+def test_read_metadata_with_cache_ignores_files_being_created(
+    results: Results, creating_results: list[Path]
+) -> None:
+    results_folder = results.results_folder
+    creating_results[0].unlink()
+    md = read_metadata(results_folder, use_metadata_cache=True)
+    assert md.trends_time_steps_boundaries[1] > 0
+
+    creating_results[1].unlink()
+    creating_results[2].unlink()
+    assert read_metadata(results_folder, use_metadata_cache=True) == read_metadata(
+        results_folder
+    )
+
+
+def test_read_metadata_global_statistics(
+    mocker: MockerFixture, results: Results
+) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    results_folder = results.results_folder
+    read_trends_statistic = aggregator._ResultFilesMetadataReader.read_trends_statistic
+
+    def read_with_nan(
+        self: aggregator._ResultFilesMetadataReader, base_ts: int
+    ) -> np.ndarray | None:
+        trends_statistic = read_trends_statistic(self, base_ts)
+        assert trends_statistic is not None
+        # A trend without statistics in a file does not change the merged statistics.
+        if base_ts == 2605:
+            trends_statistic[:, 1] = np.nan
+        return trends_statistic
+
+    mocker.patch.object(
+        aggregator._ResultFilesMetadataReader, "read_trends_statistic", read_with_nan
+    )
+
+    def expected_trends_statistics(
+        base_ts_list: list[int],
+    ) -> dict[str, tuple[float, float]]:
+        mins: dict[str, list[float]] = {}
+        maxs: dict[str, list[float]] = {}
+        with open_result_files(results_folder) as result_files:
+            reader = aggregator._ResultFilesMetadataReader(result_files)
+            for base_ts in base_ts_list:
+                trends_statistic = reader.read_trends_statistic(base_ts)
+                assert trends_statistic is not None
+                trends_meta = reader.read_outputs_metadata(base_ts, "trends")
+                for trend_key, meta in trends_meta.items():
+                    min_value, max_value = trends_statistic[:, meta["index"]]
+                    mins.setdefault(trend_key, []).append(min_value)
+                    maxs.setdefault(trend_key, []).append(max_value)
+        return {
+            trend_key: (np.nanmin(mins[trend_key]), np.nanmax(maxs[trend_key]))
+            for trend_key in mins
+        }
+
+    def trends_statistics(
+        metadata: aggregator.ALFASimResultMetadata,
+    ) -> dict[str, tuple[float, float]]:
+        return {
+            trend_key: (meta["min"], meta["max"])
+            for trend_key, meta in metadata.trends.items()
+        }
+
+    metadata = read_metadata(results_folder)
+    assert trends_statistics(metadata) == pytest.approx(
+        expected_trends_statistics([0, 2605, 4478])
+    )
+    assert all(type(meta["min"]) is float for meta in metadata.trends.values())
+    for meta in metadata.profiles.values():
+        assert meta["global_min"] <= meta["global_max"]
+
+    # Only the files in the range read contribute to the statistics.
+    partial_metadata = read_metadata(results_folder, initial_trends_time_step_index=30)
+    assert trends_statistics(partial_metadata) == pytest.approx(
+        expected_trends_statistics([2605, 4478])
+    )
+
+
 def test_concatenate_metadata_plain(results: Results, datadir: Path) -> None:
     results_folder = results.results_folder
 
@@ -274,6 +431,59 @@ def test_load_result_files_creating(results: Results) -> None:
             assert False, "This should not be reached in this test"  # pragma: no cover
 
 
+def test_keep_result_files_open(mocker: MockerFixture, results: Results) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    open_spy = mocker.spy(aggregator, "_open_result_file")
+    results_folder = results.results_folder
+
+    with keep_result_files_open(results_folder) as pool:
+        md = read_metadata(results_folder)
+        read_trends_data(results_folder, md)
+        read_time_sets(results_folder, md)
+        assert open_spy.call_count == 3
+        with open_result_files(results_folder) as files:
+            assert set(files) == {0, 2605, 4478}
+            pooled_files = list(files.values())
+        # The files are not closed when leaving `open_result_files`.
+        assert all(f.id.valid for f in pooled_files)
+        assert pool.get_time_set_uuids().keys() == {0, 2605, 4478}
+
+        # A file being (re)created is released, and reopened once ready.
+        creating_file = results_folder / "results_04478.creating"
+        creating_file.touch()
+        with open_result_files(results_folder) as files:
+            assert set(files) == {0, 2605}
+        assert not pooled_files[-1].id.valid
+        creating_file.unlink()
+
+        # A file released while in use (by another reader) is closed once not in use.
+        with open_result_files(results_folder) as files:
+            in_use_file = files[4478]
+            creating_file.touch()
+            with open_result_files(results_folder) as nested_files:
+                assert set(nested_files) == {0, 2605}
+            assert in_use_file.id.valid
+        assert not in_use_file.id.valid
+        creating_file.unlink()
+        with open_result_files(results_folder) as files:
+            assert set(files) == {0, 2605, 4478}
+        assert open_spy.call_count == 5
+
+        # Nested contexts share the same pool.
+        with keep_result_files_open(results_folder) as nested_pool:
+            assert nested_pool is pool
+        with open_result_files(results_folder) as files:
+            pooled_files = list(files.values())
+        assert all(f.id.valid for f in pooled_files)
+        assert open_spy.call_count == 5
+
+    assert not any(f.id.valid for f in pooled_files)
+    with open_result_files(results_folder) as files:
+        assert set(files) == {0, 2605, 4478}
+    assert open_spy.call_count == 8
+
+
 def test_read_profiles_local_statistics(
     results: Results, num_regression: NumericRegressionFixture
 ) -> None:
@@ -286,6 +496,46 @@ def test_read_profiles_local_statistics(
     num_regression.check(local_statistics)
 
 
+@pytest.mark.parametrize(
+    "start, stop, step",
+    [
+        (None, None, 1),
+        (0, 14, 3),
+        (2, 12, 1),
+        # Crossing the truncated restart file boundaries.
+        (4, 9, 2),
+        (-6, None, 1),
+        (-1, -1, 1),
+    ],
+)
+def test_read_profiles_range(
+    results: Results, start: int | None, stop: int | None, step: int
+) -> None:
+    metadata = results.metadata
+    profile_keys = list(metadata.profiles.keys())
+    profiles = read_profiles_range(
+        results.results_folder, metadata, profile_keys, start, stop, step
+    )
+
+    indexes = range(14)[slice(start, stop, step)]
+    for profile_key in profile_keys:
+        expected = [
+            read_profiles_data(results.results_folder, metadata, [profile_key], index)[
+                profile_key
+            ]
+            for index in indexes
+        ]
+        data = profiles[profile_key]
+        assert data is not None
+        assert data.shape == (len(indexes), metadata.profiles[profile_key]["size"])
+        for row, expected_row in zip(data, expected):
+            assert expected_row is not None
+            assert np.array_equal(row, expected_row)
+
+    with pytest.raises(ValueError, match="Invalid step"):
+        read_profiles_range(results.results_folder, metadata, profile_keys, 0, 1, 0)
+
+
 def test_read_trends_data_bounds_check(results: Results) -> None:
     with pytest.raises(ValueError, match="Invalid initial_trends_time_step_index"):
         read_trends_data(
@@ -298,6 +548,409 @@ def test_read_trends_data_bounds_check(results: Results) -> None:
         )
 
 
+@pytest.mark.parametrize("dense_ratio", [0.0, 0.5, 2.0])
+def test_read_trends_data_single_read_per_file(
+    mocker: MockerFixture, results: Results, dense_ratio: float
+) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    mocker.patch.object(aggregator, "_DENSE_TRENDS_COLUMNS_RATIO", dense_ratio)
+    metadata = results.metadata
+    trend_keys = list(metadata.trends.keys())
+    expected = {
+        trend_key: read_trends_data(results.results_folder, metadata, [trend_key])[
+            trend_key
+        ]
+        for trend_key in trend_keys
+    }
+
+    read_spy = mocker.spy(aggregator, "_read_trends_columns")
+    trends = read_trends_data(results.results_folder, metadata)
+    assert read_spy.call_count == 3
+    assert trends.keys() == expected.keys()
+    for trend_key, trend_data in trends.items():
+        assert np.array_equal(trend_data, expected[trend_key])
+        assert len(trend_data) == 62
+
+    # Sparse selection (in reverse order) within a time step range.
+    keys = trend_keys[::-2]
+    trends = read_trends_data(results.results_folder, metadata, keys, 10, 40)
+    assert list(trends.keys()) == keys
+    for trend_key in keys:
+        assert np.array_equal(trends[trend_key], expected[trend_key][10:40])
+
+
+def test_read_trends_data_result_file_not_open(results: Results) -> None:
+    metadata = results.metadata
+    expected = read_trends_data(results.results_folder, metadata)
+
+    # The last file is being recreated after the metadata was read.
+    (results.results_folder / "results_04478.creating").touch()
+    trends = read_trends_data(results.results_folder, metadata)
+    assert trends.keys() == expected.keys()
+    for trend_key, trend_data in trends.items():
+        assert 0 < len(trend_data) < len(expected[trend_key])
+        assert np.array_equal(trend_data, expected[trend_key][: len(trend_data)])
+
+    decimated = read_trends_decimated(results.results_folder, metadata, max_points=10)
+    assert decimated.keys() == expected.keys()
+
+
+def _minmax_reference(values: np.ndarray, max_points: int) -> np.ndarray:
+    buckets = max_points // 2
+    edges = (np.arange(buckets + 1) * len(values) + buckets - 1) // buckets
+    kept = set()
+    for start, stop in zip(edges[:-1], edges[1:]):
+        bucket = values[start:stop]
+        if start < stop and not np.isnan(bucket).all():
+            kept.add(start + int(np.nanargmin(bucket)))
+            kept.add(start + int(np.nanargmax(bucket)))
+    return np.array(sorted(kept), dtype=int)
+
+
+def _lttb_reference(
+    time: np.ndarray, values: np.ndarray, max_points: int
+) -> np.ndarray:
+    every = (len(values) - 2) / (max_points - 2)
+    kept = [0]
+    for i in range(max_points - 2):
+        start = int(i * every) + 1
+        stop = int((i + 1) * every) + 1 if i < max_points - 3 else len(values) - 1
+        if i < max_points - 3:
+            next_stop = (
+                int((i + 2) * every) + 1 if i < max_points - 4 else len(values) - 1
+            )
+            next_time = time[stop:next_stop].mean()
+            next_value = values[stop:next_stop].mean()
+        else:
+            next_time, next_value = time[-1], values[-1]
+        a = kept[-1]
+        areas = np.abs(
+            (time[a] - next_time) * (values[start:stop] - values[a])
+            - (time[a] - time[start:stop]) * (next_value - values[a])
+        )
+        kept.append(start + int(np.argmax(areas)))
+    kept.append(len(values) - 1)
+    return np.array(kept)
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+@pytest.mark.parametrize("chunk_size", [7, 1000])
+def test_trend_decimators(method: str, chunk_size: int) -> None:
+    from alfasim_sdk.result_reader.aggregator import _LTTBDecimator, _MinMaxDecimator
+
+    rng = np.random.default_rng(0)
+    time = np.cumsum(rng.uniform(0.1, 1.0, 1000))
+    values = np.cumsum(rng.normal(size=1000))
+    max_points = 41
+    decimator_class = _MinMaxDecimator if method == "minmax" else _LTTBDecimator
+    decimator = decimator_class(len(values), max_points, values.dtype)
+    for pass_index in range(decimator.passes):
+        for start in range(0, len(values), chunk_size):
+            decimator.feed(
+                pass_index,
+                start,
+                time[start : start + chunk_size],
+                values[start : start + chunk_size],
+            )
+    result = decimator.result()
+
+    if method == "minmax":
+        expected = _minmax_reference(values, max_points)
+        assert values.argmin() in expected
+        assert values.argmax() in expected
+    else:
+        expected = _lttb_reference(time, values, max_points)
+    assert len(result.values) <= max_points
+    assert np.array_equal(result.time, time[expected])
+    assert np.array_equal(result.values, values[expected])
+
+
+def test_minmax_decimator_ignores_nan() -> None:
+    from alfasim_sdk.result_reader.aggregator import _MinMaxDecimator
+
+    values = np.array([np.nan, 3.0, 1.0, np.nan, np.nan, np.nan, 2.0, 2.0])
+    decimator = _MinMaxDecimator(len(values), 6, values.dtype)
+    decimator.feed(0, 0, np.arange(8.0), values)
+    result = decimator.result()
+    assert np.array_equal(result.time, [1.0, 2.0, 6.0])
+    assert np.array_equal(result.values, [3.0, 1.0, 2.0])
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_read_trends_decimated(
+    results: Results, method: Literal["minmax", "lttb"]
+) -> None:
+    metadata = results.metadata
+    results_folder = results.results_folder
+    trends = read_trends_data(results_folder, metadata)
+    [trends_time] = [
+        time_set
+        for (source, _), time_set in read_time_sets(results_folder, metadata).items()
+        if source == "trend_id"
+    ]
+
+    # Not decimated.
+    decimated = read_trends_decimated(
+        results_folder, metadata, max_points=62, method=method, chunk_size=10
+    )
+    assert decimated.keys() == trends.keys()
+    for trend_key, (time, values) in decimated.items():
+        assert np.array_equal(time, trends_time)
+        assert np.array_equal(values, trends[trend_key])
+
+    # Decimated (in chunks crossing the result files boundaries).
+    keys = list(trends)[:2]
+    decimated = read_trends_decimated(
+        results_folder, metadata, keys, 5, 60, max_points=10, method=method
+    )
+    decimated_in_chunks = read_trends_decimated(
+        results_folder,
+        metadata,
+        keys,
+        5,
+        60,
+        max_points=10,
+        method=method,
+        chunk_size=4,
+    )
+    assert list(decimated) == keys
+    for trend_key, (time, values) in decimated.items():
+        assert 3 <= len(values) <= 10
+        assert time[0] == trends_time[5]
+        assert time[-1] == trends_time[59]
+        indexes = np.searchsorted(trends_time, time)
+        assert np.array_equal(values, trends[trend_key][indexes])
+        assert np.array_equal(time, decimated_in_chunks[trend_key].time)
+        assert np.array_equal(values, decimated_in_chunks[trend_key].values)
+
+    with pytest.raises(ValueError, match="Invalid max_points"):
+        read_trends_decimated(results_folder, metadata, max_points=1, method=method)
+
+
+def test_read_trends_decimated_invalid_arguments(results: Results) -> None:
+    with pytest.raises(ValueError, match="Invalid decimation method"):
+        read_trends_decimated(
+            results.results_folder,
+            results.metadata,
+            max_points=10,
+            method="first",  # type:ignore[arg-type]
+        )
+    with pytest.raises(ValueError, match="Invalid chunk_size"):
+        read_trends_decimated(
+            results.results_folder, results.metadata, max_points=10, chunk_size=0
+        )
+
+
+def test_find_time_step_index(mocker: MockerFixture, results: Results) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    metadata = results.metadata
+    results_folder = results.results_folder
+    time_sets = read_time_sets(results_folder, metadata)
+    [trends_time] = [
+        time_set for (source, _), time_set in time_sets.items() if source == "trend_id"
+    ]
+    profile_key = next(iter(metadata.profiles))
+    profiles_time = time_sets[
+        ("profile_id", metadata.profiles[profile_key]["time_set_key"])
+    ]
+
+    read_spy = mocker.spy(aggregator, "_read_time_sets")
+    finders: list[tuple[np.ndarray, Callable[[float, Any], int]]] = [
+        (
+            trends_time,
+            functools.partial(find_trends_time_step_index, results_folder, metadata),
+        ),
+        (
+            profiles_time,
+            functools.partial(
+                find_profiles_time_step_index, results_folder, metadata, profile_key
+            ),
+        ),
+    ]
+    for time_set, find in finders:
+        times = [time_set[0] - 1, *time_set[[0, 3, 4, 5, 6, -1]], time_set[-1] + 1]
+        for time in times:
+            for offset in (0.0, 0.4, 0.5, 0.6):
+                t = time + offset * (time_set[1] - time_set[0])
+                for side in ("left", "right"):
+                    assert find(t, side) == np.searchsorted(time_set, t, side), (
+                        t,
+                        side,
+                    )
+                assert find(t, "nearest") == np.argmin(np.abs(time_set - t)), t
+
+    # The time sets are never read entirely.
+    assert read_spy.call_count == 0
+
+    with pytest.raises(ValueError, match="Invalid side"):
+        find_trends_time_step_index(results_folder, metadata, 0.0, "center")  # type:ignore[arg-type]
+
+
+def test_read_by_time(results: Results) -> None:
+    metadata = results.metadata
+    results_folder = results.results_folder
+    time_sets = read_time_sets(results_folder, metadata)
+    [trends_time] = [
+        time_set for (source, _), time_set in time_sets.items() if source == "trend_id"
+    ]
+    trends = read_trends_data(results_folder, metadata)
+
+    # Bounds are inclusive (both are between result files).
+    t_start, t_stop = trends_time[20], trends_time[40]
+    selected = (trends_time >= t_start) & (trends_time <= t_stop)
+    for t_start_offset in (0.0, -0.5):
+        trends_by_time = read_trends_data_by_time(
+            results_folder, metadata, None, t_start + t_start_offset, t_stop + 0.5
+        )
+        assert trends_by_time.keys() == trends.keys()
+        for trend_key, values in trends_by_time.items():
+            assert np.array_equal(values, trends[trend_key][selected])
+
+    # Out of the results range (or an inverted range).
+    for t_start, t_stop, expected_size in (
+        (None, None, len(trends_time)),
+        (trends_time[-1] + 1, None, 0),
+        (None, trends_time[0] - 1, 0),
+        (trends_time[30], trends_time[10], 0),
+    ):
+        trends_by_time = read_trends_data_by_time(
+            results_folder, metadata, None, t_start, t_stop
+        )
+        assert all(len(values) == expected_size for values in trends_by_time.values())
+
+    profile_keys = list(metadata.profiles)
+    profiles_time = time_sets[
+        ("profile_id", metadata.profiles[profile_keys[0]]["time_set_key"])
+    ]
+    t_start, t_stop = profiles_time[2] - 1, profiles_time[9]
+    profiles = read_profiles_range(results_folder, metadata, profile_keys, 2, 10, 2)
+    profiles_by_time = read_profiles_range_by_time(
+        results_folder, metadata, profile_keys[::-1], t_start, t_stop, 2
+    )
+    assert list(profiles_by_time) == profile_keys[::-1]
+    for profile_key, profile_data in profiles.items():
+        assert np.array_equal(profiles_by_time[profile_key], profile_data)  # type:ignore[arg-type]
+
+    nearest = profiles_time[6] + 0.4 * (profiles_time[7] - profiles_time[6])
+    profiles = read_profiles_data(results_folder, metadata, profile_keys, 6)
+    profiles_by_time = read_profiles_data_by_time(
+        results_folder, metadata, profile_keys, nearest
+    )
+    for profile_key, profile_data in profiles.items():
+        assert np.array_equal(profiles_by_time[profile_key], profile_data)  # type:ignore[arg-type]
+
+
+def test_read_with_workers(results: Results) -> None:
+    results_folder = results.results_folder
+    metadata = read_metadata(results_folder)
+    assert read_metadata(results_folder, workers=2) == metadata
+    assert read_metadata(results_folder, workers=3, use_metadata_cache=True) == metadata
+    partial_metadata = read_metadata(
+        results_folder,
+        initial_profiles_time_step_index=3,
+        initial_trends_time_step_index=30,
+    )
+    assert (
+        read_metadata(
+            results_folder,
+            initial_profiles_time_step_index=3,
+            initial_trends_time_step_index=30,
+            workers=2,
+        )
+        == partial_metadata
+    )
+
+    expected_trends = read_trends_data(results_folder, metadata)
+    trends = read_trends_data(results_folder, metadata, workers=2)
+    assert trends.keys() == expected_trends.keys()
+    for trend_key, trend_data in trends.items():
+        assert np.array_equal(trend_data, expected_trends[trend_key])
+
+    profile_keys = list(metadata.profiles.keys())
+    expected_profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, 2, None, 3
+    )
+    profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, 2, None, 3, workers=2
+    )
+    assert profiles.keys() == expected_profiles.keys()
+    for profile_key, profile_data in profiles.items():
+        assert np.array_equal(profile_data, expected_profiles[profile_key])  # type:ignore[arg-type]
+
+    with pytest.raises(ValueError, match="Invalid number of workers"):
+        read_metadata(results_folder, workers=0)
+
+
+def _repack_contiguous(result_file: Path) -> None:
+    """
+    Rewrite a result file storing all the data sets contiguously (not chunked).
+    """
+    import h5py
+
+    repacked_file = result_file.with_name("repacked")
+    with h5py.File(result_file, "r") as source, h5py.File(repacked_file, "w") as target:
+
+        def copy(name: str, item: h5py.HLObject) -> None:
+            if isinstance(item, h5py.Dataset):
+                copied = target.create_dataset(name, data=item[()])
+            else:
+                copied = target.require_group(name)
+            copied.attrs.update(item.attrs)
+
+        target.attrs.update(source.attrs)
+        source.visititems(copy)
+    repacked_file.replace(result_file)
+
+
+def test_read_with_mmap(results: Results) -> None:
+    metadata = results.metadata
+    results_folder = results.results_folder
+    trend_keys = list(metadata.trends.keys())
+    profile_keys = list(metadata.profiles.keys())
+    # The first file holds the trends [0, 25) and the profiles [0, 5).
+    expected_trends = read_trends_data(results_folder, metadata, trend_keys, 10, 20)
+    expected_full_trends = read_trends_data(results_folder, metadata, trend_keys)
+    expected_profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, 1, 4
+    )
+    expected_full_profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, None, None
+    )
+
+    # Chunked data sets fall back to the normal reads.
+    trends = read_trends_data(results_folder, metadata, trend_keys, 10, 20, mmap=True)
+    assert not any(isinstance(data, np.memmap) for data in trends.values())
+
+    for result_file in results_folder.glob("results_*"):
+        _repack_contiguous(result_file)
+
+    trends = read_trends_data(results_folder, metadata, trend_keys, 10, 20, mmap=True)
+    for trend_key, data in trends.items():
+        assert isinstance(data, np.memmap)
+        assert np.array_equal(data, expected_trends[trend_key])
+
+    profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, 1, 4, mmap=True
+    )
+    for profile_key, profile_data in profiles.items():
+        assert isinstance(profile_data, np.memmap)
+        assert np.array_equal(profile_data, expected_profiles[profile_key])  # type:ignore[arg-type]
+
+    # Data spanning many files is copied.
+    trends = read_trends_data(results_folder, metadata, trend_keys, mmap=True)
+    for trend_key, data in trends.items():
+        assert not isinstance(data, np.memmap)
+        assert np.array_equal(data, expected_full_trends[trend_key])
+    profiles = read_profiles_range(
+        results_folder, metadata, profile_keys, None, None, mmap=True
+    )
+    for profile_key, profile_data in profiles.items():
+        assert not isinstance(profile_data, np.memmap)
+        assert np.array_equal(profile_data, expected_full_profiles[profile_key])  # type:ignore[arg-type]
+
+
 def test_read_trends_data_empty_arrays_when_no_time_set_info(results: Results) -> None:
     fake_metadata = dataclasses.replace(results.metadata)
     fake_metadata.time_set_info = {}
@@ -405,6 +1058,96 @@ def test_read_uq_global_sensitivity_analysis(global_sa_results_dir: Path) -> Non
         GSAOutputKey.from_string("temperate@param_var_1::trend_id")
 
 
+def test_read_global_sensitivity_coefficient_matrix(
+    global_sa_results_dir: Path,
+) -> None:
+    metadata = read_global_sensitivity_analysis_meta_data(global_sa_results_dir)
+    assert metadata is not None
+    with record_instrumentation() as recorder:
+        matrix = read_global_sensitivity_coefficient_matrix(
+            global_sa_results_dir, metadata
+        )
+    assert matrix is not None
+    # The time set and the coefficients are read at once.
+    assert recorder.as_dict()["counters"][HYPERSLAB_READS] == 2
+
+    output = ("temperature", "trend_id_1")
+    assert matrix.outputs == [output]
+    assert matrix.parametric_var_ids == ["parametric_var_1", "parametric_var_2"]
+    assert matrix.output_indexes == {output: 0}
+    assert matrix.parametric_var_indexes == {
+        "parametric_var_1": 0,
+        "parametric_var_2": 1,
+    }
+    np.testing.assert_array_equal(matrix.timeset, [1, 2, 3, 4, 5, 6, 7])
+    assert matrix.coefficients.shape == (1, 2, 7)
+    coefficients = read_global_sensitivity_coefficients(global_sa_results_dir, metadata)
+    for key, values in coefficients.items():
+        np.testing.assert_array_equal(matrix[key], values)
+
+    np.testing.assert_allclose(matrix.time_integrated_sensitivity(), [[11.4, 12.4]])
+    assert matrix.top_k(1) == {output: ["parametric_var_2"]}
+    assert matrix.top_k(5, time_index=0) == {
+        output: ["parametric_var_2", "parametric_var_1"]
+    }
+
+    assert (
+        read_global_sensitivity_coefficient_matrix(
+            global_sa_results_dir.parent, metadata
+        )
+        is None
+    )
+
+
+def test_gsa_coefficient_matrix_ranking() -> None:
+    outputs = [("pressure", "Pipe 1"), ("holdup", "Pipe 1")]
+    parametric_var_ids = ["a", "b", "c"]
+    coefficients = np.array(
+        [
+            # The sign does not matter, "b" dominates in time.
+            [[0.1, 0.1, 0.1], [-0.9, 0.0, 0.0], [0.2, 0.2, 0.2]],
+            # "c" has no coefficients for this output.
+            [[0.0, 0.5, 1.0], [0.2, 0.2, 0.2], [np.nan] * 3],
+        ]
+    )
+    matrix = GSACoefficientMatrix(
+        timeset=np.array([0.0, 1.0, 3.0]),
+        coefficients=coefficients,
+        outputs=outputs,
+        parametric_var_ids=parametric_var_ids,
+        output_indexes={output: i for i, output in enumerate(outputs)},
+        parametric_var_indexes={
+            var_id: i for i, var_id in enumerate(parametric_var_ids)
+        },
+    )
+    np.testing.assert_allclose(
+        matrix.time_integrated_sensitivity(),
+        [[0.1, 0.15, 0.2], [(0.25 + 1.5) / 3, 0.2, np.nan]],
+    )
+    np.testing.assert_array_equal(matrix.top_k_indexes(2), [[2, 1], [0, 1]])
+    assert matrix.top_k(3) == {
+        outputs[0]: ["c", "b", "a"],
+        outputs[1]: ["a", "b", "c"],
+    }
+    assert matrix.top_k(1, time_index=0) == {outputs[0]: ["b"], outputs[1]: ["b"]}
+    np.testing.assert_array_equal(
+        matrix[GSAOutputKey("holdup", "a", "Pipe 1")], [0.0, 0.5, 1.0]
+    )
+
+    # No time span, the samples are averaged.
+    for timeset in ([2.0], [2.0, 2.0, 2.0]):
+        single_time_matrix = attr.evolve(
+            matrix,
+            timeset=np.array(timeset),
+            coefficients=coefficients[..., -len(timeset) :],
+        )
+        with np.errstate(divide="raise", invalid="raise"):
+            sensitivity = single_time_matrix.time_integrated_sensitivity()
+        np.testing.assert_allclose(
+            sensitivity, np.abs(coefficients[..., -len(timeset) :]).mean(axis=-1)
+        )
+
+
 def test_read_incomplete_gsa_metadata(global_sa_results_dir: Path) -> None:
     """
     When a .creating result file exists in the results folder,
@@ -663,3 +1406,124 @@ def test_read_uncertainty_propagation_results(
     # Coverage. Check the UPOutputKey correctly fail to parse bad strings.
     with pytest.raises(ValueError, match="invalid output key: temperate::trend_id"):
         UPOutputKey.from_string("temperate::trend_id")
+
+
+def test_read_uncertainty_propagation_results_batched(up_results_dir: Path) -> None:
+    metadata = read_uncertainty_propagation_analyses_meta_data(
+        result_directory=up_results_dir
+    )
+    assert metadata is not None
+    with h5py.File(up_results_dir / "result", "r") as file:
+        up_group = file[UNCERTAINTY_PROPAGATION_GROUP_NAME]
+        realizations = up_group[UNCERTAINTY_PROPAGATION_DSET_REALIZATION_OUTPUTS][()]
+        mean = up_group[UNCERTAINTY_PROPAGATION_DSET_MEAN_RESULT][()]
+        std = up_group[UNCERTAINTY_PROPAGATION_DSET_STD_RESULT][()]
+
+    with record_instrumentation() as recorder:
+        result = read_uncertainty_propagation_results(up_results_dir, metadata)
+    assert list(result) == list(metadata.items)
+    for key, meta in metadata.items.items():
+        assert result[key].realization_output.shape == (5, 7)
+        np.testing.assert_array_equal(
+            result[key].realization_output, realizations[:, meta.result_index]
+        )
+        np.testing.assert_array_equal(result[key].mean_result, mean[meta.result_index])
+        np.testing.assert_array_equal(result[key].std_result, std[meta.result_index])
+    # One read of each data set for the mean and std, one read for the realizations of each item.
+    datasets = recorder.as_dict()["datasets"]
+    group = UNCERTAINTY_PROPAGATION_GROUP_NAME
+    assert {name: counters[HYPERSLAB_READS] for name, counters in datasets.items()} == {
+        f"/{group}/{UNCERTAINTY_PROPAGATION_DSET_REALIZATION_OUTPUTS}": 2,
+        f"/{group}/{UNCERTAINTY_PROPAGATION_DSET_MEAN_RESULT}": 1,
+        f"/{group}/{UNCERTAINTY_PROPAGATION_DSET_STD_RESULT}": 1,
+    }
+
+    temp_key = UPOutputKey("temperature", "trend_id_1")
+    # Sparse (sorted unique selection) and dense (whole span) subsets, in any order.
+    for sample_subset in ([4, 0], [3, 1, 2, 1]):
+        result = read_uncertainty_propagation_results(
+            up_results_dir, metadata, [temp_key], sample_subset=sample_subset
+        )
+        np.testing.assert_array_equal(
+            result[temp_key].realization_output, realizations[sample_subset, 0]
+        )
+        np.testing.assert_array_equal(result[temp_key].mean_result, mean[0])
+
+    result = read_uncertainty_propagation_results(
+        up_results_dir, metadata, [temp_key], summary_only=True
+    )
+    assert result[temp_key].realization_output.shape == (0, 7)
+    np.testing.assert_array_equal(result[temp_key].mean_result, mean[0])
+    np.testing.assert_array_equal(result[temp_key].std_result, std[0])
+
+
+def test_read_uncertainty_propagation_quantiles(up_results_dir: Path) -> None:
+    metadata = read_uncertainty_propagation_analyses_meta_data(
+        result_directory=up_results_dir
+    )
+    assert metadata is not None
+    realizations = read_uncertainty_propagation_results(up_results_dir, metadata)
+
+    # 5 samples, so 2 time steps in each block.
+    with record_instrumentation() as recorder:
+        quantiles = read_uncertainty_propagation_quantiles(
+            up_results_dir, metadata, (0.1, 0.5, 0.9), bins=3, block_size=10
+        )
+    assert list(quantiles) == list(metadata.items)
+    for key, bands in quantiles.items():
+        realization_output = realizations[key].realization_output
+        np.testing.assert_array_equal(bands.quantiles, [0.1, 0.5, 0.9])
+        np.testing.assert_allclose(
+            bands.bands, np.quantile(realization_output, [0.1, 0.5, 0.9], axis=0)
+        )
+        assert bands.histogram is not None and bands.bin_edges is not None
+        assert bands.histogram.shape == (7, 3)
+        for time_step, values in enumerate(realization_output.T):
+            histogram, edges = np.histogram(values, bins=3)
+            np.testing.assert_array_equal(bands.histogram[time_step], histogram)
+            np.testing.assert_allclose(bands.bin_edges[time_step], edges)
+    datasets = recorder.as_dict()["datasets"]
+    realizations_dataset = datasets[
+        f"/{UNCERTAINTY_PROPAGATION_GROUP_NAME}/{UNCERTAINTY_PROPAGATION_DSET_REALIZATION_OUTPUTS}"
+    ]
+    assert realizations_dataset[HYPERSLAB_READS] == 2 * 4
+    assert realizations_dataset[ELEMENTS_READ] == 2 * 5 * 7
+
+    temp_key = UPOutputKey("temperature", "trend_id_1")
+    bin_edges = [0.0, 1.0, 2.5, 4.0]
+    quantiles = read_uncertainty_propagation_quantiles(
+        up_results_dir,
+        metadata,
+        [0.5],
+        [temp_key],
+        bins=bin_edges,
+        sample_subset=[0, 2, 4],
+    )
+    realization_output = realizations[temp_key].realization_output[[0, 2, 4]]
+    [bands] = quantiles.values()
+    np.testing.assert_allclose(bands.bands, [np.median(realization_output, axis=0)])
+    assert bands.histogram is not None and bands.bin_edges is not None
+    for time_step, values in enumerate(realization_output.T):
+        histogram, _ = np.histogram(values, bins=bin_edges)
+        np.testing.assert_array_equal(bands.histogram[time_step], histogram)
+        np.testing.assert_array_equal(bands.bin_edges[time_step], bin_edges)
+
+    # Any integral type is a number of bins.
+    numpy_int_quantiles = read_uncertainty_propagation_quantiles(
+        up_results_dir, metadata, [0.5], [temp_key], bins=np.int64(3)
+    )
+    int_bins_histogram = numpy_int_quantiles[temp_key].histogram
+    assert int_bins_histogram is not None and int_bins_histogram.shape == (7, 3)
+
+    quantiles = read_uncertainty_propagation_quantiles(up_results_dir, metadata)
+    assert quantiles[temp_key].histogram is None
+    assert quantiles[temp_key].bands.shape == (3, 7)
+
+    with pytest.raises(ValueError, match="must be between 0 and 1"):
+        read_uncertainty_propagation_quantiles(up_results_dir, metadata, [50])
+    with pytest.raises(ValueError, match="must increase monotonically"):
+        read_uncertainty_propagation_quantiles(
+            up_results_dir, metadata, bins=[1.0, 0.0]
+        )
+    with pytest.raises(ValueError, match="Invalid bins"):
+        read_uncertainty_propagation_quantiles(up_results_dir, metadata, bins=0)
@@ -0,0 +1,266 @@
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import h5py
+import pytest
+from pytest_mock import MockerFixture
+
+from alfasim_sdk.result_reader import catalog as catalog_module
+from alfasim_sdk.result_reader.aggregator import read_metadata
+from alfasim_sdk.result_reader.aggregator_constants import (
+    META_GROUP_NAME,
+    METADATA_CACHE_FILE_NAME,
+)
+from alfasim_sdk.result_reader.catalog import (
+    CatalogMatch,
+    ResultsCatalog,
+    find_data_folders,
+)
+from alfasim_sdk.testing.synthetic_results import (
+    SyntheticResultsSpec,
+    write_synthetic_results,
+)
+
+
+def _write_status(data_folder: Path, state: str) -> None:
+    with sqlite3.connect(data_folder / "communication.sqlite") as connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS status"
+            " (_id INTEGER PRIMARY KEY, creation_timestamp REAL, state TEXT, progress REAL)"
+        )
+        connection.execute(
+            "INSERT INTO status (creation_timestamp, state, progress) VALUES (?, ?, ?)",
+            (1.0, state, 1.0 if state == "FINISHED" else 0.5),
+        )
+    connection.close()
+
+
+def _expected_matches(
+    data_folders: list[Path], property_id: str, predicate=lambda meta: True
+) -> list[CatalogMatch]:
+    matches = []
+    for data_folder in sorted(data_folders, key=lambda f: str(f.absolute())):
+        metadata = read_metadata(data_folder / "results")
+        matches += [
+            CatalogMatch(data_folder.absolute(), "trend", key)
+            for key, meta in sorted(metadata.trends.items())
+            if meta["property_id"] == property_id and predicate(meta)
+        ]
+    return matches
+
+
+def test_results_catalog(tmp_path: Path, mocker: MockerFixture) -> None:
+    root = tmp_path / "studies"
+    spec = SyntheticResultsSpec(
+        trends=17, profiles=4, time_steps=50, profile_time_steps=5, cells=10
+    )
+    run_a = root / "run_a"
+    run_b = root / "run_b"
+    run_c = root / "nested/run_c"
+    write_synthetic_results(run_a / "results", spec)
+    write_synthetic_results(
+        run_b / "results",
+        SyntheticResultsSpec(
+            trends=9,
+            profiles=2,
+            time_steps=50,
+            profile_time_steps=5,
+            cells=10,
+            restarts=1,
+            restart_overlap=10,
+            seed=1,
+        ),
+    )
+    write_synthetic_results(run_c / "results", spec)
+    (root / "not_a_data_folder").mkdir()
+    _write_status(run_a, "RUNNING")
+
+    data_folders = list(find_data_folders(root))
+    assert data_folders == [run_c, run_a, run_b]
+
+    read_entry_spy = mocker.spy(catalog_module, "_read_catalog_entry")
+    database = tmp_path / "catalog.sqlite"
+    with ResultsCatalog(database) as catalog:
+        report = catalog.index(data_folders)
+        assert report.indexed == data_folders
+        assert report.unchanged == report.removed == []
+        assert report.failed == {}
+        assert catalog.data_folders() == sorted(
+            (f.absolute() for f in data_folders), key=str
+        )
+
+        assert catalog.query("pressure", output_type="trend") == _expected_matches(
+            data_folders, "pressure"
+        )
+        assert catalog.query("pressure", output_type="profile") != []
+        assert catalog.query("temperature", "Pipe 1", position=1.0) == (
+            _expected_matches(
+                data_folders,
+                "temperature",
+                lambda meta: (
+                    meta["network_element_name"] == "Pipe 1" and meta["position"] == 1.0
+                ),
+            )
+        )
+        assert catalog.query("pressure", "Pipe [12]", output_type="trend") == (
+            _expected_matches(
+                data_folders,
+                "pressure",
+                lambda meta: meta["network_element_name"] in ("Pipe 1", "Pipe 2"),
+            )
+        )
+
+        # Thresholds in the outputs unit or converted from another unit.
+        pressure_max = sorted(
+            meta["max"]
+            for data_folder in data_folders
+            for meta in read_metadata(data_folder / "results").trends.values()
+            if meta["property_id"] == "pressure"
+        )
+        threshold = pressure_max[len(pressure_max) // 2]
+        expected = _expected_matches(
+            data_folders, "pressure", lambda meta: meta["max"] > threshold
+        )
+        assert 0 < len(expected) < len(pressure_max)
+        assert catalog.query("pressure", max_above=threshold) == expected
+        assert catalog.query("pressure", max_above=(threshold / 1e5, "bar")) == expected
+        # Incompatible units never match.
+        assert catalog.query("pressure", max_above=(0.0, "m")) == []
+        assert catalog.query(min_below=(-1e9, "Pa")) == []
+
+        assert {m.data_folder for m in catalog.query(status="RUNNING")} == {
+            run_a.absolute()
+        }
+        assert catalog.query(status="FINISHED") == []
+        assert catalog.query(app_version="synth*") != []
+        assert catalog.query(app_version="2025.1") == []
+
+        entry = catalog.get_entry(run_b)
+        assert entry is not None
+        assert entry.status is None
+        assert entry.app_version_info == {0: "synthetic", 40: "synthetic"}
+        assert (entry.time_start, entry.time_end) == (0.0, 89.0)
+        assert entry.time_sets_unit == "s"
+        entry = catalog.get_entry(run_a)
+        assert entry is not None
+        assert entry.status is not None and entry.status["state"] == "RUNNING"
+        assert catalog.get_entry(root) is None
+    assert read_entry_spy.call_count == 3
+
+    # Incremental indexing: only changed results are read again, the status is updated.
+    read_entry_spy.reset_mock()
+    _write_status(run_a, "FINISHED")
+    for result_file in (run_b / "results").iterdir():
+        result_file.unlink()
+    write_synthetic_results(run_b / "results", spec)
+    with ResultsCatalog(database) as catalog:
+        report = catalog.index(data_folders)
+        assert report.indexed == [run_b]
+        assert report.unchanged == [run_c, run_a]
+        assert read_entry_spy.call_count == 1
+        assert {m.data_folder for m in catalog.query(status="FINISHED")} == {
+            run_a.absolute()
+        }
+        entry = catalog.get_entry(run_b)
+        assert entry is not None
+        assert entry.app_version_info == {0: "synthetic"}
+        assert catalog.query("pressure", output_type="trend") == _expected_matches(
+            data_folders, "pressure"
+        )
+
+        report = catalog.index(data_folders, force=True)
+        assert report.indexed == data_folders
+
+        # Results removed.
+        for result_file in (run_c / "results").iterdir():
+            result_file.unlink()
+        (run_c / "results").rmdir()
+        report = catalog.index([run_c])
+        assert report.removed == [run_c]
+        assert catalog.query("pressure", output_type="trend") == _expected_matches(
+            [run_a, run_b], "pressure"
+        )
+        for result_file in (run_b / "results").iterdir():
+            result_file.unlink()
+        (run_b / "results").rmdir()
+        assert catalog.prune() == [run_b.absolute()]
+        assert catalog.data_folders() == [run_a.absolute()]
+
+
+def test_results_catalog_failures(tmp_path: Path, mocker: MockerFixture) -> None:
+    data_folder = tmp_path / "broken"
+    (data_folder / "results").mkdir(parents=True)
+    (data_folder / "results/results_00000").write_bytes(b"not a HDF5 file")
+    corrupt_data_folder = tmp_path / "corrupt"
+    good_data_folder = tmp_path / "good"
+    spec = SyntheticResultsSpec(
+        trends=3, profiles=1, time_steps=5, profile_time_steps=5, cells=4
+    )
+    for folder in (corrupt_data_folder, good_data_folder):
+        write_synthetic_results(folder / "results", spec)
+    with h5py.File(corrupt_data_folder / "results/results_00000", "r+") as result_file:
+        result_file[META_GROUP_NAME].attrs["trends"] = "{not json"
+
+    database = tmp_path / "catalog.sqlite"
+    with ResultsCatalog(database) as catalog:
+        report = catalog.index([data_folder, corrupt_data_folder, good_data_folder])
+        assert report.indexed == [good_data_folder]
+        assert list(report.failed) == [data_folder, corrupt_data_folder]
+        assert report.failed[corrupt_data_folder].startswith("JSONDecodeError")
+        assert catalog.data_folders() == [good_data_folder.absolute()]
+    # The catalog does not write into the results it indexes.
+    assert not (good_data_folder / "results" / METADATA_CACHE_FILE_NAME).exists()
+
+    _write_status(good_data_folder, "FINISHED")
+    database = tmp_path / "os_errors_catalog.sqlite"
+    unreadable_data_folder = tmp_path / "unreadable"
+    (unreadable_data_folder / "results").mkdir(parents=True)
+    removed_data_folder = tmp_path / "removed"
+    write_synthetic_results(removed_data_folder / "results", spec)
+    scandir = os.scandir
+
+    class RemovedEntry:
+        def __init__(self, entry: os.DirEntry) -> None:
+            self.name = entry.name
+            self.is_file = entry.is_file
+
+        def stat(self) -> os.stat_result:
+            raise FileNotFoundError(f"Removed: {self.name}")
+
+    def scandir_with_errors(path: Path) -> Any:
+        if Path(path).parent == unreadable_data_folder:
+            raise PermissionError(f"Permission denied: {path}")
+        if Path(path).parent == removed_data_folder:
+            return [RemovedEntry(entry) for entry in scandir(path)]
+        return scandir(path)
+
+    mocker.patch.object(catalog_module.os, "scandir", side_effect=scandir_with_errors)
+    mocker.patch.object(
+        catalog_module.Results,
+        "status",
+        new_callable=mocker.PropertyMock,
+        side_effect=PermissionError("Permission denied: communication.sqlite"),
+    )
+    with ResultsCatalog(database) as catalog:
+        # The other data folders are still indexed.
+        report = catalog.index(
+            [unreadable_data_folder, removed_data_folder, good_data_folder]
+        )
+        assert report.indexed == [good_data_folder]
+        assert list(report.failed) == [unreadable_data_folder, removed_data_folder]
+        assert report.failed[unreadable_data_folder].startswith("PermissionError")
+        assert report.failed[removed_data_folder].startswith("FileNotFoundError")
+        entry = catalog.get_entry(good_data_folder)
+        assert entry is not None and entry.status is None
+    mocker.stopall()
+
+    database = tmp_path / "catalog.sqlite"
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            "UPDATE catalog_info SET value = '99' WHERE name = 'schema_version'"
+        )
+    connection.close()
+    with pytest.raises(ValueError, match="Unsupported results catalog version 99"):
+        ResultsCatalog(database)
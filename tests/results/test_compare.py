@@ -0,0 +1,115 @@
+import json
+import shutil
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader import compare_results
+from alfasim_sdk.result_reader.aggregator_constants import (
+    META_GROUP_NAME,
+    PROFILES_GROUP_NAME,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+
+@pytest.fixture()
+def results_copy(results: Results, tmp_path: Path) -> Path:
+    results_folder = tmp_path / "results_copy"
+    shutil.copytree(results.results_folder, results_folder)
+    return results_folder
+
+
+def test_compare_equal_results(results: Results, results_copy: Path) -> None:
+    comparison = compare_results(results.results_folder, results_copy)
+    assert comparison.equal
+    assert comparison.mismatches == []
+    assert comparison.only_in_a == comparison.only_in_b == []
+    metadata = results.metadata
+    assert [output.key_a for output in comparison.outputs] == [
+        *metadata.trends,
+        *metadata.profiles,
+    ]
+    for output in comparison.outputs:
+        assert output.key_a == output.key_b
+        assert output.compared == output.size_a == output.size_b
+        assert output.size_a == (62 if output.kind == "trend" else 14)
+        assert output.max_deviation == 0.0
+
+
+@pytest.mark.parametrize("chunk_size", [2, 1000])
+def test_compare_different_results(
+    results: Results, results_copy: Path, chunk_size: int
+) -> None:
+    metadata = results.metadata
+    trend_key = list(metadata.trends)[1]
+    trend_column = metadata.trends[trend_key]["index"][2605]
+    profile_key = next(iter(metadata.profiles))
+    data_id = metadata.profiles[profile_key]["data_id"][4478]
+    removed_trend_key = list(metadata.trends)[3]
+
+    # The trends of the second file (global index 25 on, truncated at 32) and the profiles of the third file
+    # (time step 8 on) change.
+    for result_file in sorted(results_copy.glob("results_*")):
+        with h5py.File(result_file, "r+") as f:
+            trends_meta = json.loads(f[META_GROUP_NAME].attrs["trends"])
+            del trends_meta[removed_trend_key]
+            f[META_GROUP_NAME].attrs["trends"] = json.dumps(trends_meta)
+            if result_file.name == "results_02605":
+                f[TRENDS_GROUP_NAME]["trends"][3, trend_column] += 1e-9
+                f[TRENDS_GROUP_NAME]["trends"][4, trend_column] += 1.0
+                f[TRENDS_GROUP_NAME]["trends"][6, trend_column] -= 3.0
+            if result_file.name == "results_04478":
+                f[PROFILES_GROUP_NAME][data_id][1, 7] = np.nan
+
+    comparison = compare_results(
+        results.results_folder,
+        results_copy,
+        rtol=0.0,
+        atol=1e-6,
+        trends_chunk_size=chunk_size,
+        profiles_chunk_size=chunk_size,
+    )
+    assert not comparison.equal
+    assert comparison.only_in_a == [removed_trend_key]
+    assert comparison.only_in_b == []
+    mismatches = {output.key_a: output for output in comparison.mismatches}
+    assert mismatches.keys() == {trend_key, profile_key}
+
+    trend_comparison = mismatches[trend_key]
+    assert trend_comparison.mismatch_index == 29
+    if chunk_size == 2:
+        # Stops at the first chunk out of the tolerance.
+        assert trend_comparison.compared == 30
+        assert trend_comparison.max_deviation == pytest.approx(1.0)
+        assert trend_comparison.max_deviation_index == 29
+    else:
+        assert trend_comparison.compared == 62
+        assert trend_comparison.max_deviation == pytest.approx(3.0)
+        assert trend_comparison.max_deviation_index == 31
+    assert trend_comparison.max_deviation_point is None
+
+    profile_comparison = mismatches[profile_key]
+    assert profile_comparison.mismatch_index == 9
+    assert profile_comparison.max_deviation == np.inf
+    assert profile_comparison.max_deviation_index == 9
+    assert profile_comparison.max_deviation_point == 7
+
+    # Only the given outputs are compared.
+    comparison = compare_results(
+        results.results_folder, results_copy, rtol=0.0, atol=1e-6, keys=[profile_key]
+    )
+    assert [output.key_a for output in comparison.outputs] == [profile_key]
+    assert comparison.only_in_a == comparison.only_in_b == []
+
+
+def test_compare_results_different_sizes(results: Results, results_copy: Path) -> None:
+    (results_copy / "results_04478").unlink()
+    comparison = compare_results(results.results_folder, results_copy)
+    assert not comparison.equal
+    for output in comparison.outputs:
+        assert output.size_b < output.size_a
+        assert output.mismatch_index == output.compared == output.size_b
+        assert output.max_deviation == 0.0
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader import export_trends
+from alfasim_sdk.result_reader.aggregator import read_time_sets, read_trends_data
+from alfasim_sdk.result_reader.export import (
+    ExportFormat,
+    iter_trends_record_batches,
+    trends_arrow_schemas,
+)
+from alfasim_sdk.result_reader.instrumentation import (
+    HYPERSLAB_READS,
+    record_instrumentation,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_export_trends(
+    results: Results, tmp_path: Path, file_format: ExportFormat
+) -> None:
+    metadata = results.metadata
+    results_folder = results.results_folder
+    with record_instrumentation() as recorder:
+        exported = export_trends(
+            results_folder,
+            metadata,
+            tmp_path / "export",
+            file_format=file_format,
+            row_group_size=10,
+        )
+    # One read of the trends and one of the time set for each row group.
+    datasets = recorder.as_dict()["datasets"]
+    assert datasets["/trends/trends"][HYPERSLAB_READS] == 7
+    assert datasets["/trends/time_set"][HYPERSLAB_READS] == 7
+
+    trends = read_trends_data(results_folder, metadata)
+    time_sets = read_time_sets(results_folder, metadata)
+    assert list(exported) == [(0, 2605, 4478)]
+    filename = exported[(0, 2605, 4478)]
+    assert filename == tmp_path / "export" / f"trends_0_2605_4478.{file_format}"
+
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        parquet_file = pyarrow.parquet.ParquetFile(filename)
+        # Row groups are split at the result files boundaries.
+        assert [
+            parquet_file.metadata.row_group(i).num_rows
+            for i in range(parquet_file.num_row_groups)
+        ] == [10, 10, 5, 7, 10, 10, 10]
+        table = parquet_file.read()
+    else:
+        table = pa.ipc.open_file(filename).read_all()
+
+    assert table.column_names == ["time", *trends]
+    assert np.array_equal(
+        table.column("time").to_numpy(), time_sets[("trend_id", (0, 2605, 4478))]
+    )
+    for trend_key, values in trends.items():
+        assert np.array_equal(table.column(trend_key).to_numpy(), values)
+
+    field_metadata = table.schema.field(
+        "pressure@project.study_container.item00001.output_options"
+        ".trend_out_definition_container.item00002"
+    ).metadata
+    assert field_metadata[b"property_id"] == b"pressure"
+    assert field_metadata[b"unit"] == b"Pa"
+    assert field_metadata[b"network_element_name"] == "Conexão 1".encode()
+    assert json.loads(field_metadata[b"position"]) == 300.0
+    assert b"index" not in field_metadata
+    assert json.loads(table.schema.metadata[b"time_set_key"]) == [0, 2605, 4478]
+
+
+def test_iter_trends_record_batches(results: Results) -> None:
+    metadata = results.metadata
+    trend_keys = list(metadata.trends)[:2]
+    [schema] = trends_arrow_schemas(metadata, trend_keys).values()
+    assert schema.names == ["time", *trend_keys]
+
+    batches = list(
+        iter_trends_record_batches(
+            results.results_folder, metadata, schema, row_group_size=100
+        )
+    )
+    assert [batch.num_rows for batch in batches] == [25, 7, 30]
+    trends = read_trends_data(results.results_folder, metadata, trend_keys)
+    for trend_key in trend_keys:
+        values = np.concatenate(
+            [batch.column(trend_key).to_numpy() for batch in batches]
+        )
+        assert np.array_equal(values, trends[trend_key])
+
+    with pytest.raises(ValueError, match="Invalid row_group_size"):
+        next(
+            iter_trends_record_batches(
+                results.results_folder, metadata, schema, row_group_size=0
+            )
+        )
+    with pytest.raises(ValueError, match="Invalid export format"):
+        export_trends(results.results_folder, metadata, Path(), file_format="csv")  # type:ignore[arg-type]
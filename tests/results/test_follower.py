@@ -0,0 +1,165 @@
+import asyncio
+import dataclasses
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+from alfasim_sdk.result_reader.aggregator import read_metadata, read_trends_data
+from alfasim_sdk.result_reader.aggregator_constants import (
+    PROFILES_GROUP_NAME,
+    TIME_SET_DSET_NAME,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.follower import (
+    ResultsDelta,
+    ResultsFollower,
+    _copy_new_items,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+
+def _append_time_steps(
+    result_file: Path, *, trends_count: int, profiles_count: int
+) -> np.ndarray:
+    """
+    Append time steps (repeating the last values) to a result file.
+
+    :return:
+        The trends appended.
+    """
+    with h5py.File(result_file, "r+") as f:
+        for group_name, count in (
+            (TRENDS_GROUP_NAME, trends_count),
+            (PROFILES_GROUP_NAME, profiles_count),
+        ):
+            group = f[group_name]
+            time_set = group[TIME_SET_DSET_NAME]
+            size = time_set.shape[0]
+            last_time = time_set[-1]
+            for dset in group.values():
+                if dset.shape[0] == size and dset.maxshape[0] is None:
+                    last_value = dset[-1]
+                    dset.resize(size + count, axis=0)
+                    dset[size:] = last_value
+            time_set[size:] = last_time + np.arange(1, count + 1)
+        return f[TRENDS_GROUP_NAME]["trends"][-trends_count:]
+
+
+def test_results_follower(results: Results, creating_results: list[Path]) -> None:
+    results_folder = results.results_folder
+    follower = ResultsFollower(results_folder)
+    assert follower.poll() is None
+    assert follower.metadata is None
+
+    # Simulation has 1 result file.
+    creating_results[0].unlink()
+    delta = follower.poll()
+    assert delta is not None
+    assert not delta.reset
+    md = read_metadata(results_folder)
+    assert delta.metadata.time_steps_boundaries == md.time_steps_boundaries
+    expected_trends = read_trends_data(results_folder, md)
+    assert delta.trends.keys() == expected_trends.keys()
+    for key, values in expected_trends.items():
+        assert np.array_equal(delta.trends[key], values)
+    for key, profile_meta in md.profiles.items():
+        profile = delta.profiles[key]
+        assert profile is not None
+        assert profile.shape == (
+            md.profile_time_steps_boundaries[1],
+            profile_meta["size"],
+        )
+
+    # Nothing new.
+    assert follower.poll() is None
+
+    # Only the appended time steps are read.
+    initial_profiles, initial_trends = md.time_steps_boundaries[1]
+    appended_trends = _append_time_steps(
+        creating_results[0].with_suffix(""), trends_count=3, profiles_count=1
+    )
+    delta = follower.poll()
+    assert delta is not None
+    assert not delta.reset
+    assert delta.metadata.time_steps_boundaries == (
+        (initial_profiles, initial_trends),
+        (initial_profiles + 1, initial_trends + 3),
+    )
+    for key, trend_meta in delta.metadata.trends.items():
+        column = trend_meta["index"][0]
+        assert np.array_equal(delta.trends[key], appended_trends[:, column])
+    for key, profile_meta in delta.metadata.profiles.items():
+        profile = delta.profiles[key]
+        assert profile is not None
+        assert profile.shape == (1, profile_meta["size"])
+    for (source, _), time_set in delta.time_sets.items():
+        assert len(time_set) == (3 if source == "trend_id" else 1)
+
+    # The followed metadata is the same as reading it again.
+    assert follower.metadata is not None
+    md = read_metadata(results_folder)
+    assert follower.metadata.time_steps_boundaries == md.time_steps_boundaries
+    assert follower.metadata.trends.keys() == md.trends.keys()
+    assert follower.metadata.profiles.keys() == md.profiles.keys()
+
+    # Simulate a restart (now the results have two files).
+    creating_results[1].unlink()
+    delta = follower.poll()
+    assert delta is not None
+    assert delta.reset
+    md = read_metadata(results_folder)
+    assert delta.metadata.time_steps_boundaries == md.time_steps_boundaries
+
+
+def test_results_follower_keys(results: Results) -> None:
+    md = read_metadata(results.results_folder)
+    trend_key = next(iter(md.trends))
+    follower = ResultsFollower(
+        results.results_folder, trend_keys=[trend_key, "unknown@trend"], profile_keys=[]
+    )
+    delta = follower.poll()
+    assert delta is not None
+    assert list(delta.trends) == [trend_key]
+    assert delta.profiles == {}
+
+
+def test_results_follower_iteration(results: Results) -> None:
+    # The result files are not being written, so a single delta is yielded.
+    deltas = list(ResultsFollower(results.results_folder, poll_interval=0))
+    assert len(deltas) == 1
+    assert deltas[0].metadata.time_steps_boundaries == ((0, 0), (14, 62))
+
+    async def follow() -> list[ResultsDelta]:
+        return [
+            delta
+            async for delta in ResultsFollower(results.results_folder, poll_interval=0)
+        ]
+
+    deltas = asyncio.run(follow())
+    assert len(deltas) == 1
+    assert deltas[0].metadata.time_steps_boundaries == ((0, 0), (14, 62))
+
+
+def test_copy_new_items(results: Results) -> None:
+    metadata = results.metadata
+    trend_key, new_trend_key = list(metadata.trends)[:2]
+    previous_metadata = dataclasses.replace(
+        metadata,
+        profiles={},
+        trends={trend_key: metadata.trends[trend_key]},
+    )
+    copied = _copy_new_items(previous_metadata, metadata)
+    # The items already followed are only read when concatenated, the new ones are
+    # updated in place later on (so not shared with the metadata handed out).
+    assert copied.trends[trend_key] is metadata.trends[trend_key]
+    assert copied.trends[new_trend_key] is not metadata.trends[new_trend_key]
+    assert (
+        copied.trends[new_trend_key]["index"] == metadata.trends[new_trend_key]["index"]
+    )
+    assert (
+        copied.trends[new_trend_key]["index"]
+        is not metadata.trends[new_trend_key]["index"]
+    )
+    for key, profile_meta in metadata.profiles.items():
+        assert copied.profiles[key] is not profile_meta
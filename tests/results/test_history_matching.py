@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader.aggregator import (
+    HMOutputKey,
+    read_history_matching_historic_data_curves,
+    read_history_matching_metadata,
+    read_history_matching_result,
+)
+from alfasim_sdk.result_reader.history_matching import (
+    compute_history_matching_misfits,
+    read_history_matching_posterior,
+)
+from alfasim_sdk.result_reader.instrumentation import (
+    ELEMENTS_READ,
+    HYPERSLAB_READS,
+    record_instrumentation,
+)
+
+
+def test_read_history_matching_posterior(
+    hm_probabilistic_results_dir: Path, hm_deterministic_results_dir: Path
+) -> None:
+    metadata = read_history_matching_metadata(hm_probabilistic_results_dir)
+    assert metadata is not None
+    with record_instrumentation() as recorder:
+        posterior = read_history_matching_posterior(
+            hm_probabilistic_results_dir, metadata
+        )
+    assert recorder.as_dict()["counters"][HYPERSLAB_READS] == 1
+    assert posterior is not None
+
+    keys = [HMOutputKey("parametric_var_1"), HMOutputKey("parametric_var_2")]
+    assert posterior.keys == keys
+    assert posterior.samples.shape == (5, 2)
+    results = read_history_matching_result(
+        hm_probabilistic_results_dir, metadata, "HM-probabilistic"
+    )
+    for i, key in enumerate(keys):
+        np.testing.assert_array_equal(posterior[key], results[key])
+        np.testing.assert_array_equal(posterior.samples[:, i], results[key])
+        # Only the column of a single parametric var is read.
+        with record_instrumentation() as recorder:
+            result = read_history_matching_result(
+                hm_probabilistic_results_dir, metadata, "HM-probabilistic", key
+            )
+        assert recorder.as_dict()["counters"][ELEMENTS_READ] == 5
+        np.testing.assert_array_equal(result[key], results[key])
+    np.testing.assert_array_equal(posterior.min_values, [0.0, 2.5])
+    assert posterior.key_indexes == {keys[0]: 0, keys[1]: 1}
+    np.testing.assert_array_equal(posterior.max_values, [1.0, 7.5])
+
+    samples = posterior.samples
+    np.testing.assert_allclose(posterior.mean(), samples.mean(axis=0))
+    np.testing.assert_allclose(posterior.std(), samples.std(axis=0))
+    np.testing.assert_allclose(
+        posterior.quantiles([0.5, 0.9]), np.quantile(samples, [0.5, 0.9], axis=0)
+    )
+    assert posterior.summary([0.5]) == {
+        key: {
+            "mean": pytest.approx(samples[:, i].mean()),
+            "std": pytest.approx(samples[:, i].std()),
+            "p50": pytest.approx(np.median(samples[:, i])),
+        }
+        for i, key in enumerate(keys)
+    }
+
+    histogram, edges = posterior.histograms(4)
+    assert histogram.shape == (2, 4)
+    for i, (low, high) in enumerate([(0.0, 1.0), (2.5, 7.5)]):
+        expected, expected_edges = np.histogram(samples[:, i], 4, range=(low, high))
+        np.testing.assert_array_equal(histogram[i], expected)
+        np.testing.assert_allclose(edges[i], expected_edges)
+    histogram, edges = posterior.histograms(3, prior_range=False)
+    for i in range(2):
+        expected, expected_edges = np.histogram(samples[:, i], 3)
+        np.testing.assert_array_equal(histogram[i], expected)
+        np.testing.assert_allclose(edges[i], expected_edges)
+
+    deterministic_metadata = read_history_matching_metadata(
+        hm_deterministic_results_dir
+    )
+    assert deterministic_metadata is not None
+    assert (
+        read_history_matching_posterior(
+            hm_deterministic_results_dir, deterministic_metadata
+        )
+        is None
+    )
+
+
+def test_compute_history_matching_misfits(hm_probabilistic_results_dir: Path) -> None:
+    metadata = read_history_matching_metadata(hm_probabilistic_results_dir)
+    assert metadata is not None
+    curves = read_history_matching_historic_data_curves(
+        hm_probabilistic_results_dir, metadata
+    )
+
+    time = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    # 3 realizations of each trend.
+    holdup = np.array([[0.0, 0.2, 0.4, 0.6, 0.8], [0.1] * 5, [0.5, 0.5, 1.0, 1.0, 0.0]])
+    pressure = np.linspace(0.0, 10.0, 15).reshape(3, 5)
+    misfits = compute_history_matching_misfits(
+        metadata,
+        curves,
+        {"holdup@trend_1": (time, holdup), "pressure@trend_2": (time, pressure)},
+        norms=["l1", "l2", "rms", "max"],
+    )
+    assert misfits.keys() == {"observed_curve_1", "observed_curve_2"}
+    for curve_id, values in (
+        ("observed_curve_1", holdup),
+        ("observed_curve_2", pressure),
+    ):
+        observed, domain = curves[curve_id]
+        residuals = np.array([np.interp(domain, time, v) for v in values]) - observed
+        curve_misfits = misfits[curve_id]
+        np.testing.assert_allclose(curve_misfits["l1"], np.abs(residuals).sum(axis=1))
+        np.testing.assert_allclose(
+            curve_misfits["l2"], np.linalg.norm(residuals, axis=1)
+        )
+        np.testing.assert_allclose(
+            curve_misfits["rms"], np.sqrt(np.mean(residuals**2, axis=1))
+        )
+        np.testing.assert_allclose(curve_misfits["max"], np.abs(residuals).max(axis=1))
+
+    # A single simulation.
+    misfits = compute_history_matching_misfits(
+        metadata,
+        curves,
+        {"holdup@trend_1": (time, holdup[0]), "pressure@trend_2": (time, pressure[0])},
+    )
+    observed, domain = curves["observed_curve_1"]
+    assert misfits["observed_curve_1"].keys() == {"rms"}
+    assert misfits["observed_curve_1"]["rms"] == pytest.approx(
+        np.sqrt(np.mean((np.interp(domain, time, holdup[0]) - observed) ** 2))
+    )
+
+    with pytest.raises(ValueError, match="No simulated trend pressure@trend_2"):
+        compute_history_matching_misfits(
+            metadata, curves, {"holdup@trend_1": (time, holdup)}
+        )
+    with pytest.raises(ValueError, match="Invalid misfit norms: foo"):
+        compute_history_matching_misfits(
+            metadata, curves, {"holdup@trend_1": (time, holdup)}, norms=["foo"]
+        )
@@ -0,0 +1,151 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from alfasim_sdk.result_reader.aggregator import (
+    read_global_sensitivity_analysis_meta_data,
+    read_global_sensitivity_coefficients,
+    read_history_matching_historic_data_curves,
+    read_history_matching_metadata,
+    read_history_matching_result,
+    read_metadata,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.instrumentation import (
+    BYTES_READ,
+    ELEMENTS_READ,
+    FILES_OPENED,
+    HYPERSLAB_READS,
+    JSON_BYTES_PARSED,
+    get_instrumentation_recorder,
+    record_instrumentation,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+
+def test_record_instrumentation(results: Results, tmp_path: Path) -> None:
+    results_folder = results.results_folder
+    assert get_instrumentation_recorder() is None
+
+    with record_instrumentation() as recorder:
+        assert get_instrumentation_recorder() is recorder
+        metadata = read_metadata(results_folder)
+        trends = read_trends_data(results_folder, metadata)
+    assert get_instrumentation_recorder() is None
+
+    # Nothing is recorded once disabled.
+    read_metadata(results_folder)
+
+    recorded = recorder.as_dict()
+    counters = recorded["counters"]
+    assert counters[FILES_OPENED] == 6
+    assert counters[JSON_BYTES_PARSED] > 0
+    assert counters[HYPERSLAB_READS] > 0
+
+    calls = recorded["calls"]
+    assert calls.keys() == {"read_metadata", "read_trends_data"}
+    assert calls["read_metadata"]["count"] == 1
+    assert calls["read_metadata"]["counters"][FILES_OPENED] == 3
+    read_metadata_counters = calls["read_metadata"]["counters"]
+    assert read_metadata_counters[JSON_BYTES_PARSED] == counters[JSON_BYTES_PARSED]
+    trends_counters = calls["read_trends_data"]["counters"]
+    assert trends_counters[FILES_OPENED] == 3
+    assert trends_counters[ELEMENTS_READ] >= sum(len(v) for v in trends.values())
+    assert trends_counters[BYTES_READ] == 8 * trends_counters[ELEMENTS_READ]
+
+    trends_dataset = recorded["datasets"]["/trends/trends"]
+    assert trends_dataset[HYPERSLAB_READS] == 3
+    assert trends_dataset[ELEMENTS_READ] == trends_counters[ELEMENTS_READ]
+
+    timings = recorded["timings"]
+    for name in (
+        "read_metadata",
+        "_read_global_metadata",
+        "read_time_set_info",
+        "_merge_metadata_and_read_global_statistics",
+        "read_trends_data",
+        "_read_trends_columns",
+    ):
+        assert timings[name]["count"] >= 1, name
+        assert 0 <= timings[name]["max"] <= timings[name]["total"]
+    assert timings["_read_trends_columns"]["count"] == 3
+
+    trace_file = tmp_path / "trace.json"
+    recorder.dump_chrome_trace(trace_file)
+    trace = json.loads(trace_file.read_text(encoding="utf-8"))
+    events = trace["traceEvents"]
+    assert {event["ph"] for event in events} == {"X"}
+    [read_metadata_event] = [e for e in events if e["name"] == "read_metadata"]
+    assert read_metadata_event["cat"] == "call"
+    assert read_metadata_event["args"] == calls["read_metadata"]["counters"]
+    [time_set_info_event, _] = [e for e in events if e["name"] == "read_time_set_info"]
+    assert time_set_info_event["cat"] == "span"
+    assert (
+        read_metadata_event["ts"]
+        <= time_set_info_event["ts"]
+        <= read_metadata_event["ts"] + read_metadata_event["dur"]
+    )
+
+
+def test_record_instrumentation_threads(results: Results) -> None:
+    results_folder = results.results_folder
+    metadata = read_metadata(results_folder)
+
+    with record_instrumentation() as recorder:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda _: read_trends_data(results_folder, metadata), range(8)
+                )
+            )
+
+    recorded = recorder.as_dict()
+    read_trends_call = recorded["calls"]["read_trends_data"]
+    assert read_trends_call["count"] == 8
+    assert read_trends_call["counters"][FILES_OPENED] == 8 * 3
+    assert recorded["counters"] == read_trends_call["counters"]
+
+
+def test_record_instrumentation_lazy_arrays(results: Results) -> None:
+    trend_array = results.get_global_trend_array("timestep")
+    profile_array = results.get_profile_array("pressure", "Conexão 1")
+
+    with record_instrumentation() as recorder:
+        trend_values = trend_array[::2]
+        profile_values = profile_array[-3:]
+
+    datasets = recorder.as_dict()["datasets"]
+    assert datasets["/trends/trends"][ELEMENTS_READ] == len(trend_values)
+    profile_elements = sum(
+        counters[ELEMENTS_READ]
+        for name, counters in datasets.items()
+        if name.startswith("/profiles/")
+    )
+    assert profile_elements == profile_values.size
+
+
+def test_record_instrumentation_uq_readers(
+    global_sa_results_dir: Path, hm_probabilistic_results_dir: Path
+) -> None:
+    gsa_metadata = read_global_sensitivity_analysis_meta_data(global_sa_results_dir)
+    hm_metadata = read_history_matching_metadata(hm_probabilistic_results_dir)
+    assert gsa_metadata is not None and hm_metadata is not None
+
+    with record_instrumentation() as recorder:
+        read_global_sensitivity_coefficients(global_sa_results_dir, gsa_metadata)
+        read_history_matching_result(
+            hm_probabilistic_results_dir, hm_metadata, hm_type="HM-probabilistic"
+        )
+        read_history_matching_historic_data_curves(
+            hm_probabilistic_results_dir, hm_metadata
+        )
+
+    calls = recorder.as_dict()["calls"]
+    assert calls.keys() == {
+        "read_global_sensitivity_coefficients",
+        "read_history_matching_result",
+        "read_history_matching_historic_data_curves",
+    }
+    for call in calls.values():
+        assert call["count"] == 1
+        assert call["counters"][HYPERSLAB_READS] > 0
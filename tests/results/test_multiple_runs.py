@@ -0,0 +1,121 @@
+import shutil
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader import MultipleRunsResults
+from alfasim_sdk.result_reader.aggregator import (
+    read_metadata,
+    read_time_sets,
+    read_trends_data,
+)
+from alfasim_sdk.result_reader.aggregator_constants import (
+    MULTIPLE_RUNS_FOLDER,
+    RESULTS_FOLDER_NAME,
+    TRENDS_GROUP_NAME,
+)
+from alfasim_sdk.result_reader.reader import Results
+
+
+@pytest.fixture()
+def multiple_runs_data_folder(results: Results, tmp_path: Path) -> Path:
+    """
+    A simulation with the runs "1", "2" and "10" (copies of `results` with the trends scaled
+    by the run id) and a folder without results.
+    """
+    data_folder = tmp_path / "project.data"
+    for run_id in ("10", "2", "1"):
+        run_results_folder = (
+            data_folder / MULTIPLE_RUNS_FOLDER / run_id / RESULTS_FOLDER_NAME
+        )
+        shutil.copytree(results.results_folder, run_results_folder)
+        for result_file in run_results_folder.glob("results_*"):
+            with h5py.File(result_file, "r+") as f:
+                f[TRENDS_GROUP_NAME]["trends"][...] *= int(run_id)
+    (data_folder / MULTIPLE_RUNS_FOLDER / "no_results").mkdir()
+    return data_folder
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_multiple_runs_results(
+    results: Results, multiple_runs_data_folder: Path, workers: int
+) -> None:
+    multiple_runs = MultipleRunsResults(multiple_runs_data_folder, workers=workers)
+    assert multiple_runs.run_ids == ["1", "2", "10"]
+
+    all_metadata = multiple_runs.metadata
+    assert list(all_metadata) == ["1", "2", "10"]
+    expected_metadata = read_metadata(results.results_folder)
+    for metadata in all_metadata.values():
+        assert metadata.time_steps_boundaries == expected_metadata.time_steps_boundaries
+        assert metadata.profiles == expected_metadata.profiles
+    # Each run has its own metadata items.
+    profile_key = next(iter(expected_metadata.profiles))
+    assert (
+        all_metadata["1"].profiles[profile_key]
+        is not all_metadata["10"].profiles[profile_key]
+    )
+
+    trends = multiple_runs.read_trends()
+    expected_trends = read_trends_data(results.results_folder, expected_metadata)
+    [expected_time] = [
+        time_set
+        for (source, _), time_set in read_time_sets(
+            results.results_folder, expected_metadata
+        ).items()
+        if source == "trend_id"
+    ]
+    assert trends.keys() == expected_trends.keys()
+    for trend_key, (time, values) in trends.items():
+        assert np.array_equal(time, expected_time)
+        assert values.shape == (3, 62)
+        for row, factor in zip(values, (1, 2, 10)):
+            assert np.allclose(row, expected_trends[trend_key] * factor)
+
+
+def test_multiple_runs_results_different_time_sets(
+    results: Results, multiple_runs_data_folder: Path
+) -> None:
+    # The run "2" has only the first result file.
+    run_results_folder = (
+        multiple_runs_data_folder / MULTIPLE_RUNS_FOLDER / "2" / RESULTS_FOLDER_NAME
+    )
+    for result_file in sorted(run_results_folder.glob("results_*"))[1:]:
+        result_file.unlink()
+
+    multiple_runs = MultipleRunsResults(multiple_runs_data_folder, workers=1)
+    trend_key = next(iter(multiple_runs.metadata["1"].trends))
+    with pytest.raises(ValueError, match="different time sets"):
+        multiple_runs.read_trends([trend_key])
+
+    time = np.array([5.0, 100.0, 400.0])
+    [(trend_time, values)] = multiple_runs.read_trends([trend_key], time=time).values()
+    assert trend_time is time
+    expected = read_trends_data(results.results_folder, results.metadata, [trend_key])
+    expected_time = read_time_sets(results.results_folder, results.metadata)
+    [expected_time_set] = [
+        time_set
+        for (source, _), time_set in expected_time.items()
+        if source == "trend_id"
+    ]
+    expected_values = np.interp(time, expected_time_set, expected[trend_key])
+    assert np.allclose(values[0], expected_values)
+    assert np.allclose(values[2], expected_values * 10)
+    # Out of the time range of the run.
+    assert np.allclose(values[1][:2], expected_values[:2] * 2)
+    assert np.isnan(values[1][2])
+
+    with pytest.raises(KeyError, match="not found"):
+        multiple_runs.read_trends(["unknown@trend"])
+
+
+def test_multiple_runs_results_no_runs(tmp_path: Path) -> None:
+    multiple_runs = MultipleRunsResults(tmp_path)
+    assert multiple_runs.run_ids == []
+    assert multiple_runs.metadata == {}
+    assert multiple_runs.read_trends() == {}
+
+    with pytest.raises(ValueError, match="Invalid number of workers"):
+        MultipleRunsResults(tmp_path, workers=0)
@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 from barril.curve.curve import Curve
 from barril.units import Array, Scalar
+from pytest_mock import MockerFixture
 
 from alfasim_sdk.result_reader.aggregator import (
     GlobalSensitivityAnalysisMetadata,
@@ -19,7 +20,9 @@ from alfasim_sdk.result_reader.aggregator import (
     UPOutputKey,
     read_history_matching_metadata,
     read_history_matching_result,
+    read_time_sets,
 )
+from alfasim_sdk.result_reader.aggregator_constants import METADATA_CACHE_FILE_NAME
 from alfasim_sdk.result_reader.reader import (
     GlobalSensitivityAnalysisResults,
     GlobalTrendMetadata,
@@ -131,6 +134,179 @@ def test_list_positional_trends(results: Results) -> None:
     assert mixture_temperature.image.GetUnit() == "K"
 
 
+def test_results_keep_files_open(mocker: MockerFixture, results: Results) -> None:
+    from alfasim_sdk.result_reader import aggregator
+
+    open_spy = mocker.spy(aggregator, "_open_result_file")
+    with results:
+        results.get_global_trend_curve("timestep")
+        results.get_overall_trend_curve("pipe total liquid volume", "Conexão 1")
+        results.get_profile_curve("pressure", "Conexão 1", 0)
+        results.get_profile_curve("pressure", "Conexão 1", -1)
+    assert open_spy.call_count == 3
+
+    # Outside the context the files are opened once per read.
+    results.get_profile_curve("pressure", "Conexão 1", 0)
+    assert open_spy.call_count == 6
+
+
+def test_results_outputs_index(mocker: MockerFixture, results: Results) -> None:
+    from alfasim_sdk.result_reader import reader
+
+    index_spy = mocker.spy(reader._OutputsIndex, "from_metadata")
+    read_trend_spy = mocker.spy(results, "_read_trend")
+    results.get_global_trend_curve("timestep")
+    results.get_overall_trend_curve("pipe total liquid volume", "Conexão 1")
+    results.get_positional_trend_curve("pressure", "Conexão 1", (300.0, "m"))
+    results.get_profile_curve("pressure", "Conexão 1", 0)
+    assert index_spy.call_count == 1
+
+    # Positions are located within the margin.
+    results.get_positional_trend_curve("pressure", "Conexão 1", (30000.5, "cm"))
+    (trend_key,) = read_trend_spy.call_args.args
+    assert results.metadata.trends[trend_key]["property_id"] == "pressure"
+    with pytest.raises(RuntimeError, match="Can not locate"):
+        results.get_positional_trend_curve("pressure", "Conexão 1", (300.02, "m"))
+    with pytest.raises(RuntimeError, match="Can not locate"):
+        results.get_overall_trend_curve("pressure", "Conexão 1")
+    assert index_spy.call_count == 1
+
+    # The index is built again when the metadata is refreshed.
+    results.refresh_metadata()
+    results.get_global_trend_curve("timestep")
+    assert index_spy.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(-10, None),
+        slice(None, None, 7),
+        slice(3, 40, 4),
+        slice(None, None, -3),
+        slice(30, 2, -5),
+        slice(40, 10),
+        0,
+        24,
+        25,
+        -1,
+    ],
+)
+def test_trend_arrays(results: Results, index: int | slice) -> None:
+    curves_and_arrays = [
+        (
+            results.get_global_trend_curve("timestep"),
+            results.get_global_trend_array("timestep"),
+        ),
+        (
+            results.get_overall_trend_curve("pipe total liquid volume", "Conexão 1"),
+            results.get_overall_trend_array("pipe total liquid volume", "Conexão 1"),
+        ),
+        (
+            results.get_positional_trend_curve("pressure", "Conexão 1", (300, "m")),
+            results.get_positional_trend_array("pressure", "Conexão 1", (300, "m")),
+        ),
+    ]
+    for curve, trend_array in curves_and_arrays:
+        assert len(trend_array) == len(curve.domain) == 62
+        assert trend_array.shape == (62,)
+        assert np.array_equal(np.asarray(trend_array), curve.image.GetValues())
+        assert np.array_equal(trend_array[index], curve.image.GetValues()[index])
+        assert np.array_equal(trend_array.time[index], curve.domain.GetValues()[index])
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@pytest.mark.parametrize("chunk", [1, 4, 100])
+def test_iter_profiles(
+    mocker: MockerFixture, results: Results, chunk: int, prefetch: bool
+) -> None:
+    curves = [results.get_profile_curve("pressure", "Conexão 1", i) for i in range(14)]
+    time_set = read_time_sets(results.results_folder, results.metadata)
+    [profiles_time] = [
+        values for (source, _), values in time_set.items() if source == "profile_id"
+    ]
+
+    from alfasim_sdk.result_reader import aggregator
+
+    open_spy = mocker.spy(aggregator, "open_result_files")
+    time_steps = list(
+        results.iter_profiles(
+            "pressure", "Conexão 1", 2, -1, chunk=chunk, prefetch=prefetch
+        )
+    )
+    assert open_spy.call_count == 1
+    assert len(time_steps) == 11
+    for i, (time, domain, values) in zip(range(2, 13), time_steps):
+        assert time == profiles_time[i]
+        assert np.array_equal(domain, curves[i].domain.GetValues())
+        assert np.array_equal(values, curves[i].image.GetValues())
+
+    # The domain is read once for each result file.
+    domains = {id(time_step.domain) for time_step in time_steps}
+    assert len(domains) == 3
+
+    # Stopping the iteration early.
+    iterator = results.iter_profiles(
+        "pressure", "Conexão 1", chunk=2, prefetch=prefetch
+    )
+    assert next(iterator).time == profiles_time[0]
+    del iterator
+
+    with pytest.raises(ValueError, match="Invalid chunk_size"):
+        next(results.iter_profiles("pressure", "Conexão 1", chunk=0))
+
+
+def test_profile_arrays(results: Results) -> None:
+    profile_array = results.get_profile_array("pressure", "Conexão 1")
+    assert len(profile_array) == 14
+    assert profile_array.ndim == 2
+    expected = np.array(
+        [
+            results.get_profile_curve("pressure", "Conexão 1", i).image.GetValues()
+            for i in range(14)
+        ]
+    )
+    assert profile_array.shape == expected.shape
+    assert np.array_equal(np.asarray(profile_array), expected)
+    indexes: list[int | slice] = [
+        slice(-3, None),
+        slice(None, None, 4),
+        slice(None, None, -5),
+        4,
+        -1,
+    ]
+    for index in indexes:
+        assert np.array_equal(profile_array[index], expected[index])
+    assert np.array_equal(profile_array[2:9, 3], expected[2:9, 3])
+    assert np.array_equal(profile_array[-1, 1:4], expected[-1, 1:4])
+
+    time_set = read_time_sets(results.results_folder, results.metadata)
+    (profile_time_set,) = [
+        values for (source, _), values in time_set.items() if source == "profile_id"
+    ]
+    assert np.array_equal(profile_array.time[:], profile_time_set)
+
+    with pytest.raises(IndexError):
+        profile_array[14]
+    with pytest.raises(RuntimeError, match="Can not locate"):
+        results.get_profile_array("<invalid property>", "<element name>")
+
+
+def test_results_metadata_cache(results: Results) -> None:
+    cache_file = results.results_folder / METADATA_CACHE_FILE_NAME
+    assert results.metadata is not None
+    assert not cache_file.exists()
+
+    cached_results = Results(results.data_folder, use_metadata_cache=True)
+    assert cached_results.metadata == results.metadata
+    assert cache_file.is_file()
+    assert (
+        Results(results.data_folder, use_metadata_cache=True).metadata
+        == results.metadata
+    )
+
+
 def test_logs(results: Results) -> None:
     log = results.log
     assert "Simulation finished" in log.read_text()
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from alfasim_sdk.result_reader.aggregator import read_profiles_range, read_trends_data
+from alfasim_sdk.result_reader.reader import Results
+from alfasim_sdk.result_reader.statistics import (
+    _StatisticsAccumulator,
+    compute_profile_statistics,
+    compute_trend_statistics,
+)
+
+STATS = ["count", "mean", "std", "var", "min", "max", "p0", "p10", "p50", "p90", "p100"]
+
+
+def _numpy_statistics(values: np.ndarray) -> dict[str, np.ndarray]:
+    return {
+        "count": np.full(values.shape[1:], len(values)),
+        "mean": values.mean(axis=0),
+        "std": values.std(axis=0),
+        "var": values.var(axis=0),
+        "min": values.min(axis=0),
+        "max": values.max(axis=0),
+        **{
+            f"p{percentile}": np.percentile(values, percentile, axis=0)
+            for percentile in (0, 10, 50, 90, 100)
+        },
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_compute_profile_statistics(results: Results, chunk_size: int) -> None:
+    metadata = results.metadata
+    profile_keys = list(metadata.profiles)
+    # The range spans the 3 result files (each with a different profile data set).
+    profiles = read_profiles_range(
+        results.results_folder, metadata, profile_keys, 2, -1
+    )
+    statistics = compute_profile_statistics(
+        results.results_folder,
+        metadata,
+        profile_keys,
+        2,
+        -1,
+        STATS,
+        chunk_size=chunk_size,
+    )
+    assert list(statistics) == profile_keys
+    for profile_key, profile_statistics in statistics.items():
+        profile_data = profiles[profile_key]
+        assert profile_data is not None
+        expected = _numpy_statistics(profile_data)
+        assert list(profile_statistics) == STATS
+        for name, values in profile_statistics.items():
+            assert values.shape == (20,)
+            assert np.allclose(values, expected[name], rtol=1e-12), name
+
+
+def test_compute_trend_statistics(results: Results) -> None:
+    metadata = results.metadata
+    trends = read_trends_data(results.results_folder, metadata, None, 10, 50)
+    statistics = compute_trend_statistics(
+        results.results_folder, metadata, None, 10, 50, STATS, chunk_size=7
+    )
+    assert statistics.keys() == trends.keys()
+    for trend_key, trend_statistics in statistics.items():
+        expected = _numpy_statistics(trends[trend_key])
+        for name, value in trend_statistics.items():
+            assert isinstance(value, float)
+            assert np.isclose(value, expected[name], rtol=1e-12), name
+
+    # Empty window.
+    statistics = compute_trend_statistics(
+        results.results_folder, metadata, None, 10, 10, ["count", "mean", "p50"]
+    )
+    for trend_statistics in statistics.values():
+        assert trend_statistics["count"] == 0
+        assert np.isnan(trend_statistics["mean"])
+        assert np.isnan(trend_statistics["p50"])
+
+    with pytest.raises(ValueError, match="Invalid statistic"):
+        compute_trend_statistics(results.results_folder, metadata, stats=["median"])
+    with pytest.raises(ValueError, match="Invalid statistic"):
+        compute_trend_statistics(results.results_folder, metadata, stats=["p101"])
+
+
+def test_statistics_accumulator_percentiles() -> None:
+    rng = np.random.default_rng(0)
+    values = np.stack(
+        [rng.normal(size=20000), rng.exponential(size=20000), np.arange(20000.0)],
+        axis=1,
+    )
+    accumulator = _StatisticsAccumulator(["mean", "std", "p1", "p50", "p99.9"], 100)
+    for chunk in np.array_split(values, 97):
+        accumulator.add(chunk)
+    statistics = accumulator.result((3,))
+
+    assert np.allclose(statistics["mean"], values.mean(axis=0))
+    assert np.allclose(statistics["std"], values.std(axis=0))
+    for name, percentile in (("p1", 1), ("p50", 50), ("p99.9", 99.9)):
+        # The percentiles are approximated, check the rank error of the estimate.
+        estimated_ranks = (values < statistics[name]).mean(axis=0) * 100
+        assert np.all(np.abs(estimated_ranks - percentile) < 0.5), name
+
+    # Extreme percentiles of a heavy tailed distribution.
+    values = rng.lognormal(size=(1_000_000, 1))
+    accumulator = _StatisticsAccumulator(["p0.1", "p50", "p99", "p99.9", "p99.99"], 200)
+    for chunk in np.array_split(values, 16):
+        accumulator.add(chunk)
+    statistics = accumulator.result((1,))
+    for name, percentile, tolerance in (
+        ("p0.1", 0.1, 0.01),
+        ("p50", 50, 0.01),
+        ("p99", 99, 0.01),
+        ("p99.9", 99.9, 0.01),
+        ("p99.99", 99.99, 0.02),
+    ):
+        expected = np.percentile(values, percentile, axis=0)
+        assert np.allclose(statistics[name], expected, rtol=tolerance), name
+
+    # NaN values propagate.
+    accumulator = _StatisticsAccumulator(["mean", "p50"], 100)
+    accumulator.add(np.array([[1.0, np.nan], [2.0, 3.0]]))
+    statistics = accumulator.result((2,))
+    assert np.array_equal(statistics["mean"], [1.5, np.nan], equal_nan=True)
+    assert np.array_equal(statistics["p50"], [1.5, np.nan], equal_nan=True)
+
+    with pytest.raises(ValueError, match="Can not accumulate"):
+        accumulator.add(np.zeros((2, 3)))